@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark de carga de sprites desde PNG individuales y desde el atlas.
+
+Simula mostrar un equipo completo (6 sprites) y una cuadrícula con todas las
+especies: decodificando cada PNG de la caché en disco frente a abrir el atlas
+proyectado en memoria y copiar el rectángulo de cada sprite.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_atlas.py
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from atlas import SpriteAtlas, build_atlas
+from sprite_store import SpriteStore
+from fake_pokeapi import make_png
+
+SPECIES = 1025
+
+def decode_pngs(store: SpriteStore, urls) -> list:
+    pixmaps = []
+    for url in urls:
+        image = QImage()
+        image.loadFromData(store.get(url))
+        pixmaps.append(QPixmap.fromImage(image))
+    return pixmaps
+
+def from_atlas(path: Path, urls) -> list:
+    atlas = SpriteAtlas(path)
+    pixmaps = [atlas.pixmap(url) for url in urls]
+    atlas.close()
+    return pixmaps
+
+def measure(func, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        store = SpriteStore(directory, max_size=1 << 32)
+        urls = [f"https://example.com/{i}.png" for i in range(1, SPECIES + 1)]
+        for i, url in enumerate(urls):
+            store.put(url, make_png(96, 96, (i % 256, i // 256, 128, 255)))
+        path = directory / "sprites.atlas"
+        start = time.perf_counter()
+        build_atlas(store, path)
+        print(f"Atlas de {SPECIES} sprites creado en {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"({path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+        for label, subset in (("equipo (6)", urls[:6]), (f"cuadrícula ({SPECIES})", urls)):
+            png = measure(decode_pngs, store, subset)
+            atlas = measure(from_atlas, path, subset)
+            print(f"{label:<20} PNG: {png * 1000:8.2f} ms   atlas: {atlas * 1000:8.2f} ms   "
+                  f"x{png / atlas:.1f}")
+        store.close()
+    del app
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark de desplazamiento por la cuadrícula de especies.
+
+Recorre la cuadrícula con todas las especies de arriba abajo, repintando la
+vista en cada paso, y mide el tiempo de cada fotograma frente al presupuesto de
+60 fps (16.7 ms). Con `instant` los sprites ya están en memoria (atlas
+cargado); sin él las cargas quedan pendientes y se mide el coste de pedirlas y
+cancelarlas.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_grid.py
+"""
+
+import sys
+import time
+import statistics
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from PyQt5.QtWidgets import QApplication
+
+from list_model import PokemonListModel
+from species_grid import SpeciesGridView, SpeciesThumbnailModel
+from fake_assets import FakeAssetManager
+
+SPECIES = 1025
+STEP = 40  # Píxeles por fotograma, un desplazamiento rápido con la rueda
+FRAME_BUDGET_MS = 1000 / 60
+
+def scroll_frames(instant: bool):
+    assets = FakeAssetManager(instant=instant)
+    source = PokemonListModel()
+    source.set_entries([
+        {"name": f"species-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+        for i in range(1, SPECIES + 1)
+    ])
+    model = SpeciesThumbnailModel(assets, lambda species_id: f"https://example.com/{species_id}.png")
+    model.setSourceModel(source)
+    view = SpeciesGridView()
+    view.setModel(model)
+    view.resize(480, 360)
+    view.show()
+    QApplication.processEvents()
+
+    scroll_bar = view.verticalScrollBar()
+    frames = []
+    for value in range(0, scroll_bar.maximum() + STEP, STEP):
+        start = time.perf_counter()
+        scroll_bar.setValue(value)
+        view.viewport().repaint()
+        view.update_visible_rows()
+        frames.append((time.perf_counter() - start) * 1000)
+    view.close()
+    return frames, assets, model
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    for label, instant in (("sprites en memoria", True), ("cargas pendientes", False)):
+        frames, assets, model = scroll_frames(instant)
+        frames.sort()
+        p95 = frames[int(len(frames) * 0.95) - 1]
+        print(f"{label:<20} {len(frames)} fotogramas   media: {statistics.mean(frames):6.2f} ms   "
+              f"p95: {p95:6.2f} ms   máx: {frames[-1]:6.2f} ms   "
+              f"({'OK' if p95 <= FRAME_BUDGET_MS else 'supera'} {FRAME_BUDGET_MS:.1f} ms)")
+        if not instant:
+            requested = {url for url, _ in assets.requests}
+            print(f"{'':<20} {len(requested)} sprites pedidos, {model.cancelled} cancelados, "
+                  f"{len(assets.pending)} pendientes al final")
+    del app
+
+if __name__ == "__main__":
+    main()
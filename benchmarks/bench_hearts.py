@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark de HeartCounter con totales de corazones grandes.
+
+Compara la tira pintada actual (un único widget que solo repinta las celdas
+que cambian) con la implementación anterior, que creaba un QLabel por corazón
+y reasignaba el pixmap de todos ellos en cada cambio del contador.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_hearts.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel
+
+from widgets import HeartCounter
+
+class LegacyHeartCounter(HeartCounter):
+    """HeartCounter con la implementación anterior (un QLabel por corazón)."""
+    def __init__(self, total_hearts: int = 20, parent=None):
+        super().__init__(total_hearts, parent)
+        self.hearts_widget = QWidget(self.scroll_area)
+        self.hearts_layout = QHBoxLayout(self.hearts_widget)
+        self.hearts_layout.setSpacing(1)
+        self.hearts_layout.setContentsMargins(0, 0, 0, 0)
+        self.scroll_area.setWidget(self.hearts_widget)
+        self.heart_labels = []
+        for _ in range(self.max_hearts):
+            label = QLabel(self)
+            label.setFixedSize(self.heart_size)
+            label.setPixmap(self.heart_full)
+            self.hearts_layout.addWidget(label)
+            self.heart_labels.append(label)
+
+    def set_count(self, count: int):
+        self.count = max(0, min(count, self.max_hearts))
+        for i, label in enumerate(self.heart_labels):
+            label.setPixmap(self.heart_full if i < self.count else self.heart_empty)
+        self.number_label.setText(str(self.count))
+
+def measure(counter_class, total: int, clicks: int = 50):
+    """Devuelve (ms de construcción, ms por clic de +/- con repintado)."""
+    app = QApplication.instance()
+    start = time.perf_counter()
+    counter = counter_class(total_hearts=total)
+    counter.resize(800, 40)
+    counter.show()
+    app.processEvents()
+    built = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for i in range(clicks):
+        if i % 2:
+            counter.increase_hearts()
+        else:
+            counter.decrease_hearts()
+        app.processEvents()
+    per_click = (time.perf_counter() - start) * 1000 / clicks
+    counter.close()
+    counter.deleteLater()
+    app.processEvents()
+    return built, per_click
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'corazones':>10} {'anterior (crear / clic)':>28} {'actual (crear / clic)':>28}")
+    for total in (20, 500, 2000, 50000):
+        if total <= 2000:
+            legacy = "{:9.2f} ms / {:8.3f} ms".format(*measure(LegacyHeartCounter, total))
+        else:
+            legacy = "(omitido)"
+        current = "{:9.2f} ms / {:8.3f} ms".format(*measure(HeartCounter, total))
+        print(f"{total:>10} {legacy:>28} {current:>28}")
+
+if __name__ == "__main__":
+    main()
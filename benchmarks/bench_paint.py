@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark del pintado de PokemonWidget mientras se arrastra entre slots.
+
+Compara el pintado actual (sprite pre-escalado y copiado 1:1) con el anterior,
+que reescalaba el sprite completo en cada paintEvent.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_paint.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPixmap, QPainter, QColor
+from PyQt5.QtWidgets import QFrame
+
+from gui import PokemonWidget
+from models import Pokemon
+
+class LegacyPokemonWidget(PokemonWidget):
+    """PokemonWidget con el pintado anterior (reescalado en cada paintEvent)."""
+    def paintEvent(self, event):
+        QFrame.paintEvent(self, event)
+        if self.pokemon and self.sprite:
+            painter = QPainter(self)
+            if self.is_drop_target:
+                painter.fillRect(self.rect(), QColor(200, 255, 200, 50))
+            widget_rect = self.rect().adjusted(10, 10, -10, -30)
+            scaled_size = self.sprite.rect().size()
+            scaled_size.scale(widget_rect.size(), Qt.KeepAspectRatio)
+            x = widget_rect.x() + (widget_rect.width() - scaled_size.width()) / 2
+            y = widget_rect.y() + (widget_rect.height() - scaled_size.height()) / 2
+            target_rect = QRect(int(x), int(y), scaled_size.width(), scaled_size.height())
+            painter.drawPixmap(target_rect, self.sprite)
+            if self.pokemon.nickname:
+                painter.drawText(self.rect().adjusted(10, -25, -10, -5),
+                                 Qt.AlignBottom | Qt.AlignHCenter, self.pokemon.nickname)
+
+def simulate_drag(widget_class, frames: int = 600, slots: int = 6) -> float:
+    """Pinta los slots alternando el resaltado de destino; devuelve ms por pintado."""
+    sprite = QPixmap(96, 96)
+    sprite.fill(QColor(200, 50, 50))
+    widgets = []
+    for i in range(slots):
+        widget = widget_class()
+        widget.resize(220, 260)
+        widget.set_pokemon(Pokemon(id=i + 1, name=f"Pokemon{i}", nickname="Apodo",
+                                   sprite_url=f"sprite-{i}.png"), sprite)
+        widgets.append(widget)
+
+    target = QPixmap(220, 260)
+    start = time.perf_counter()
+    for frame in range(frames):
+        # El cursor recorre los slots: el slot actual se resalta y el anterior se limpia
+        current = widgets[frame % slots]
+        previous = widgets[(frame - 1) % slots]
+        previous.is_drop_target = False
+        current.is_drop_target = True
+        previous.render(target)
+        current.render(target)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / (frames * 2)
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    legacy = simulate_drag(LegacyPokemonWidget)
+    current = simulate_drag(PokemonWidget)
+    print(f"Pintado anterior (reescalado por evento): {legacy:.3f} ms/pintado")
+    print(f"Pintado actual (sprite pre-escalado):     {current:.3f} ms/pintado")
+    print(f"Mejora: {legacy / current:.2f}x")
+
+if __name__ == "__main__":
+    main()
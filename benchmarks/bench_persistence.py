@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark de guardado y carga de equipos con plantillas grandes.
+
+Compara el guardado anterior (yaml.dump / yaml.safe_load en Python puro y
+escritura directa) con la capa de `storage` (escritura atómica con fsync y
+libyaml en C si está disponible) en YAML y en JSON compacto.
+
+Uso: python benchmarks/bench_persistence.py
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import yaml
+
+import storage
+from models import Pokemon
+
+def make_roster(size: int) -> dict:
+    """Crea los datos de guardado de una plantilla de `size` Pokemon."""
+    pokemon = [
+        Pokemon(id=i, name=f"Pokemon{i}", nickname=f"Apodo{i}",
+                sprite_url=f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{i}.png").to_dict()
+        for i in range(1, size + 1)
+    ]
+    return {"pokemon": pokemon, "hearts": {"total": 20, "current": 20}}
+
+def legacy_save(path: Path, data: dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.dump(data, f, allow_unicode=True)
+
+def legacy_load(path: Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+def measure(save, load, path: Path, data: dict, repeat: int):
+    """Devuelve (ms por guardado, ms por carga)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        save(path, data)
+    saved = (time.perf_counter() - start) * 1000 / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        load(path)
+    loaded = (time.perf_counter() - start) * 1000 / repeat
+    return saved, loaded
+
+def main():
+    print(f"libyaml disponible: {yaml.__with_libyaml__}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for size in (6, 1000, 10000):
+            data = make_roster(size)
+            repeat = 20 if size <= 1000 else 3
+            results = [
+                ("anterior (yaml puro)", measure(legacy_save, legacy_load, tmp_dir / "legacy.yaml", data, repeat)),
+                ("storage YAML", measure(storage.save, storage.load, tmp_dir / "team.yaml", data, repeat)),
+                ("storage JSON", measure(storage.save, storage.load, tmp_dir / "team.json", data, repeat)),
+            ]
+            print(f"\n{size} Pokemon")
+            for name, (saved, loaded) in results:
+                print(f"  {name:<22} guardar {saved:9.2f} ms   cargar {loaded:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
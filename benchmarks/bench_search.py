@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark de la búsqueda incremental sobre la lista completa de especies.
+
+Mide la construcción del índice y el tiempo por pulsación (índice + filtrado
+del modelo proxy) al escribir consultas de prefijo, subcadena y con erratas.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_search.py
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PyQt5.QtWidgets import QApplication
+
+from list_model import PokemonListModel
+from search import NameSearchIndex, SearchFilterProxyModel
+
+SYLLABLES = ["pi", "ka", "chu", "char", "man", "der", "bul", "ba", "saur", "squir", "tle",
+             "eev", "ee", "gar", "do", "mew", "two", "ra", "ich", "zard", "mon", "lax", "ny"]
+
+def make_names(count: int = 1302, seed: int = 7):
+    """Genera una lista reproducible de nombres con el tamaño de la Pokédex."""
+    rng = random.Random(seed)
+    names = {"pikachu", "charizard", "bulbasaur", "squirtle", "mewtwo", "mr-mime"}
+    while len(names) < count:
+        names.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(names)
+
+def type_query(proxy, query: str):
+    """Simula escribir la consulta letra a letra; devuelve ms por pulsación."""
+    timings = []
+    for i in range(1, len(query) + 1):
+        start = time.perf_counter()
+        proxy.set_query(query[:i])
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    names = make_names()
+
+    start = time.perf_counter()
+    NameSearchIndex(names)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    index = NameSearchIndex(names)
+    lookups = 0
+    start = time.perf_counter()
+    for query in ("pika", "saur", "chu", "charzard", "m"):
+        for i in range(1, len(query) + 1):
+            index.search(query[:i])
+            lookups += 1
+    index_ms = (time.perf_counter() - start) * 1000 / lookups
+
+    source = PokemonListModel()
+    proxy = SearchFilterProxyModel()
+    proxy.setSourceModel(source)
+    source.set_entries([{"name": name, "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                        for i, name in enumerate(names, start=1)])
+
+    print(f"Especies: {len(names)}")
+    print(f"Construcción del índice: {build_ms:.2f} ms")
+    print(f"Búsqueda en el índice: {index_ms:.3f} ms/pulsación")
+    for query in ("pikachu", "saur", "charzard"):
+        timings = type_query(proxy, query)
+        proxy.set_query("")
+        print(f"Proxy '{query}': media {sum(timings) / len(timings):.3f} ms, "
+              f"máximo {max(timings):.3f} ms por pulsación")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Suite de benchmarks sin interfaz para detectar regresiones de rendimiento entre versiones.
+
+Mide las rutas calientes de la aplicación con las mismas piezas que la GUI:
+
+- `team.*`: guardado y carga de un equipo completo (YAML y JSON).
+- `api.*`: consultas de `PokeAPIClient` en frío (red) y en caliente (memoria y
+  caché persistente) contra la PokeAPI falsa de `tests/fake_pokeapi.py`.
+- `assets.*`: aciertos de `AssetManager` en memoria, en disco y en el atlas.
+- `hearts.*`: `HeartCounter.set_count` con totales de corazones grandes.
+- `paint.*`: `PokemonWidget.paintEvent` de un slot con sprite.
+
+Cada caso se repite `--rounds` veces y se guardan mínimo, mediana, media, p95 y
+desviación en milisegundos por llamada. Con `--output` el resultado se escribe
+en JSON; con `--compare` se compara la mediana (u otro estadístico con
+`--stat`) con la de otra ejecución y con `--thresholds` (por defecto
+`benchmarks/thresholds.json`) con un máximo absoluto. El proceso termina con
+código 1 si algún caso empeora más de `--tolerance` o supera su máximo.
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py --output resultados.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py --compare base.json --tolerance 0.25
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from models import Pokemon, Team
+from settings import Settings
+from pokeapi import PokeAPIClient
+from http_client import HttpClient
+from assets import AssetManager
+from widgets import HeartCounter
+from gui import PokemonWidget
+from fake_pokeapi import FakePokeAPI, make_png
+
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "thresholds.json"
+
+@dataclass
+class Case:
+    """Caso de la suite: `setup(ctx)` prepara el estado y devuelve la función a medir."""
+    name: str
+    setup: Callable[['Context'], Callable[[], None]]
+    number: int = 1  # Llamadas por ronda (para operaciones de microsegundos)
+
+CASES: List[Case] = []
+
+def case(name: str, number: int = 1):
+    """Registra una función de preparación como caso de la suite."""
+    def register(setup):
+        CASES.append(Case(name, setup, number))
+        return setup
+    return register
+
+class Context:
+    """Estado compartido por los casos: directorio temporal, servidor falso y configuración."""
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        self.server = FakePokeAPI(species_count=100000).start()
+        self._cleanups: List[Callable[[], None]] = []
+
+    def settings(self, name: str, **sprites) -> Settings:
+        """Configuración que solo escribe en el directorio temporal del caso."""
+        settings = Settings()
+        settings.api.base_url = self.server.base_url
+        settings.api.cache_file = str(self.directory / name / "api_cache.sqlite")
+        settings.sprites.cache_dir = str(self.directory / name / "sprites")
+        for key, value in sprites.items():
+            setattr(settings.sprites, key, value)
+        return settings
+
+    def api_client(self, name: str) -> PokeAPIClient:
+        """Cliente nuevo (como en un nuevo arranque) contra el servidor falso."""
+        PokeAPIClient._instance = None
+        HttpClient._instance = None
+        client = PokeAPIClient(self.settings(name))
+        client.http._sleep = lambda delay: None
+        self.on_cleanup(client.response_cache.close)
+        return client
+
+    def on_cleanup(self, callback: Callable[[], None]):
+        self._cleanups.append(callback)
+
+    def cleanup(self):
+        for callback in reversed(self._cleanups):
+            callback()
+        self._cleanups.clear()
+
+    def close(self):
+        self.cleanup()
+        PokeAPIClient._instance = None
+        HttpClient._instance = None
+        self.server.stop()
+        self._tmp.cleanup()
+
+def full_team() -> Team:
+    team = Team()
+    for i in range(1, team.max_size + 1):
+        team.add_pokemon(Pokemon(id=i, name=f"Pokemon{i}", nickname=f"Apodo{i}",
+                                 sprite_url=f"https://example.com/sprites/{i}.png"))
+    return team
+
+# --- Equipo ---
+
+@case("team.save_yaml")
+def bench_team_save_yaml(ctx: Context):
+    team, path = full_team(), ctx.directory / "team.yaml"
+    return lambda: team.save_to_file(str(path))
+
+@case("team.load_yaml")
+def bench_team_load_yaml(ctx: Context):
+    path = ctx.directory / "team.yaml"
+    full_team().save_to_file(str(path))
+    return lambda: Team.load_from_file(str(path))
+
+@case("team.save_json")
+def bench_team_save_json(ctx: Context):
+    team, path = full_team(), ctx.directory / "team.json"
+    return lambda: team.save_to_file(str(path))
+
+@case("team.load_json")
+def bench_team_load_json(ctx: Context):
+    path = ctx.directory / "team.json"
+    full_team().save_to_file(str(path))
+    return lambda: Team.load_from_file(str(path))
+
+# --- Cliente de la API ---
+
+@case("api.species_cold")
+def bench_api_species_cold(ctx: Context):
+    client = ctx.api_client("api_cold")
+    ids = count(1)
+    return lambda: client.get_species(next(ids))  # Cada llamada es una especie nueva
+
+@case("api.species_warm_memory", number=1000)
+def bench_api_species_warm_memory(ctx: Context):
+    client = ctx.api_client("api_memory")
+    client.get_species(25)
+    return lambda: client.get_species(25)
+
+@case("api.species_warm_disk")
+def bench_api_species_warm_disk(ctx: Context):
+    client = ctx.api_client("api_disk")
+    client.get_species(25)
+
+    def lookup():
+        client.species.clear()  # Solo queda la caché persistente
+        client.get_species(25)
+    return lookup
+
+@case("api.list_cold")
+def bench_api_list_cold(ctx: Context):
+    client = ctx.api_client("api_list")
+    ctx.server.species_count = 1000
+    ctx.on_cleanup(lambda: setattr(ctx.server, "species_count", 100000))
+
+    def fetch():
+        client._cache.clear()
+        client.response_cache.clear()
+        client.get_pokemon_list()
+    return fetch
+
+@case("api.list_warm_start")
+def bench_api_list_warm_start(ctx: Context):
+    client = ctx.api_client("api_list_warm")
+    ctx.server.species_count = 1000
+    ctx.on_cleanup(lambda: setattr(ctx.server, "species_count", 100000))
+    client.get_pokemon_list()
+
+    def fetch():
+        client._cache.clear()  # Como tras reiniciar: solo la caché persistente
+        client.get_pokemon_list()
+    return fetch
+
+# --- Sprites ---
+
+SPRITE_URLS = [f"https://example.com/sprites/{i}.png" for i in range(1, 51)]
+
+def sprite_manager(ctx: Context, name: str, **sprites) -> AssetManager:
+    manager = AssetManager(ctx.settings(name, **sprites))
+    for i, url in enumerate(SPRITE_URLS):
+        manager.disk_cache.put(url, make_png(96, 96, (i, 0, 0, 255)))
+    ctx.on_cleanup(manager.disk_cache.close)
+    return manager
+
+@case("assets.memory_hit", number=1000)
+def bench_assets_memory_hit(ctx: Context):
+    manager = sprite_manager(ctx, "assets_memory")
+    for url in SPRITE_URLS:
+        manager.get_sprite(url)
+    urls = iter(SPRITE_URLS * 10**6)
+    return lambda: manager.get_sprite_async(next(urls))
+
+@case("assets.disk_hit", number=10)
+def bench_assets_disk_hit(ctx: Context):
+    # Sin presupuesto en memoria cada llamada lee y decodifica el PNG
+    manager = sprite_manager(ctx, "assets_disk", memory_budget=0)
+    urls = iter(SPRITE_URLS * 10**6)
+    return lambda: manager.get_sprite(next(urls))
+
+@case("assets.atlas_hit", number=10)
+def bench_assets_atlas_hit(ctx: Context):
+    manager = sprite_manager(ctx, "assets_atlas", memory_budget=0)
+    manager.build_atlas(page_size=1024)
+    ctx.on_cleanup(lambda: manager.atlas and manager.atlas.close())
+    urls = iter(SPRITE_URLS * 10**6)
+    return lambda: manager.get_sprite(next(urls))
+
+# --- Widgets ---
+
+def hearts_case(total: int):
+    def setup(ctx: Context):
+        counter = HeartCounter(total_hearts=total)
+        counter.resize(800, 40)
+        counter.show()
+        QApplication.processEvents()
+        ctx.on_cleanup(counter.close)
+        values = iter([total // 2, total // 2 + 1] * 10**6)
+
+        def set_count():
+            counter.set_count(next(values))
+            counter.heart_strip.repaint()
+        return set_count
+    return setup
+
+case("hearts.set_count_2000")(hearts_case(2000))
+case("hearts.set_count_50000")(hearts_case(50000))
+
+@case("paint.pokemon_widget", number=10)
+def bench_paint_pokemon_widget(ctx: Context):
+    widget = PokemonWidget()
+    widget.resize(200, 200)
+    sprite = QPixmap(96, 96)
+    sprite.loadFromData(make_png(96, 96))
+    widget.set_pokemon(Pokemon(id=1, name="Bulbasaur", sprite_url=SPRITE_URLS[0]), sprite)
+    widget.show()
+    QApplication.processEvents()
+    ctx.on_cleanup(widget.close)
+
+    def paint():
+        widget.is_drop_target = not widget.is_drop_target
+        widget.repaint()
+    return paint
+
+# --- Ejecución ---
+
+def measure(func: Callable[[], None], rounds: int, number: int) -> Dict[str, float]:
+    """Estadísticas en ms por llamada tras una ronda de calentamiento."""
+    func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    samples.sort()
+    return {
+        "rounds": rounds,
+        "number": number,
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "p95": samples[max(0, int(round(len(samples) * 0.95)) - 1)],
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(rounds: int, selected: Optional[str] = None) -> dict:
+    """Ejecuta los casos (los que contienen `selected`) y devuelve el informe."""
+    app = QApplication.instance() or QApplication([])
+    ctx = Context()
+    results = {}
+    try:
+        for bench in CASES:
+            if selected and selected not in bench.name:
+                continue
+            func = bench.setup(ctx)
+            results[bench.name] = measure(func, rounds, bench.number)
+            ctx.cleanup()
+            QApplication.processEvents()
+            print(f"{bench.name:<28} mediana {results[bench.name]['median']:9.3f} ms   "
+                  f"p95 {results[bench.name]['p95']:9.3f} ms", flush=True)
+    finally:
+        ctx.close()
+    del app
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "unit": "ms",
+        },
+        "results": results,
+    }
+
+def check_thresholds(results: dict, thresholds: Dict[str, float]) -> List[str]:
+    """Casos cuya mediana supera el máximo absoluto (en ms) configurado."""
+    failures = []
+    for name, limit in thresholds.items():
+        if name in results and results[name]["median"] > limit:
+            failures.append(f"{name}: mediana {results[name]['median']:.3f} ms > máximo {limit:.3f} ms")
+    return failures
+
+def compare(results: dict, baseline: dict, tolerance: float, stat: str = "median") -> List[str]:
+    """Imprime la comparación con otra ejecución y devuelve las regresiones."""
+    regressions = []
+    print(f"\n{'caso (' + stat + ')':<28} {'base':>10} {'actual':>10} {'cambio':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        before, after = previous[stat], current[stat]
+        ratio = after / before if before > 0 else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESIÓN"
+            regressions.append(f"{name}: {before:.3f} ms -> {after:.3f} ms (+{(ratio - 1) * 100:.0f} %)")
+        print(f"{name:<28} {before:10.3f} {after:10.3f} {(ratio - 1) * 100:+7.0f}%{flag}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de Pokemon Team GUI")
+    parser.add_argument("--rounds", type=int, default=20, help="rondas por caso")
+    parser.add_argument("--filter", default=None, help="ejecutar solo los casos que contienen el texto")
+    parser.add_argument("--output", type=Path, default=None, help="guardar el resultado en JSON")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de otra ejecución con el que comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="empeoramiento admitido al comparar (0.25 = 25 %%)")
+    parser.add_argument("--stat", choices=("min", "median", "mean", "p95"), default="median",
+                        help="estadístico que se compara con --compare")
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS,
+                        help="JSON con la mediana máxima (ms) de cada caso")
+    parser.add_argument("--list", action="store_true", help="mostrar los casos disponibles")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in CASES:
+            print(bench.name)
+        return 0
+
+    report = run(max(2, args.rounds), args.filter)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nResultados guardados en {args.output}")
+
+    failures = []
+    if args.thresholds and args.thresholds.exists():
+        thresholds = json.loads(args.thresholds.read_text(encoding="utf-8"))
+        failures.extend(check_thresholds(report["results"], thresholds))
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        failures.extend(compare(report["results"], baseline["results"], args.tolerance, args.stat))
+
+    if failures:
+        print("\nCasos fuera de umbral:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+@dataclass
+class CacheEntry:
+    """Respuesta almacenada en la caché persistente."""
+    data: Any
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Indica si la entrada sigue vigente según el TTL (en segundos)."""
+        return (time.time() - self.fetched_at) < ttl
+
+class ResponseCache:
+    """Caché persistente de respuestas de la API sobre SQLite.
+
+    Cada entrada se indexa por la URL del endpoint y guarda el JSON comprimido,
+    la fecha de descarga, los validadores HTTP (ETag / Last-Modified) y la fecha
+    del último acceso, que se usa para desalojar por LRU al superar el tamaño máximo.
+    """
+
+    def __init__(self, path: str, max_size: int = 50 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Obtiene una entrada (vigente o caducada) y actualiza su último acceso."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        blob, etag, last_modified, fetched_at = row
+        try:
+            data = json.loads(zlib.decompress(blob).decode('utf-8'))
+        except (zlib.error, ValueError) as e:
+            self.logger.warning(f"Entrada de caché corrupta para {key}: {e}")
+            self.delete(key)
+            return None
+        return CacheEntry(data, fetched_at, etag, last_modified)
+
+    def put(self, key: str, data: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Guarda una respuesta y aplica el límite de tamaño."""
+        blob = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, data, size, etag, last_modified, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, blob, len(blob), etag, last_modified, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, key: str):
+        """Marca una entrada como recién validada (p. ej. tras un 304 Not Modified)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        """Elimina una entrada de la caché."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Vacía la caché por completo."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def total_size(self) -> int:
+        """Devuelve el tamaño total (comprimido) de las entradas en bytes."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone() is not None
+
+    def _evict(self):
+        """Desaloja las entradas menos usadas hasta respetar el tamaño máximo."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC, rowid ASC"
+        ).fetchall()
+        # Siempre se conserva la entrada más reciente aunque supere el límite por sí sola
+        for key, size in rows[:-1]:
+            if total <= self.max_size:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.logger.debug(f"Entrada de caché desalojada: {key}")
+
+    def close(self):
+        """Cierra la conexión con la base de datos."""
+        with self._lock:
+            self._conn.close()
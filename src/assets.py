@@ -2,27 +2,276 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import time
+import sqlite3
+import hashlib
 import logging
+import weakref
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import QObject, pyqtSignal
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Set, Tuple
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from settings import Settings, get_settings
+from sprite_store import SpriteStore
+from atlas import ATLAS_NAME, SpriteAtlas, build_atlas
+from metrics import get_registry
+
+if TYPE_CHECKING:
+    from http_client import HttpClient
+
+_metrics = get_registry()
+SPRITE_MEMORY_HITS = _metrics.counter("sprite_cache_hits_total", "Sprites servidos sin descargarlos", layer="memory")
+SPRITE_ATLAS_HITS = _metrics.counter("sprite_cache_hits_total", layer="atlas")
+SPRITE_DISK_HITS = _metrics.counter("sprite_cache_hits_total", layer="disk")
+SPRITE_DOWNLOADS = _metrics.counter("sprite_downloads_total", "Sprites descargados")
+SPRITE_DOWNLOAD_BYTES = _metrics.counter("sprite_download_bytes_total", "Bytes de sprites descargados")
+SPRITE_ERRORS = _metrics.counter("sprite_errors_total", "Sprites que no se pudieron cargar")
+SPRITE_DOWNLOAD_LATENCY = _metrics.histogram("sprite_download_seconds", "Duración de las descargas de sprites")
+SPRITE_DECODE_TIME = _metrics.histogram("sprite_decode_seconds", "Tiempo de decodificación de sprites")
+
+def _weak_reader(manager: 'AssetManager', read: Callable[['AssetManager'], float]) -> Callable[[], float]:
+    """Función para un medidor que lee `manager` a través de una referencia débil (0 si ya no existe)."""
+    ref = weakref.ref(manager)
+
+    def value() -> float:
+        target = ref()
+        return read(target) if target is not None else 0
+    return value
+
+class SpriteCache:
+    """Caché LRU de sprites decodificados con un presupuesto de memoria en bytes.
+
+    El coste de cada sprite se calcula como ancho × alto × profundidad. Los
+    sprites fijados (los que se muestran en el equipo) nunca se desalojan.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[QPixmap, int]]" = OrderedDict()
+        self._pinned: Set[str] = set()
+
+    @staticmethod
+    def pixmap_bytes(pixmap: QPixmap) -> int:
+        """Calcula la memoria que ocupa un pixmap decodificado."""
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+    def get(self, url: str) -> Optional[QPixmap]:
+        """Obtiene un sprite y lo marca como usado recientemente."""
+        entry = self._entries.get(url)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(url)
+        return entry[0]
+
+    def put(self, url: str, pixmap: QPixmap):
+        """Guarda un sprite y desaloja los menos usados si se supera el presupuesto."""
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+        size = self.pixmap_bytes(pixmap)
+        self._entries[url] = (pixmap, size)
+        self.current_bytes += size
+        self._evict()
+
+    def set_pinned(self, urls: Iterable[str]):
+        """Establece los sprites que no se pueden desalojar."""
+        self._pinned = {url for url in urls if url}
+        self._evict()
+
+    def is_pinned(self, url: str) -> bool:
+        return url in self._pinned
+
+    def set_max_bytes(self, max_bytes: int):
+        """Cambia el presupuesto de memoria desalojando lo que sobre."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        """Desaloja sprites no fijados, del menos al más reciente, hasta respetar el presupuesto."""
+        if self.current_bytes <= self.max_bytes:
+            return
+        for url in list(self._entries):
+            if self.current_bytes <= self.max_bytes:
+                break
+            if url in self._pinned:
+                continue
+            _, size = self._entries.pop(url)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Vacía la caché (las estadísticas se conservan)."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve las estadísticas de uso de la caché."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "pinned": len(self._pinned),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SpriteLoaderSignals(QObject):
+    """Señales de SpriteLoader; se entregan en el hilo de la GUI."""
+    loaded = pyqtSignal(str, QImage)
+    failed = pyqtSignal(str)
+
+class SpriteLoader(QRunnable):
+    """Carga un sprite (desde disco o red) y lo decodifica fuera del hilo de la GUI.
+
+    El pool borra el objeto C++ en cuanto `run` termina, antes de que lleguen
+    sus señales, así que solo se puede retirar de la cola con `try_take`.
+    """
+    def __init__(self, manager: 'AssetManager', url: str, priority: int = 0):
+        super().__init__()
+        self.manager = manager
+        self.url = url
+        self.priority = priority
+        self.signals = SpriteLoaderSignals()
+        self.started = False
+        self._lock = threading.Lock()
+
+    def try_take(self, pool: QThreadPool) -> bool:
+        """Retira la carga de la cola si aún no ha empezado.
+
+        El lock impide que `run` empiece (y el pool borre el objeto) entre la
+        comprobación y `tryTake`.
+        """
+        with self._lock:
+            return not self.started and pool.tryTake(self)
+
+    def run(self):
+        """Decodifica el sprite a QImage, que a diferencia de QPixmap es seguro entre hilos."""
+        with self._lock:
+            self.started = True
+        try:
+            image = self.manager._load_sprite_image(self.url)
+        except Exception as e:
+            self.manager.logger.error(f"Error al cargar sprite desde {self.url}: {e}")
+            image = None
+        if image is None:
+            SPRITE_ERRORS.inc()
+            self.signals.failed.emit(self.url)
+        else:
+            self.signals.loaded.emit(self.url, image)
 
 class AssetManager(QObject):
     """Gestor de assets para la aplicación."""
     sprite_loaded = pyqtSignal(str, QPixmap)  # Señal emitida cuando se carga un sprite
+    sprite_failed = pyqtSignal(str)  # Señal emitida cuando un sprite no se puede cargar
 
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         super().__init__()
         self.logger = logging.getLogger(__name__)
-        self._cache: Dict[str, QPixmap] = {}
-        self._setup_directories()
+        self._http: Optional['HttpClient'] = None
+        self._http_lock = threading.Lock()
+        self._cache = SpriteCache(0)
+        self._pending: Dict[str, SpriteLoader] = {}
+        self._placeholder: Optional[QPixmap] = None
+        self._pool = QThreadPool(self)
+        self._store: Optional[SpriteStore] = None
+        self._atlas: Optional[SpriteAtlas] = None
+        self.apply_settings(settings or get_settings())
+        # Los medidores leen el último gestor creado sin mantenerlo vivo
+        _metrics.gauge("sprite_memory_bytes", "Bytes de sprites decodificados en memoria",
+                       function=_weak_reader(self, lambda manager: manager._cache.current_bytes))
+        _metrics.gauge("sprite_disk_bytes", "Bytes de sprites en la caché en disco",
+                       function=_weak_reader(self, AssetManager._disk_bytes))
+
+    @property
+    def http(self) -> 'HttpClient':
+        """Cliente HTTP compartido; `requests` se importa con la primera descarga."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    from http_client import HttpClient
+                    self._http = HttpClient(self.settings)
+        return self._http
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directorio de la caché de sprites en disco."""
+        return self._store.directory
+
+    @cache_dir.setter
+    def cache_dir(self, directory: Path):
+        directory = Path(directory)
+        if self._store is not None:
+            if self._store.directory == directory:
+                return
+            self._store.close()
+        self._store = SpriteStore(directory, self.disk_cache_size)
+        self._open_atlas()
+
+    @property
+    def disk_cache(self) -> SpriteStore:
+        """Caché de sprites en disco."""
+        return self._store
+
+    @property
+    def atlas(self) -> Optional[SpriteAtlas]:
+        """Atlas de sprites del directorio de caché, si se ha creado."""
+        return self._atlas
+
+    def _open_atlas(self):
+        """Abre (o vuelve a abrir) el atlas del directorio de caché."""
+        if self._atlas is not None:
+            self._atlas.close()
+        self._atlas = SpriteAtlas.open(self.cache_dir / ATLAS_NAME)
+        if self._atlas is not None:
+            self.logger.info(f"Atlas de sprites cargado: {len(self._atlas)} sprites en {self._atlas.page_count} páginas")
+
+    def build_atlas(self, page_size: int = 1024) -> int:
+        """Empaqueta la caché en disco en un atlas y lo carga; devuelve cuántos sprites incluye."""
+        if self._atlas is not None:
+            self._atlas.close()
+            self._atlas = None
+        count = build_atlas(self._store, self.cache_dir / ATLAS_NAME, page_size)
+        self._open_atlas()
+        return count
+
+    def _atlas_pixmap(self, url: str) -> Optional[QPixmap]:
+        """Toma el sprite del atlas (sin decodificar) y lo guarda en la caché en memoria."""
+        if self._atlas is None or url not in self._atlas:
+            return None
+        pixmap = self._atlas.pixmap(url)
+        self._cache.put(url, pixmap)
+        SPRITE_ATLAS_HITS.inc()
+        return pixmap
 
-    def _setup_directories(self):
-        """Configura los directorios necesarios para los assets."""
-        self.cache_dir = Path("assets/cache")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    def apply_settings(self, settings: Settings):
+        """Aplica la configuración de sprites (descargas, memoria, disco, tamaño y directorio)."""
+        self.settings = settings
+        self.download_workers = max(1, settings.sprites.download_workers)
+        self.memory_budget = settings.sprites.memory_budget
+        self._pool.setMaxThreadCount(self.download_workers)
+        self._cache.set_max_bytes(self.memory_budget)
+        if getattr(self, 'sprite_size', None) != settings.sprites.size:
+            self.sprite_size = settings.sprites.size
+            self._placeholder = None
+        self.disk_cache_size = settings.sprites.disk_cache_size
+        self.cache_dir = Path(settings.sprites.cache_dir)
+        self._store.set_max_size(self.disk_cache_size)
 
     def get_sprite(self, url: str) -> Optional[QPixmap]:
         """Obtiene un sprite desde la URL o caché."""
@@ -30,50 +279,231 @@ class AssetManager(QObject):
             return None
 
         # Verificar caché en memoria
-        if url in self._cache:
-            return self._cache[url]
+        pixmap = self._cache.get(url)
+        if pixmap is not None:
+            SPRITE_MEMORY_HITS.inc()
+            return pixmap
 
-        # Verificar caché en disco
-        filename = self._get_cache_filename(url)
-        if filename.exists():
-            pixmap = QPixmap(str(filename))
-            if not pixmap.isNull():
-                self._cache[url] = pixmap
+        # Verificar el atlas y la caché en disco
+        pixmap = self._atlas_pixmap(url)
+        if pixmap is not None:
+            return pixmap
+        data = self._read_cached(url)
+        if data is not None:
+            pixmap = QPixmap()
+            with SPRITE_DECODE_TIME.time():
+                decoded = pixmap.loadFromData(data)
+            if decoded:
+                SPRITE_DISK_HITS.inc()
+                self._cache.put(url, pixmap)
                 return pixmap
+            self._store.delete(url)
 
         # Descargar y guardar en caché
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            # Guardar en disco
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+            response = self._download(url)
             
             # Cargar en memoria
             pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
+            with SPRITE_DECODE_TIME.time():
+                pixmap.loadFromData(response.content)
             
             if not pixmap.isNull():
-                self._cache[url] = pixmap
+                # Solo se guarda en disco lo que se decodifica bien
+                self._store.put(url, response.content)
+                self._cache.put(url, pixmap)
                 self.sprite_loaded.emit(url, pixmap)
                 return pixmap
+            self.logger.error(f"Datos de imagen no válidos en {url}")
             
         except Exception as e:
             self.logger.error(f"Error al cargar sprite desde {url}: {e}")
         
+        SPRITE_ERRORS.inc()
         return None
 
-    def _get_cache_filename(self, url: str) -> Path:
-        """Genera un nombre de archivo para el caché basado en la URL."""
-        import hashlib
+    def get_sprite_async(self, url: str, priority: int = 0) -> Optional[QPixmap]:
+        """Obtiene un sprite sin bloquear la interfaz.
+
+        Si el sprite está en memoria se devuelve directamente; si no, se devuelve
+        un marcador de posición y se encarga la carga al pool de descargas. Las
+        peticiones simultáneas de la misma URL comparten una única descarga y,
+        al terminar, se emite `sprite_loaded`. Las cargas con más `priority`
+        salen antes de la cola; pedir de nuevo con más prioridad una carga que
+        aún espera la adelanta.
+        """
+        if not url:
+            return None
+
+        pixmap = self._cache.get(url)
+        if pixmap is not None:
+            SPRITE_MEMORY_HITS.inc()
+            return pixmap
+        pixmap = self._atlas_pixmap(url)
+        if pixmap is not None:
+            return pixmap
+
+        loader = self._pending.get(url)
+        if loader is None:
+            loader = SpriteLoader(self, url, priority)
+            loader.signals.loaded.connect(self._on_sprite_image_loaded)
+            loader.signals.failed.connect(self._on_sprite_image_failed)
+            self._pending[url] = loader
+            self._pool.start(loader, priority)
+        elif priority > loader.priority and loader.try_take(self._pool):
+            loader.priority = priority
+            self._pool.start(loader, priority)
+
+        return self.get_placeholder()
+
+    def cancel(self, url: str) -> bool:
+        """Cancela la carga de un sprite que aún no ha empezado.
+
+        Las cargas en curso terminan igualmente y los sprites fijados (los del
+        equipo) no se cancelan. Devuelve True si se retiró de la cola.
+        """
+        loader = self._pending.get(url)
+        if loader is None or self._cache.is_pinned(url) or not loader.try_take(self._pool):
+            return False
+        del self._pending[url]
+        return True
+
+    def set_pinned(self, urls: Iterable[str]):
+        """Fija en memoria los sprites que se están mostrando para que no se desalojen."""
+        self._cache.set_pinned(urls)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Devuelve las estadísticas de la caché de sprites en memoria."""
+        return self._cache.stats()
+
+    def is_loading(self, url: str) -> bool:
+        """Indica si hay una carga en curso para la URL."""
+        return url in self._pending
+
+    def wait_for_downloads(self, msecs: int = -1) -> bool:
+        """Espera a que terminen las cargas en curso (las señales llegan con el bucle de eventos)."""
+        return self._pool.waitForDone(msecs)
+
+    def _load_sprite_image(self, url: str) -> Optional[QImage]:
+        """Carga un sprite como QImage desde el disco o la red (se ejecuta en el pool)."""
+        data = self._read_cached(url)
+        if data is not None:
+            image = QImage()
+            with SPRITE_DECODE_TIME.time():
+                decoded = image.loadFromData(data)
+            if decoded:
+                SPRITE_DISK_HITS.inc()
+                return image
+            self._store.delete(url)
+
+        response = self._download(url)
+
+        image = QImage()
+        with SPRITE_DECODE_TIME.time():
+            image.loadFromData(response.content)
+        if image.isNull():
+            self.logger.error(f"Datos de imagen no válidos en {url}")
+            return None
+
+        self._store.put(url, response.content)
+        return image
+
+    def _download(self, url: str):
+        """Descarga un sprite registrando su duración y tamaño en las métricas."""
+        start = time.perf_counter()
+        response = self.http.get(url)
+        SPRITE_DOWNLOAD_LATENCY.observe(time.perf_counter() - start)
+        response.raise_for_status()
+        SPRITE_DOWNLOADS.inc()
+        SPRITE_DOWNLOAD_BYTES.inc(len(response.content))
+        return response
+
+    def _read_cached(self, url: str) -> Optional[bytes]:
+        """Lee un sprite de la caché en disco, adoptando el archivo del formato antiguo si lo hay."""
+        data = self._store.get(url)
+        if data is not None:
+            return data
+        legacy = self._legacy_cache_filename(url)
+        try:
+            data = legacy.read_bytes()
+            legacy.unlink()
+        except OSError:
+            return None
+        image = QImage()
+        if not image.loadFromData(data):
+            self.logger.warning(f"Sprite antiguo dañado descartado: {legacy.name}")
+            return None
+        self._store.put(url, data)
+        return data
+
+    def prefetch_sprite(self, url: str) -> bool:
+        """Descarga un sprite a la caché en disco sin decodificarlo en memoria.
+
+        Devuelve True si se descargó y False si ya estaba en disco. Puede
+        llamarse desde cualquier hilo y sin QApplication.
+        """
+        if url in self._store or self._legacy_cache_filename(url).exists():
+            return False
+        if self._load_sprite_image(url) is None:
+            raise ValueError(f"Datos de imagen no válidos en {url}")
+        return True
+
+    def _on_sprite_image_loaded(self, url: str, image: QImage):
+        """Convierte la imagen decodificada en QPixmap en el hilo de la GUI."""
+        self._pending.pop(url, None)
+        pixmap = QPixmap.fromImage(image)
+        self._cache.put(url, pixmap)
+        self.sprite_loaded.emit(url, pixmap)
+
+    def _on_sprite_image_failed(self, url: str):
+        """Notifica que un sprite no se pudo cargar."""
+        self._pending.pop(url, None)
+        self.sprite_failed.emit(url)
+
+    def get_placeholder(self) -> QPixmap:
+        """Devuelve el marcador de posición que se muestra mientras carga un sprite."""
+        if self._placeholder is None:
+            size = self.get_sprite_size()
+            self._placeholder = QPixmap(size, size)
+            self._placeholder.fill(Qt.transparent)
+            painter = QPainter(self._placeholder)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(QColor(180, 180, 180), 2, Qt.DashLine))
+            margin = size // 6
+            painter.drawEllipse(margin, margin, size - 2 * margin, size - 2 * margin)
+            painter.drawText(self._placeholder.rect(), Qt.AlignCenter, "?")
+            painter.end()
+        return self._placeholder
+
+    def _legacy_cache_filename(self, url: str) -> Path:
+        """Nombre que usaba la caché antigua (`md5(url).png`), que se migra al leerla."""
         hash_name = hashlib.md5(url.encode()).hexdigest()
         return self.cache_dir / f"{hash_name}.png"
 
+    def _disk_bytes(self) -> int:
+        try:
+            return self._store.total_size()
+        except sqlite3.ProgrammingError:  # Caché ya cerrada
+            return 0
+
+    def disk_cache_stats(self) -> Dict[str, int]:
+        """Devuelve las estadísticas de la caché de sprites en disco."""
+        return self._store.stats()
+
     def clear_cache(self):
-        """Limpia la caché de sprites."""
+        """Limpia la caché de sprites (memoria, disco y archivos del formato antiguo)."""
         self._cache.clear()
+        if self._atlas is not None:
+            self._atlas.close()
+            self._atlas = None
+        try:
+            (self.cache_dir / ATLAS_NAME).unlink()
+        except FileNotFoundError:
+            pass
+        self._store.clear()
         for file in self.cache_dir.glob("*.png"):
+            if len(file.stem) != 32:
+                continue  # Solo los nombres md5 de la caché antigua
             try:
                 file.unlink()
             except Exception as e:
@@ -81,11 +511,4 @@ class AssetManager(QObject):
 
     def get_sprite_size(self) -> int:
         """Obtiene el tamaño configurado para los sprites."""
-        try:
-            with open("config/settings.yaml", 'r', encoding='utf-8') as f:
-                import yaml
-                config = yaml.safe_load(f)
-                return config['sprites']['size']
-        except Exception as e:
-            self.logger.warning(f"Error al leer configuración de tamaño de sprite: {e}")
-            return 96  # Tamaño por defecto
+        return self.sprite_size
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Atlas de sprites: todos los sprites de la caché en disco en un solo archivo.
+
+El archivo empieza con una tabla JSON (URL -> página y rectángulo) y le siguen
+las páginas en ARGB32 premultiplicado sin comprimir. Al abrirlo se proyecta en
+memoria con `mmap` y cada página se envuelve en un QImage sin copiarla, así que
+mostrar un sprite solo copia su rectángulo en lugar de decodificar un PNG.
+"""
+
+import json
+import mmap
+import struct
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from PyQt5.QtGui import QImage, QPainter, QPixmap
+from PyQt5.QtCore import Qt
+
+import storage
+from sprite_store import SpriteStore
+
+ATLAS_NAME = "sprites.atlas"
+MAGIC = b"PKATLAS1"
+HEADER = struct.Struct("<8sI")  # firma y longitud de la tabla
+ALIGNMENT = 16
+IMAGE_FORMAT = QImage.Format_ARGB32_Premultiplied
+
+Rect = Tuple[int, int, int, int]
+
+def pack(sizes: Dict[str, Tuple[int, int]], page_size: int) -> Tuple[Dict[str, Tuple[int, Rect]], int]:
+    """Reparte rectángulos en páginas cuadradas por estantes (de más alto a más bajo).
+
+    Devuelve la página y el rectángulo de cada clave y el número de páginas;
+    las claves que no caben en una página se omiten.
+    """
+    placements: Dict[str, Tuple[int, Rect]] = {}
+    page, x, y, shelf = 0, 0, 0, 0
+    for key, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if width > page_size or height > page_size:
+            continue
+        if x + width > page_size:
+            x, y, shelf = 0, y + shelf, 0
+        if y + height > page_size:
+            page, x, y, shelf = page + 1, 0, 0, 0
+        placements[key] = (page, (x, y, width, height))
+        x += width
+        shelf = max(shelf, height)
+    return placements, (page + 1 if placements else 0)
+
+def build_atlas(store: SpriteStore, path: Union[str, Path], page_size: int = 1024) -> int:
+    """Empaqueta los sprites de la caché en disco en un atlas y devuelve cuántas URL incluye.
+
+    Los sprites con el mismo contenido ocupan un único rectángulo.
+    """
+    logger = logging.getLogger(__name__)
+    images: Dict[str, QImage] = {}
+    urls: Dict[str, str] = {}
+    for url, digest in store.entries():
+        if digest not in images:
+            image = QImage()
+            data = store.get(url)
+            if data is None or not image.loadFromData(data):
+                continue
+            images[digest] = image.convertToFormat(IMAGE_FORMAT)
+        urls[url] = digest
+
+    placements, page_count = pack({digest: (image.width(), image.height())
+                                   for digest, image in images.items()}, page_size)
+    pages = [QImage(page_size, page_size, IMAGE_FORMAT) for _ in range(page_count)]
+    for page in pages:
+        page.fill(Qt.transparent)
+    painters = [QPainter(page) for page in pages]
+    for painter in painters:
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+    for digest, (page, (x, y, _, _)) in placements.items():
+        painters[page].drawImage(x, y, images[digest])
+    for painter in painters:
+        painter.end()
+
+    sprites = {url: [placements[digest][0], *placements[digest][1]]
+               for url, digest in urls.items() if digest in placements}
+    page_bytes = page_size * page_size * 4
+    table = {"version": 1, "page_size": page_size, "sprites": sprites}
+    # Las páginas empiezan alineadas tras la tabla; el desplazamiento se calcula al abrir
+    raw_table = json.dumps(table, separators=(',', ':')).encode("utf-8")
+    header = HEADER.pack(MAGIC, len(raw_table)) + raw_table
+    header += b"\0" * (-len(header) % ALIGNMENT)
+    body = b"".join(page.constBits().asstring(page_bytes) for page in pages)
+    storage.atomic_write(path, header + body, durable=False)
+    logger.info(f"Atlas de sprites creado en {path}: {len(sprites)} sprites en {page_count} páginas")
+    return len(sprites)
+
+class SpriteAtlas:
+    """Atlas de sprites proyectado en memoria (solo lectura)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, table_length = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError("firma de atlas no válida")
+            table = json.loads(self._map[HEADER.size:HEADER.size + table_length].decode("utf-8"))
+            self.page_size = int(table["page_size"])
+            self._sprites: Dict[str, List[int]] = table["sprites"]
+            offset = HEADER.size + table_length
+            offset += -offset % ALIGNMENT
+            page_bytes = self.page_size * self.page_size * 4
+            page_count = (len(self._map) - offset) // page_bytes
+            if any(entry[0] >= page_count for entry in self._sprites.values()):
+                raise ValueError("atlas truncado")
+            self._view = memoryview(self._map)
+            self._views = [self._view[offset + i * page_bytes:offset + (i + 1) * page_bytes]
+                           for i in range(page_count)]
+            self._pages = [QImage(v, self.page_size, self.page_size, self.page_size * 4, IMAGE_FORMAT)
+                           for v in self._views]
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> Optional['SpriteAtlas']:
+        """Abre un atlas; devuelve None si no existe o no es válido."""
+        if not Path(path).exists():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            logging.getLogger(__name__).warning(f"Atlas de sprites {path} no válido, se ignora: {e}")
+            return None
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._sprites
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def image(self, url: str) -> Optional[QImage]:
+        """Copia el rectángulo del sprite a un QImage propio (seguro entre hilos)."""
+        entry = self._sprites.get(url)
+        if entry is None:
+            return None
+        page, x, y, width, height = entry
+        return self._pages[page].copy(x, y, width, height)
+
+    def pixmap(self, url: str) -> Optional[QPixmap]:
+        """Devuelve el sprite como QPixmap (solo en el hilo de la GUI)."""
+        image = self.image(url)
+        return None if image is None else QPixmap.fromImage(image)
+
+    def close(self):
+        """Libera la proyección en memoria y el archivo."""
+        self._pages = []
+        for view in getattr(self, '_views', []) + [getattr(self, '_view', None)]:
+            if view is not None:
+                view.release()
+        self._views = []
+        self._view = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+from PyQt5.QtCore import QObject, QTimer
+
+import storage
+from models import Team, TeamEvent
+from settings import Settings, get_settings
+
+class AutoSaver(QObject):
+    """Guardado automático diferido del equipo.
+
+    Cada cambio del equipo reinicia un temporizador; cuando pasa `delay_ms`
+    sin cambios se toma una instantánea del equipo en el hilo de la GUI y se
+    escribe en disco en un único hilo de fondo, de modo que una ráfaga de
+    cambios produce una sola escritura y las escrituras no se reordenan.
+    """
+
+    def __init__(self, team: Team, path: Union[str, Path], delay_ms: Optional[int] = None,
+                 parent=None, settings: Optional[Settings] = None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._fixed_delay = delay_ms
+        self.delay_ms = max(0, delay_ms if delay_ms is not None else (settings or get_settings()).files.autosave_delay)
+        self.saves_written = 0
+        self._dirty = False
+        self._closed = False
+        self._future: Optional[Future] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._write)
+        self.team = team
+        self.team.subscribe(self._on_team_changed)
+
+    def apply_settings(self, settings: Settings):
+        """Aplica el nuevo retardo; la espera en curso sigue con el anterior."""
+        if self._fixed_delay is None:
+            self.delay_ms = max(0, settings.files.autosave_delay)
+
+    def set_team(self, team: Team):
+        """Cambia el equipo vigilado (por ejemplo, al cargar otro guardado)."""
+        self.team.unsubscribe(self._on_team_changed)
+        self.team = team
+        self.team.subscribe(self._on_team_changed)
+
+    @property
+    def pending(self) -> bool:
+        """Indica si hay cambios sin escribir o una escritura en curso."""
+        return self._dirty or (self._future is not None and not self._future.done())
+
+    def _on_team_changed(self, event: TeamEvent):
+        """Marca el equipo como modificado y reinicia la espera."""
+        if self._closed:
+            return
+        self._dirty = True
+        self._timer.start(self.delay_ms)
+
+    def _write(self):
+        """Toma una instantánea del equipo y la escribe en segundo plano."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        snapshot = self.team.to_dict()
+        self._future = self._executor.submit(self._save, snapshot)
+
+    def _save(self, snapshot: dict):
+        """Escribe la instantánea en disco (se ejecuta en el hilo de guardado)."""
+        try:
+            storage.save(self.path, snapshot)
+            self.saves_written += 1
+            self.logger.debug(f"Equipo guardado automáticamente en {self.path}")
+        except Exception as e:
+            self.logger.error(f"Error en el guardado automático de {self.path}: {e}")
+
+    def flush(self):
+        """Escribe ya los cambios pendientes y espera a que terminen en disco."""
+        self._timer.stop()
+        self._write()
+        if self._future is not None:
+            self._future.result()
+
+    def close(self):
+        """Vacía los cambios pendientes y detiene el hilo de guardado."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self.team.unsubscribe(self._on_team_changed)
+        self._executor.shutdown(wait=True)
@@ -1,21 +1,49 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QComboBox, QLineEdit, QPushButton, QLabel,
     QScrollArea, QFrame, QMenu, QAction, QDialog,
-    QApplication, QMessageBox, QSizePolicy
+    QApplication, QMessageBox, QSizePolicy, QInputDialog, QDockWidget
 )
-from PyQt5.QtCore import Qt, QPoint, QMimeData, pyqtSignal, QRect
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QDrag, QPen
+from PyQt5.QtCore import Qt, QPoint, QMimeData, pyqtSignal, QRect, QSize
+from PyQt5.QtGui import QPixmap, QPainter, QColor, QDrag, QPen, QKeySequence
 
-from models import Team, Pokemon
-from pokeapi import PokeAPIClient
+from models import Team, TeamEvent, Pokemon
 from assets import AssetManager
-from widgets import HeartCounter
+from widgets import HeartCounter, MetricsDialog, TeamPickerDialog
+from list_model import PokemonListModel
+from search import SearchFilterProxyModel
+from workers import StreamWorker, Worker, get_thread_pool
+from autosave import AutoSaver
+from library import SaveLibrary
+from history import TeamHistory
+from settings import Settings, get_settings
+from metrics import get_registry
+from species_grid import (
+    SPECIES_MIME_TYPE, SpeciesGridView, SpeciesThumbnailModel, decode_species_mime, species_id_from_url
+)
+
+if TYPE_CHECKING:
+    from pokeapi import PokeAPIClient  # Solo para anotaciones: importa requests
+
+_metrics = get_registry()
+# Pintados: de 0.1 ms al presupuesto de un fotograma a 60 fps y más allá
+PAINT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.0167, 0.025, 0.05, 0.1)
+SLOT_PAINT_TIME = _metrics.histogram("ui_paint_seconds", "Duración de los pintados", PAINT_BUCKETS,
+                                     widget="pokemon_slot")
+WINDOW_PAINT_TIME = _metrics.histogram("ui_paint_seconds", buckets=PAINT_BUCKETS, widget="main_window")
+UI_ACTIONS = {
+    action: _metrics.counter("ui_actions_total", "Acciones del usuario en la ventana principal", action=action)
+    for action in ("add", "move", "remove", "edit", "clear", "undo", "redo", "save", "load")
+}
+FIRST_PAINT = _metrics.gauge("ui_first_paint_seconds", "Tiempo hasta el primer pintado de la ventana")
+LIST_LOAD_TIME = _metrics.gauge("ui_list_load_seconds", "Tiempo de carga de la lista de especies")
 
 class PokemonWidget(QFrame):
     """Widget que representa un Pokemon en el equipo."""
@@ -25,6 +53,11 @@ class PokemonWidget(QFrame):
     pokemon_remove_requested = pyqtSignal(object)  # (slot)
     pokemon_drag_started = pyqtSignal(object)  # (slot)
     pokemon_drag_ended = pyqtSignal(object)  # (slot)
+    species_dropped = pyqtSignal(object, int, str)  # (target_slot, species_id, nombre)
+
+    # Sprites pre-escalados compartidos entre slots: (url, sprite, ancho, alto, dpr) -> QPixmap
+    _scaled_cache: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+    SCALED_CACHE_SIZE = 64
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -36,6 +69,8 @@ class PokemonWidget(QFrame):
         self.drag_start_position = QPoint()
         self.is_dragging = False
         self.is_drop_target = False
+        self._scaled_sprite: Optional[QPixmap] = None
+        self._scaled_key: Optional[Tuple] = None
         
         # Botones de acción
         self.edit_button = QPushButton("✏️", self)
@@ -62,8 +97,63 @@ class PokemonWidget(QFrame):
             self.remove_button.hide()
         self.update()
 
+    def on_sprite_loaded(self, url: str, sprite: QPixmap):
+        """Sustituye el marcador de posición cuando termina de cargar el sprite."""
+        if self.pokemon and self.pokemon.sprite_url == url:
+            self.sprite = sprite
+            self.update()
+
+    def resizeEvent(self, event):
+        """Invalida el sprite escalado y recoloca los botones al cambiar de tamaño."""
+        super().resizeEvent(event)
+        self._scaled_sprite = None
+        self._scaled_key = None
+        # Posicionar botones en la esquina superior derecha
+        self.edit_button.move(self.width() - 25, 5)
+        self.remove_button.move(self.width() - 25, 30)
+
+    def _sprite_area(self) -> QRect:
+        """Rectángulo disponible para el sprite (deja espacio para el apodo)."""
+        return self.rect().adjusted(10, 10, -10, -30)
+
+    def _get_scaled_sprite(self) -> QPixmap:
+        """Devuelve el sprite escalado al tamaño actual del slot.
+
+        El resultado se reutiliza mientras no cambien el sprite, el tamaño o la
+        densidad de píxeles, de modo que cada pintado es una copia 1:1.
+        """
+        area = self._sprite_area()
+        dpr = self.devicePixelRatioF()
+        url = self.pokemon.sprite_url if self.pokemon else ""
+        key = (url, self.sprite.cacheKey(), area.width(), area.height(), dpr)
+        if self._scaled_key == key:
+            return self._scaled_sprite
+
+        cache = PokemonWidget._scaled_cache
+        scaled = cache.get(key)
+        if scaled is None:
+            # Calcular el tamaño manteniendo el aspect ratio
+            scaled_size = self.sprite.size()
+            scaled_size.scale(QSize(max(1, int(area.width() * dpr)),
+                                    max(1, int(area.height() * dpr))), Qt.KeepAspectRatio)
+            scaled = self.sprite.scaled(scaled_size, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+            scaled.setDevicePixelRatio(dpr)
+            cache[key] = scaled
+            while len(cache) > self.SCALED_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        self._scaled_sprite = scaled
+        self._scaled_key = key
+        return scaled
+
     def paintEvent(self, event):
         """Dibuja el Pokemon y su apodo."""
+        with SLOT_PAINT_TIME.time():
+            self._paint(event)
+
+    def _paint(self, event):
         super().paintEvent(event)
         if self.pokemon and self.sprite:
             painter = QPainter(self)
@@ -72,30 +162,20 @@ class PokemonWidget(QFrame):
             if self.is_drop_target:
                 painter.fillRect(self.rect(), QColor(200, 255, 200, 50))
             
-            # Calcular el rectángulo manteniendo proporciones
-            widget_rect = self.rect().adjusted(10, 10, -10, -30)
-            sprite_rect = self.sprite.rect()
-            
-            # Calcular el tamaño manteniendo el aspect ratio
-            scaled_size = sprite_rect.size()
-            scaled_size.scale(widget_rect.size(), Qt.KeepAspectRatio)
-            
-            # Centrar el sprite
-            x = widget_rect.x() + (widget_rect.width() - scaled_size.width()) / 2
-            y = widget_rect.y() + (widget_rect.height() - scaled_size.height()) / 2
-            
-            # Dibujar sprite
-            target_rect = QRect(int(x), int(y), scaled_size.width(), scaled_size.height())
-            painter.drawPixmap(target_rect, self.sprite)
+            # Centrar el sprite pre-escalado y dibujarlo sin reescalar
+            area = self._sprite_area()
+            scaled = self._get_scaled_sprite()
+            dpr = scaled.devicePixelRatioF()
+            width = int(scaled.width() / dpr)
+            height = int(scaled.height() / dpr)
+            x = area.x() + (area.width() - width) // 2
+            y = area.y() + (area.height() - height) // 2
+            painter.drawPixmap(x, y, scaled)
             
             # Dibujar apodo
             if self.pokemon.nickname:
                 painter.drawText(self.rect().adjusted(10, -25, -10, -5),
                                Qt.AlignBottom | Qt.AlignHCenter, self.pokemon.nickname)
-            
-            # Posicionar botones en la esquina superior derecha
-            self.edit_button.move(self.width() - 25, 5)
-            self.remove_button.move(self.width() - 25, 30)
 
     def mousePressEvent(self, event):
         """Inicia el arrastre del Pokemon."""
@@ -139,8 +219,8 @@ class PokemonWidget(QFrame):
             self.pokemon_drag_ended.emit(self)
 
     def dragEnterEvent(self, event):
-        """Acepta el evento de arrastre si contiene datos de Pokemon."""
-        if event.mimeData().hasText():
+        """Acepta el evento de arrastre si contiene un Pokemon del equipo o una especie."""
+        if event.mimeData().hasText() or event.mimeData().hasFormat(SPECIES_MIME_TYPE):
             self.is_drop_target = True
             self.update()
             event.acceptProposedAction()
@@ -155,7 +235,11 @@ class PokemonWidget(QFrame):
         self.is_drop_target = False
         self.update()
         
-        if event.mimeData().hasText():
+        species = decode_species_mime(event.mimeData())
+        if species is not None:
+            self.species_dropped.emit(self, *species)
+            event.acceptProposedAction()
+        elif event.mimeData().hasText():
             pokemon_id = int(event.mimeData().text())
             self.pokemon_dropped.emit(self, pokemon_id)
             event.acceptProposedAction()
@@ -191,18 +275,47 @@ class PokemonWidget(QFrame):
             self.pokemon_remove_requested.emit(self)
 
 class MainWindow(QMainWindow):
-    """Ventana principal de la aplicación."""
-    def __init__(self, team: Team, api_client: PokeAPIClient, asset_manager: AssetManager):
+    """Ventana principal de la aplicación.
+
+    Si `load_list` es False la lista de especies no se carga al crear la
+    ventana: el arranque la pide tras el primer pintado (`first_painted`),
+    asignando entonces `api_client` y llamando a `load_pokemon_list`.
+    """
+    first_painted = pyqtSignal()
+    pokemon_list_page_loaded = pyqtSignal(int)  # Especies recibidas hasta ahora
+    pokemon_list_loaded = pyqtSignal(int)  # Número de especies (0 si falla)
+
+    def __init__(self, team: Team, api_client: Optional['PokeAPIClient'], asset_manager: AssetManager,
+                 autosaver: Optional[AutoSaver] = None, library: Optional[SaveLibrary] = None,
+                 load_list: bool = True, settings: Optional[Settings] = None):
         super().__init__()
+        self.settings = settings or get_settings()
         self.team = team
         self.api_client = api_client
         self.asset_manager = asset_manager
+        self.autosaver = autosaver
+        self.library = library or SaveLibrary()
+        self.team_name: Optional[str] = None
         self.logger = logging.getLogger(__name__)
         self.score = 0
+        self.thread_pool = get_thread_pool()
+        self._startup_time = time.perf_counter()
+        self._first_paint_done = False
+        self._list_worker: Optional[StreamWorker] = None
+        self._sprite_workers: Dict[Tuple[int, str], Worker] = {}
+        self._resolving_sprites: Set[str] = set()
+        self.slot_updates = 0  # Slots actualizados desde el inicio (para diagnóstico)
         
         self.setWindowTitle("Pokemon Team GUI")
+        self.history = TeamHistory(self.team, settings=self.settings)
         self.setup_ui()
-        self.load_pokemon_list()
+        self.team.subscribe(self._on_team_changed)
+        self.update_team_display()
+        self._sync_heart_counter()
+        if load_list:
+            self.load_pokemon_list()
+        else:
+            self._show_list_loading()
 
     def setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -222,6 +335,7 @@ class MainWindow(QMainWindow):
         
         # Añadir contador de corazones
         self.heart_counter = HeartCounter()
+        self.heart_counter.count_changed.connect(self._on_heart_count_changed)
         counter_layout.addWidget(self.heart_counter)
         counter_layout.addStretch()
         
@@ -233,9 +347,18 @@ class MainWindow(QMainWindow):
         selection_layout = QHBoxLayout(selection_widget)
         selection_layout.setContentsMargins(10, 5, 10, 5)
         
-        # ComboBox para selección de Pokemon
+        # ComboBox para selección de Pokemon, filtrado por el campo de búsqueda
+        self.pokemon_list_model = PokemonListModel(self)
+        self.pokemon_filter_model = SearchFilterProxyModel(self)
+        self.pokemon_filter_model.setSourceModel(self.pokemon_list_model)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Buscar...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.filter_pokemon_list)
         self.pokemon_combo = QComboBox()
+        self.pokemon_combo.setModel(self.pokemon_filter_model)
         selection_layout.addWidget(QLabel("Pokemon:"))
+        selection_layout.addWidget(self.search_edit)
         selection_layout.addWidget(self.pokemon_combo)
         
         # Campo para apodo
@@ -244,14 +367,18 @@ class MainWindow(QMainWindow):
         selection_layout.addWidget(self.nickname_edit)
         
         # Botones de acción
-        add_button = QPushButton("Añadir")
-        add_button.clicked.connect(self.add_pokemon)
-        selection_layout.addWidget(add_button)
+        self.add_button = QPushButton("Añadir")
+        self.add_button.clicked.connect(self.add_pokemon)
+        selection_layout.addWidget(self.add_button)
         
         clear_button = QPushButton("Limpiar Equipo")
         clear_button.clicked.connect(self.clear_team)
         selection_layout.addWidget(clear_button)
         
+        self.browse_button = QPushButton("Explorar")
+        self.browse_button.setCheckable(True)
+        selection_layout.addWidget(self.browse_button)
+        
         layout.addWidget(selection_widget)
         
         # Área de equipo (expansible y con tamaño mínimo)
@@ -262,7 +389,7 @@ class MainWindow(QMainWindow):
         
         # Crear widgets para cada slot del equipo
         self.team_slots = []
-        for _ in range(6):
+        for _ in range(self.team.max_size):
             slot = PokemonWidget()
             slot.setMinimumSize(100, 100)  # Tamaño mínimo para cada slot
             slot.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # Política de expansión
@@ -272,8 +399,11 @@ class MainWindow(QMainWindow):
             slot.pokemon_remove_requested.connect(self.remove_pokemon)
             slot.pokemon_drag_started.connect(self.handle_drag_start)
             slot.pokemon_drag_ended.connect(self.handle_drag_end)
+            slot.species_dropped.connect(self.handle_species_drop)
+            self.asset_manager.sprite_loaded.connect(slot.on_sprite_loaded)
             team_layout.addWidget(slot)
             self.team_slots.append(slot)
+        self.asset_manager.sprite_failed.connect(self._on_sprite_failed)
         
         layout.addWidget(team_widget, stretch=1)  # Dar prioridad de expansión al área de equipo
         
@@ -291,13 +421,114 @@ class MainWindow(QMainWindow):
         load_button.clicked.connect(self.load_team)
         action_layout.addWidget(load_button)
         
+        # Deshacer / rehacer (Ctrl+Z / Ctrl+Y)
+        self.undo_action = QAction("Deshacer", self)
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action = QAction("Rehacer", self)
+        self.redo_action.setShortcuts([QKeySequence.Redo, QKeySequence("Ctrl+Y")])
+        self.redo_action.triggered.connect(self.redo)
+        self.addAction(self.undo_action)
+        self.addAction(self.redo_action)
+        # Métricas de la sesión (depuración)
+        self.metrics_action = QAction("Métricas", self)
+        self.metrics_action.setShortcut(QKeySequence("Ctrl+Shift+M"))
+        self.metrics_action.triggered.connect(self.show_metrics)
+        self.addAction(self.metrics_action)
+        self._metrics_dialog: Optional[MetricsDialog] = None
+        self.undo_button = QPushButton("Deshacer")
+        self.undo_button.clicked.connect(self.undo)
+        action_layout.addWidget(self.undo_button)
+        self.redo_button = QPushButton("Rehacer")
+        self.redo_button.clicked.connect(self.redo)
+        action_layout.addWidget(self.redo_button)
+        self._update_history_actions()
+        
         layout.addWidget(action_widget)
+        
+        # Cuadrícula de especies (oculta hasta que se pide; comparte la búsqueda con el ComboBox)
+        self.species_model = SpeciesThumbnailModel(self.asset_manager, self._sprite_url_for, parent=self)
+        self.species_model.setSourceModel(self.pokemon_filter_model)
+        self.species_grid = SpeciesGridView()
+        self.species_grid.setModel(self.species_model)
+        self.species_grid.activated.connect(self._on_species_activated)
+        self.species_dock = QDockWidget("Especies", self)
+        self.species_dock.setWidget(self.species_grid)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.species_dock)
+        self.species_dock.hide()
+        self.browse_button.toggled.connect(self.species_dock.setVisible)
+        self.species_dock.visibilityChanged.connect(self.browse_button.setChecked)
+
+    def paintEvent(self, event):
+        """Registra el tiempo hasta el primer pintado de la ventana."""
+        with WINDOW_PAINT_TIME.time():
+            super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            elapsed = (time.perf_counter() - self._startup_time) * 1000
+            FIRST_PAINT.set(elapsed / 1000)
+            self.logger.info(f"Tiempo hasta el primer pintado: {elapsed:.1f} ms")
+            self.first_painted.emit()
 
     def load_pokemon_list(self):
-        """Carga la lista de Pokemon en el ComboBox."""
-        pokemon_list = self.api_client.get_pokemon_list()
-        for pokemon in pokemon_list:
-            self.pokemon_combo.addItem(pokemon['name'].title(), pokemon['url'])
+        """Carga la lista de Pokemon en segundo plano sin bloquear la interfaz.
+
+        La lista llega por páginas: cada una se añade al modelo en cuanto se
+        recibe y la selección se habilita con la primera.
+        """
+        self._show_list_loading()
+        self._list_load_start = time.perf_counter()
+        self.pokemon_list_model.set_entries([])
+
+        self._list_worker = StreamWorker(self.api_client.iter_pokemon_list)
+        self._list_worker.signals.item.connect(self._on_pokemon_page_loaded)
+        self._list_worker.signals.result.connect(self._on_pokemon_list_loaded)
+        self._list_worker.signals.error.connect(self._on_pokemon_list_error)
+        self.thread_pool.start(self._list_worker)
+
+    def _show_list_loading(self):
+        """Deshabilita la selección mientras no esté la lista."""
+        self.pokemon_combo.setEnabled(False)
+        self.add_button.setEnabled(False)
+        self.pokemon_combo.setPlaceholderText("Cargando Pokemon...")
+
+    def _on_pokemon_page_loaded(self, page: List[dict]):
+        """Añade una página de la lista al modelo con una única inserción."""
+        first_page = self.pokemon_list_model.rowCount() == 0
+        self.pokemon_list_model.append_entries(page)
+        if first_page and page:
+            self.pokemon_combo.setCurrentIndex(0)
+            self.pokemon_combo.setEnabled(True)
+            self.add_button.setEnabled(True)
+            elapsed = (time.perf_counter() - self._list_load_start) * 1000
+            self.logger.info(f"Primera página de la lista de Pokemon: {len(page)} entradas en {elapsed:.1f} ms")
+        self.pokemon_list_page_loaded.emit(self.pokemon_list_model.rowCount())
+
+    def _on_pokemon_list_loaded(self, pages: int):
+        """Termina la carga de la lista cuando han llegado todas las páginas."""
+        self._list_worker = None
+        count = self.pokemon_list_model.rowCount()
+        if not count:
+            self.pokemon_combo.setPlaceholderText("No se pudo cargar la lista")
+            self.pokemon_list_loaded.emit(0)
+            return
+        elapsed = (time.perf_counter() - self._list_load_start) * 1000
+        LIST_LOAD_TIME.set(elapsed / 1000)
+        self.logger.info(f"Lista de Pokemon cargada: {count} entradas en {pages} páginas en {elapsed:.1f} ms")
+        self.pokemon_list_loaded.emit(count)
+
+    def _on_pokemon_list_error(self, error: Exception):
+        """Muestra el estado de error si la carga de la lista falla (se conservan las páginas recibidas)."""
+        self._list_worker = None
+        self.pokemon_combo.setPlaceholderText("No se pudo cargar la lista")
+        self.logger.error(f"Error al cargar la lista de Pokemon: {error}")
+        self.pokemon_list_loaded.emit(self.pokemon_list_model.rowCount())
+
+    def filter_pokemon_list(self, text: str):
+        """Filtra el ComboBox según el texto de búsqueda y selecciona el mejor resultado."""
+        self.pokemon_filter_model.set_query(text)
+        if self.pokemon_filter_model.rowCount() > 0:
+            self.pokemon_combo.setCurrentIndex(0)
 
     def update_score(self, points: int):
         """Actualiza el puntaje y el contador de corazones."""
@@ -305,65 +536,261 @@ class MainWindow(QMainWindow):
         self.heart_counter.set_count(self.score)
 
     def add_pokemon(self):
-        """Añade un Pokemon al equipo."""
-        if len(self.team.pokemon) >= 6:
-            self.logger.warning("El equipo está lleno")
-            return
-        
+        """Añade al equipo el Pokemon seleccionado en el ComboBox."""
         current_index = self.pokemon_combo.currentIndex()
         if current_index < 0:
             return
         
         pokemon_url = self.pokemon_combo.currentData()
-        pokemon_id = int(pokemon_url.split('/')[-2])
-        
-        # Crear nuevo Pokemon
-        pokemon = Pokemon(
-            id=pokemon_id,
-            name=self.pokemon_combo.currentText(),
-            nickname=self.nickname_edit.text()
-        )
-        
-        # Obtener sprite
-        sprite_url = self.api_client.get_sprite_url(pokemon_id)
-        if sprite_url:
-            sprite = self.asset_manager.get_sprite(sprite_url)
-            if sprite:
-                pokemon.sprite_url = sprite_url
-                self.team.add_pokemon(pokemon)
-                self.update_team_display()
-                self.logger.info(f"Pokemon {pokemon.name} añadido al equipo")
+        self.add_species(species_id_from_url(pokemon_url), self.pokemon_combo.currentText(),
+                         nickname=self.nickname_edit.text())
+
+    def add_species(self, pokemon_id: int, name: str, index: Optional[int] = None,
+                    nickname: str = "") -> bool:
+        """Añade una especie al equipo (al final o en la posición indicada)."""
+        if len(self.team.pokemon) >= self.team.max_size:
+            self.logger.warning("El equipo está lleno")
+            return False
+        pokemon = Pokemon(id=pokemon_id, name=name, nickname=nickname)
+        # La URL del sprite se deduce sin red; el sprite se descarga en segundo plano
+        pokemon.sprite_url = self._sprite_url_for(pokemon_id) or ""
+        if index is None:
+            index = len(self.team.pokemon)
+        self.team.insert_pokemon(index, pokemon)
+        UI_ACTIONS["add"].inc()
+        self.logger.info(f"Pokemon {pokemon.name} añadido al equipo")
+        return True
+
+    def handle_species_drop(self, target_slot: PokemonWidget, pokemon_id: int, name: str):
+        """Añade la especie soltada desde la cuadrícula en la posición del slot."""
+        self.add_species(pokemon_id, name, self.team_slots.index(target_slot))
+
+    def _on_species_activated(self, index):
+        """Añade al equipo la especie activada (doble clic o Intro) en la cuadrícula."""
+        pokemon_id = self.species_model.species_id(index)
+        if pokemon_id is not None:
+            self.add_species(pokemon_id, index.data(Qt.DisplayRole))
+
+    def _sprite_url_for(self, pokemon_id: int) -> Optional[str]:
+        """URL deducida del sprite de una especie (None hasta que haya cliente de la API)."""
+        if self.api_client is None:
+            return None
+        return self.api_client.resolve_sprite_url(pokemon_id)
+
+    def _on_sprite_failed(self, url: str):
+        """Si un sprite deducido no existe, consulta el detalle en segundo plano."""
+        pokemon_ids = {p.id for p in self.team.pokemon if p.sprite_url == url}
+        if not pokemon_ids or url in self._resolving_sprites or self.api_client is None:
+            return
+        self._resolving_sprites.add(url)
+        for pokemon_id in pokemon_ids:
+            worker = Worker(self._lookup_sprite_url, pokemon_id, url)
+            worker.signals.result.connect(self._on_sprite_url_resolved)
+            self._sprite_workers[(pokemon_id, url)] = worker
+            self.thread_pool.start(worker)
+
+    def _lookup_sprite_url(self, pokemon_id: int, failed_url: str) -> Tuple[int, str, Optional[str]]:
+        """Consulta la URL real del sprite en el detalle (se ejecuta en el pool)."""
+        try:
+            sprite_url = self.api_client.get_sprite_url(pokemon_id)
+        except Exception as e:
+            self.logger.error(f"Error al consultar el sprite del Pokemon {pokemon_id}: {e}")
+            sprite_url = None
+        return pokemon_id, failed_url, sprite_url
+
+    def _on_sprite_url_resolved(self, result: Tuple[int, str, Optional[str]]):
+        """Actualiza la URL del sprite de los Pokemon afectados y lo vuelve a cargar."""
+        pokemon_id, failed_url, sprite_url = result
+        self._sprite_workers.pop((pokemon_id, failed_url), None)
+        if not any(key[1] == failed_url for key in self._sprite_workers):
+            self._resolving_sprites.discard(failed_url)
+        if not sprite_url or sprite_url == failed_url:
+            self.logger.warning(f"No hay sprite disponible para el Pokemon {pokemon_id}")
+            return
+        for index, pokemon in enumerate(self.team.pokemon):
+            if pokemon.id == pokemon_id and pokemon.sprite_url == failed_url:
+                self.team.set_sprite_url(index, sprite_url)
+        self.logger.info(f"URL del sprite de {pokemon_id} corregida: {sprite_url}")
+
+    def set_team(self, team: Team):
+        """Sustituye el equipo mostrado y se suscribe a sus cambios."""
+        self.team.unsubscribe(self._on_team_changed)
+        self.team = team
+        self.history.set_team(team)
+        self.team.subscribe(self._on_team_changed)
+        if self.autosaver:
+            self.autosaver.set_team(team)
+        self.update_team_display()
+        self._sync_heart_counter()
+        self._update_history_actions()
+
+    def apply_settings(self, settings: Settings):
+        """Aplica una configuración recargada a la ventana y a sus componentes.
+
+        El número de slots del equipo se fija al crear la ventana; el resto de
+        valores se aplica en caliente.
+        """
+        self.settings = settings
+        self.asset_manager.apply_settings(settings)
+        self.history.apply_settings(settings)
+        if self.autosaver:
+            self.autosaver.apply_settings(settings)
+        if self.api_client is not None:
+            self.api_client.apply_settings(settings)
+        self.logger.info("Configuración recargada")
+
+    def show_metrics(self):
+        """Abre (sin bloquear) el diálogo de métricas de la sesión."""
+        if self._metrics_dialog is None:
+            self._metrics_dialog = MetricsDialog(get_registry(), self)
+        self._metrics_dialog.refresh()
+        self._metrics_dialog.show()
+        self._metrics_dialog.raise_()
+
+    def undo(self):
+        """Deshace el último cambio del equipo."""
+        if self.history.undo():
+            UI_ACTIONS["undo"].inc()
+            self.logger.info("Cambio deshecho")
+        self._update_history_actions()
+
+    def redo(self):
+        """Rehace el último cambio deshecho."""
+        if self.history.redo():
+            UI_ACTIONS["redo"].inc()
+            self.logger.info("Cambio rehecho")
+        self._update_history_actions()
+
+    def _update_history_actions(self):
+        """Habilita deshacer y rehacer según el historial."""
+        can_undo = self.history.can_undo()
+        can_redo = self.history.can_redo()
+        self.undo_action.setEnabled(can_undo)
+        self.undo_button.setEnabled(can_undo)
+        self.redo_action.setEnabled(can_redo)
+        self.redo_button.setEnabled(can_redo)
+
+    def _on_heart_count_changed(self, count: int):
+        """Refleja en el equipo los cambios hechos con el contador de corazones."""
+        self.team.set_hearts(count)
+
+    def _sync_heart_counter(self):
+        """Muestra en el contador los corazones del equipo sin volver a notificarlos."""
+        self.heart_counter.blockSignals(True)
+        try:
+            self.heart_counter.set_max_hearts(self.team.total_hearts)
+            self.heart_counter.set_count(self.team.current_hearts)
+        finally:
+            self.heart_counter.blockSignals(False)
+
+    def _on_team_changed(self, event: TeamEvent):
+        """Actualiza solo los slots afectados por un cambio del equipo."""
+        self._update_history_actions()
+        size = len(self.team.pokemon)
+        if event.kind == TeamEvent.INSERTED:
+            rows = range(event.index, size)
+        elif event.kind == TeamEvent.REMOVED:
+            rows = range(event.index, size + 1)
+        elif event.kind == TeamEvent.MOVED:
+            rows = range(min(event.index, event.to_index), max(event.index, event.to_index) + 1)
+        elif event.kind == TeamEvent.SWAPPED:
+            rows = (event.index, event.to_index)
+        elif event.kind in (TeamEvent.NICKNAME, TeamEvent.SPRITE):
+            rows = (event.index,)
+        elif event.kind == TeamEvent.RESET:
+            rows = range(len(self.team_slots))
+        elif event.kind == TeamEvent.HEARTS:
+            self._sync_heart_counter()
+            return
+        else:
+            return
+
+        if event.kind in (TeamEvent.INSERTED, TeamEvent.REMOVED, TeamEvent.SPRITE, TeamEvent.RESET):
+            self.asset_manager.set_pinned(p.sprite_url for p in self.team.pokemon)
+        before = self.slot_updates
+        for index in rows:
+            self._update_slot(index)
+        self.logger.debug(f"Cambio '{event.kind}' del equipo: {self.slot_updates - before} slots actualizados")
+
+    def _update_slot(self, index: int):
+        """Muestra en un slot el Pokemon de esa posición del equipo."""
+        if not 0 <= index < len(self.team_slots):
+            return
+        slot = self.team_slots[index]
+        if index < len(self.team.pokemon):
+            pokemon = self.team.pokemon[index]
+            sprite = self.asset_manager.get_sprite_async(pokemon.sprite_url)
+            slot.set_pokemon(pokemon, sprite)
+        else:
+            slot.set_pokemon(None, None)
+        self.slot_updates += 1
 
     def update_team_display(self):
-        """Actualiza la visualización del equipo."""
-        for i, slot in enumerate(self.team_slots):
-            if i < len(self.team.pokemon):
-                pokemon = self.team.pokemon[i]
-                sprite = self.asset_manager.get_sprite(pokemon.sprite_url)
-                if sprite:
-                    slot.set_pokemon(pokemon, sprite)
-            else:
-                slot.set_pokemon(None, None)
+        """Actualiza la visualización completa del equipo."""
+        self.asset_manager.set_pinned(p.sprite_url for p in self.team.pokemon)
+        for i in range(len(self.team_slots)):
+            self._update_slot(i)
 
     def save_team(self):
-        """Guarda el equipo actual."""
+        """Pide un nombre y guarda el equipo actual en la biblioteca."""
+        name, ok = QInputDialog.getText(self, "Guardar Equipo", "Nombre del equipo:",
+                                        text=self.team_name or "Equipo")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if name != self.team_name and name in self.library:
+            reply = QMessageBox.question(
+                self, 'Confirmar sobrescritura',
+                f'Ya existe un equipo llamado {name}. ¿Quieres sobrescribirlo?',
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+        self.save_team_as(name)
+
+    def save_team_as(self, name: str):
+        """Guarda el equipo actual en la biblioteca con el nombre indicado."""
         # Guardar el estado actual de los corazones en el equipo
         self.team.set_hearts(self.heart_counter.get_count())
         self.team.set_total_hearts(self.heart_counter.max_hearts)
         
-        self.team.save_to_file("saves/team.yaml")
-        self.logger.info("Equipo guardado")
+        self.library.save(name, self.team)
+        UI_ACTIONS["save"].inc()
+        self._set_team_name(name)
+        self.logger.info(f"Equipo '{name}' guardado")
 
     def load_team(self):
-        """Carga un equipo guardado."""
-        self.team = Team.load_from_file("saves/team.yaml")
-        self.update_team_display()
-        
-        # Actualizar el contador de corazones
-        self.heart_counter.set_max_hearts(self.team.total_hearts)
-        self.heart_counter.set_count(self.team.current_hearts)
-        
-        self.logger.info("Equipo cargado")
+        """Muestra los equipos guardados y carga el elegido."""
+        entries = self.library.entries()
+        if not entries:
+            QMessageBox.information(self, "Cargar Equipo", "No hay equipos guardados.")
+            return
+        dialog = TeamPickerDialog(entries, self)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_name():
+            self.load_team_named(dialog.selected_name())
+
+    def load_team_named(self, name: str) -> bool:
+        """Carga un equipo de la biblioteca por su nombre."""
+        team = self.library.load(name)
+        if team is None:
+            self.logger.warning(f"No existe el equipo '{name}'")
+            return False
+        self.set_team(team)
+        UI_ACTIONS["load"].inc()
+        self._set_team_name(name)
+        self.logger.info(f"Equipo '{name}' cargado")
+        return True
+
+    def _set_team_name(self, name: Optional[str]):
+        """Recuerda el nombre del equipo abierto y lo muestra en el título."""
+        self.team_name = name
+        self.setWindowTitle(f"Pokemon Team GUI - {name}" if name else "Pokemon Team GUI")
+
+    def closeEvent(self, event):
+        """Escribe los cambios pendientes del guardado automático antes de cerrar."""
+        if self.autosaver:
+            self.autosaver.close()
+        super().closeEvent(event)
 
     def handle_drag_start(self, slot: PokemonWidget):
         """Maneja el inicio del arrastre de un Pokemon."""
@@ -384,42 +811,17 @@ class MainWindow(QMainWindow):
         if source_slot and source_slot != target_slot:
             source_index = self.team_slots.index(source_slot)
             target_index = self.team_slots.index(target_slot)
-            
-            # Obtener los Pokemon y sprites
             source_pokemon = source_slot.pokemon
-            source_sprite = source_slot.sprite
-            target_pokemon = target_slot.pokemon
-            target_sprite = target_slot.sprite
             
-            # Actualizar el equipo
-            if target_pokemon:  # Si el slot destino tiene un Pokemon, intercambiar
-                self.team.pokemon[source_index], self.team.pokemon[target_index] = \
-                    self.team.pokemon[target_index], self.team.pokemon[source_index]
-                # Actualizar los slots
-                source_slot.set_pokemon(target_pokemon, target_sprite)
-                target_slot.set_pokemon(source_pokemon, source_sprite)
-            else:  # Si el slot destino está vacío, mover
-                if target_index >= len(self.team.pokemon):
-                    # Añadir al final
-                    self.team.pokemon.append(source_pokemon)
-                    # Eliminar de la posición original
-                    if source_index < target_index:
-                        self.team.pokemon.pop(source_index)
-                else:
-                    # Insertar en la posición correcta
-                    self.team.pokemon.insert(target_index, source_pokemon)
-                    # Eliminar de la posición original
-                    if source_index < target_index:
-                        self.team.pokemon.pop(source_index)
-                    else:
-                        self.team.pokemon.pop(source_index + 1)
-                
-                # Actualizar los slots
-                source_slot.set_pokemon(None, None)
-                target_slot.set_pokemon(source_pokemon, source_sprite)
+            if target_slot.pokemon:  # Si el slot destino tiene un Pokemon, intercambiar
+                moved = self.team.swap_pokemon(source_index, target_index)
+            else:  # Si el slot destino está vacío, mover al final del equipo
+                target_index = len(self.team.pokemon) - 1
+                moved = self.team.move_pokemon(source_index, target_index)
             
-            self.logger.info(f"Pokemon {source_pokemon.name} movido a posición {target_index + 1}")
-            self.update_team_display()
+            if moved:
+                UI_ACTIONS["move"].inc()
+                self.logger.info(f"Pokemon {source_pokemon.name} movido a posición {target_index + 1}")
 
     def remove_pokemon(self, slot: PokemonWidget):
         """Elimina un Pokemon del equipo."""
@@ -438,8 +840,8 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             index = self.team_slots.index(slot)
-            self.team.pokemon.pop(index)
-            self.update_team_display()
+            self.team.remove_pokemon(index)
+            UI_ACTIONS["remove"].inc()
             self.logger.info(f"Pokemon {pokemon_name} eliminado del equipo")
 
     def edit_pokemon(self, slot: PokemonWidget):
@@ -474,8 +876,8 @@ class MainWindow(QMainWindow):
         
         if dialog.exec_() == QDialog.Accepted:
             # Actualizar el Pokemon
-            self.team.pokemon[index].nickname = nickname_edit.text()
-            self.update_team_display()
+            self.team.set_nickname(index, nickname_edit.text())
+            UI_ACTIONS["edit"].inc()
             self.logger.info(f"Pokemon {slot.pokemon.name} actualizado")
 
     def clear_team(self):
@@ -488,6 +890,6 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                self.team.pokemon.clear()
-                self.update_team_display()
+                self.team.clear()
+                UI_ACTIONS["clear"].inc()
                 self.logger.info("Equipo limpiado")
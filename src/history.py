@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import logging
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+from models import Pokemon, Team, TeamEvent
+from settings import Settings, get_settings
+
+class HistoryRecord:
+    """Cambio del equipo que se puede deshacer y rehacer.
+
+    Guarda solo las posiciones y los valores anterior y nuevo; los Pokemon se
+    referencian, no se copian.
+    """
+    __slots__ = ("kind", "index", "to_index", "pokemon", "old", "new", "timestamp")
+
+    def __init__(self, kind: str, index: int = -1, to_index: int = -1,
+                 pokemon: Optional[Pokemon] = None, old: Any = None, new: Any = None):
+        self.kind = kind
+        self.index = index
+        self.to_index = to_index
+        self.pokemon = pokemon
+        self.old = old
+        self.new = new
+        self.timestamp = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"HistoryRecord({self.kind}, index={self.index}, to_index={self.to_index})"
+
+class TeamHistory:
+    """Historial de deshacer/rehacer de un equipo.
+
+    Se alimenta de los `TeamEvent` del equipo y guarda un `HistoryRecord` por
+    cambio en una cola acotada, de modo que deshacer y rehacer son O(1) y la
+    memoria no crece con la sesión. Los cambios de corazones seguidos (en
+    menos de `HEARTS_MERGE_WINDOW` segundos) se agrupan en un único registro.
+    """
+
+    HEARTS_MERGE_WINDOW = 1.0
+
+    def __init__(self, team: Team, limit: Optional[int] = None, settings: Optional[Settings] = None):
+        self.logger = logging.getLogger(__name__)
+        self._fixed_limit = limit
+        self.limit = max(1, limit if limit is not None else (settings or get_settings()).team.history_limit)
+        self._undo: Deque[HistoryRecord] = deque(maxlen=self.limit)
+        self._redo: List[HistoryRecord] = []
+        self._applying = False
+        self.team = team
+        self.team.subscribe(self._on_team_changed)
+
+    def apply_settings(self, settings: Settings):
+        """Aplica un nuevo tamaño máximo conservando los cambios más recientes."""
+        if self._fixed_limit is not None:
+            return
+        limit = max(1, settings.team.history_limit)
+        if limit != self.limit:
+            self.limit = limit
+            self._undo = deque(self._undo, maxlen=limit)
+
+    def set_team(self, team: Team):
+        """Cambia el equipo seguido y vacía el historial."""
+        self.team.unsubscribe(self._on_team_changed)
+        self.team = team
+        self.team.subscribe(self._on_team_changed)
+        self.clear()
+
+    def clear(self):
+        """Vacía el historial."""
+        self._undo.clear()
+        self._redo.clear()
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def _on_team_changed(self, event: TeamEvent):
+        """Registra un cambio del equipo (salvo los que provoca el propio historial)."""
+        if self._applying:
+            return
+        if event.kind == TeamEvent.HEARTS:
+            new = (self.team.current_hearts, self.team.total_hearts)
+            last = self._undo[-1] if self._undo else None
+            if (last is not None and last.kind == TeamEvent.HEARTS and not self._redo
+                    and time.monotonic() - last.timestamp < self.HEARTS_MERGE_WINDOW):
+                last.new = new
+                last.timestamp = time.monotonic()
+                return
+            record = HistoryRecord(event.kind, old=event.old_value, new=new)
+        elif event.kind == TeamEvent.NICKNAME:
+            record = HistoryRecord(event.kind, event.index, old=event.old_value, new=event.pokemon.nickname)
+        elif event.kind == TeamEvent.SPRITE:
+            record = HistoryRecord(event.kind, event.index, old=event.old_value, new=event.pokemon.sprite_url)
+        elif event.kind == TeamEvent.RESET:
+            record = HistoryRecord(event.kind, old=event.old_value, new=list(self.team.pokemon))
+        else:
+            record = HistoryRecord(event.kind, event.index, event.to_index, event.pokemon)
+        self._undo.append(record)
+        self._redo.clear()
+
+    def undo(self) -> bool:
+        """Deshace el último cambio."""
+        if not self._undo:
+            return False
+        record = self._undo.pop()
+        self._apply(record, reverse=True)
+        self._redo.append(record)
+        return True
+
+    def redo(self) -> bool:
+        """Rehace el último cambio deshecho."""
+        if not self._redo:
+            return False
+        record = self._redo.pop()
+        self._apply(record, reverse=False)
+        self._undo.append(record)
+        return True
+
+    def _apply(self, record: HistoryRecord, reverse: bool):
+        """Aplica un registro sobre el equipo en un sentido u otro."""
+        team = self.team
+        self._applying = True
+        try:
+            kind = record.kind
+            if kind == TeamEvent.INSERTED:
+                if reverse:
+                    team.remove_pokemon(record.index)
+                else:
+                    team.insert_pokemon(record.index, record.pokemon)
+            elif kind == TeamEvent.REMOVED:
+                if reverse:
+                    team.insert_pokemon(record.index, record.pokemon)
+                else:
+                    team.remove_pokemon(record.index)
+            elif kind == TeamEvent.MOVED:
+                if reverse:
+                    team.move_pokemon(record.to_index, record.index)
+                else:
+                    team.move_pokemon(record.index, record.to_index)
+            elif kind == TeamEvent.SWAPPED:
+                team.swap_pokemon(record.index, record.to_index)
+            elif kind == TeamEvent.NICKNAME:
+                team.set_nickname(record.index, record.old if reverse else record.new)
+            elif kind == TeamEvent.SPRITE:
+                team.set_sprite_url(record.index, record.old if reverse else record.new)
+            elif kind == TeamEvent.HEARTS:
+                current, total = record.old if reverse else record.new
+                team.set_total_hearts(total)
+                team.set_hearts(current)
+            elif kind == TeamEvent.RESET:
+                team.set_pokemon(record.old if reverse else record.new)
+        finally:
+            self._applying = False
+        self.logger.debug(f"{'Deshecho' if reverse else 'Rehecho'}: {record}")
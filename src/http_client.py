@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+from settings import Settings, get_settings
+
+class HttpClient:
+    """Cliente HTTP singleton compartido por la API y el gestor de assets.
+
+    Mantiene una `requests.Session` con conexiones persistentes por host y
+    reintenta los errores transitorios con backoff exponencial y jitter,
+    respetando la cabecera Retry-After.
+    """
+    _instance = None
+    _initialized = False
+    _instance_lock = threading.Lock()  # Se puede crear a la vez desde la GUI y un hilo de descarga
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __new__(cls, settings: Optional[Settings] = None):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(HttpClient, cls).__new__(cls)
+            return cls._instance
+
+    def __init__(self, settings: Optional[Settings] = None):
+        with HttpClient._instance_lock:
+            if not self._initialized:
+                self.logger = logging.getLogger(__name__)
+                self.apply_settings(settings or get_settings())
+                self._sessions: Dict[str, requests.Session] = {}
+                self._lock = threading.Lock()
+                self._requests = 0
+                self._retries = 0
+                self._sleep = time.sleep
+                self._initialized = True
+
+    def apply_settings(self, settings: Settings):
+        """Aplica la configuración de red (las sesiones ya abiertas conservan su pool)."""
+        self.settings = settings
+        self.max_retries = settings.api.max_retries
+        self.timeout = settings.api.timeout
+        self.pool_size = settings.api.pool_size
+        self.backoff_factor = settings.api.backoff_factor
+        self.max_backoff = settings.api.max_backoff
+
+    def _session_for(self, url: str) -> requests.Session:
+        """Devuelve la sesión persistente del host de la URL."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        """Realiza un GET con reintentos.
+
+        Los errores de conexión y los estados 429/5xx se reintentan hasta
+        `max_retries` veces; si se agotan, se lanza la excepción o se devuelve
+        la última respuesta para que el llamador decida (`raise_for_status`).
+        """
+        session = self._session_for(url)
+        attempt = 0
+        while True:
+            with self._lock:
+                self._requests += 1
+            try:
+                response = session.get(url, headers=headers, timeout=timeout or self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                self.logger.warning(f"Error de red en {url} ({e}), reintentando en {delay:.2f} s")
+            else:
+                if response.status_code not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                self.logger.warning(
+                    f"Respuesta {response.status_code} de {url}, reintentando en {delay:.2f} s"
+                )
+                response.close()
+
+            attempt += 1
+            with self._lock:
+                self._retries += 1
+            self._sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Calcula la espera del reintento con backoff exponencial y jitter completo."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Interpreta la cabecera Retry-After (segundos o fecha HTTP)."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return max(0.0, min(delay, self.max_backoff))
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve los contadores de peticiones, reintentos y uso de conexiones."""
+        opened = 0
+        served = 0
+        with self._lock:
+            for session in self._sessions.values():
+                adapter = session.get_adapter("https://")
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools[key]
+                    opened += pool.num_connections
+                    served += pool.num_requests
+            return {
+                "requests": self._requests,
+                "retries": self._retries,
+                "connections_opened": opened,
+                "connections_reused": max(0, served - opened),
+            }
+
+    def close(self):
+        """Cierra todas las sesiones abiertas."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+import time
+import logging
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import yaml
+
+import storage
+from models import Team
+from settings import Settings, get_settings
+
+@dataclass
+class SaveInfo:
+    """Resumen de un equipo guardado tal como aparece en el índice."""
+    name: str
+    filename: str
+    saved_at: float = 0.0
+    members: List[int] = field(default_factory=list)
+    hearts_current: int = 0
+    hearts_total: int = 0
+
+    @classmethod
+    def from_team(cls, name: str, filename: str, team: Team, saved_at: float) -> 'SaveInfo':
+        """Crea el resumen de un equipo."""
+        return cls(name, filename, saved_at, [p.id for p in team.pokemon],
+                   team.current_hearts, team.total_hearts)
+
+    def to_dict(self) -> dict:
+        """Convierte el resumen a un diccionario para el índice."""
+        return {
+            "name": self.name,
+            "filename": self.filename,
+            "saved_at": self.saved_at,
+            "members": self.members,
+            "hearts": [self.hearts_current, self.hearts_total]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SaveInfo':
+        """Crea un resumen desde una entrada del índice."""
+        current, total = data.get("hearts", [0, 0])
+        return cls(data["name"], data["filename"], data.get("saved_at", 0.0),
+                   list(data.get("members", [])), current, total)
+
+class SaveLibrary:
+    """Biblioteca de equipos guardados con nombre.
+
+    Cada equipo se guarda en su propio archivo del directorio de la biblioteca
+    y un índice pequeño (`index.json`) resume todos los guardados, de modo que
+    listarlos solo lee el índice. El índice se carga la primera vez que se
+    necesita y, si falta o está dañado, se reconstruye leyendo los guardados.
+    """
+
+    INDEX_NAME = "index.json"
+    INDEX_VERSION = 1
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, settings: Optional[Settings] = None):
+        self.logger = logging.getLogger(__name__)
+        if directory is None:
+            directory = (settings or get_settings()).files.save_library
+        self.directory = Path(directory)
+        self.index_path = self.directory / self.INDEX_NAME
+        self._index: Optional[Dict[str, SaveInfo]] = None
+
+    @property
+    def index(self) -> Dict[str, SaveInfo]:
+        """Índice de guardados por nombre (se carga al primer acceso)."""
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self) -> Dict[str, SaveInfo]:
+        """Lee el índice o lo reconstruye si falta o no se puede leer."""
+        try:
+            data = storage.load(self.index_path)
+            if data is not None and data.get("version") == self.INDEX_VERSION:
+                return {e["name"]: SaveInfo.from_dict(e) for e in data.get("saves", [])}
+        except Exception as e:
+            self.logger.warning(f"Índice de equipos dañado, se reconstruye: {e}")
+        return self._rebuild_index()
+
+    def _rebuild_index(self) -> Dict[str, SaveInfo]:
+        """Reconstruye el índice leyendo todos los guardados del directorio."""
+        index: Dict[str, SaveInfo] = {}
+        if not self.directory.is_dir():
+            return index
+        for path in sorted(self.directory.iterdir()):
+            if path.name == self.INDEX_NAME or path.suffix.lower() not in (".yaml", ".yml", ".json"):
+                continue
+            try:
+                data = storage.load(path)
+                team = Team.from_dict(data)
+            except Exception as e:
+                self.logger.error(f"No se pudo leer el guardado {path}: {e}")
+                continue
+            name = (data or {}).get("name") or path.stem
+            index[name] = SaveInfo.from_team(name, path.name, team, path.stat().st_mtime)
+        self.logger.info(f"Índice de equipos reconstruido: {len(index)} guardados")
+        if index:
+            self._write_index(index)
+        return index
+
+    def _write_index(self, index: Dict[str, SaveInfo]):
+        """Escribe el índice de forma atómica."""
+        storage.save(self.index_path, {
+            "version": self.INDEX_VERSION,
+            "saves": [info.to_dict() for info in index.values()]
+        }, storage.FORMAT_JSON)
+
+    def entries(self) -> List[SaveInfo]:
+        """Guardados de la biblioteca, del más reciente al más antiguo."""
+        return sorted(self.index.values(), key=lambda info: info.saved_at, reverse=True)
+
+    def info(self, name: str) -> Optional[SaveInfo]:
+        """Resumen de un guardado por su nombre."""
+        return self.index.get(name)
+
+    def _filename_for(self, name: str) -> str:
+        """Nombre de archivo libre derivado del nombre del equipo."""
+        decomposed = unicodedata.normalize('NFKD', name.lower())
+        slug = re.sub(r'[^a-z0-9]+', '-', decomposed.encode('ascii', 'ignore').decode()).strip('-') or "equipo"
+        used = {info.filename for info in self.index.values()}
+        filename = f"{slug}.yaml"
+        suffix = 2
+        while filename in used or filename == self.INDEX_NAME:
+            filename = f"{slug}-{suffix}.yaml"
+            suffix += 1
+        return filename
+
+    def save(self, name: str, team: Team) -> SaveInfo:
+        """Guarda un equipo con nombre, sustituyendo el guardado anterior del mismo nombre."""
+        previous = self.index.get(name)
+        filename = previous.filename if previous else self._filename_for(name)
+        data = team.to_dict()
+        data["name"] = name
+        storage.save(self.directory / filename, data)
+        info = SaveInfo.from_team(name, filename, team, time.time())
+        self.index[name] = info
+        self._write_index(self.index)
+        self.logger.info(f"Equipo '{name}' guardado en {filename}")
+        return info
+
+    def load(self, name: str) -> Optional[Team]:
+        """Carga un equipo completo por su nombre.
+
+        Devuelve None si no está en el índice o si su archivo falta o no se
+        puede leer (en estos dos casos se avisa en el log).
+        """
+        info = self.index.get(name)
+        if info is None:
+            return None
+        path = self.directory / info.filename
+        try:
+            data = storage.load(path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            self.logger.warning(f"No se pudo leer el equipo '{name}' ({path}): {e}")
+            return None
+        if data is None:
+            self.logger.warning(f"Falta el archivo del equipo '{name}': {path}")
+            return None
+        if not isinstance(data, dict):
+            self.logger.warning(f"El archivo del equipo '{name}' no es un guardado válido: {path}")
+            return None
+        return Team.from_dict(data)
+
+    def delete(self, name: str) -> bool:
+        """Elimina un guardado y su entrada del índice."""
+        info = self.index.pop(name, None)
+        if info is None:
+            return False
+        try:
+            (self.directory / info.filename).unlink()
+        except FileNotFoundError:
+            pass
+        self._write_index(self.index)
+        return True
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
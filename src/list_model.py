@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import List, Optional
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+class PokemonListModel(QAbstractListModel):
+    """Modelo de la lista de especies (nombre y URL) para las vistas de selección.
+
+    Las entradas se cargan de una sola vez con `set_entries`, lo que produce un
+    único reinicio del modelo en lugar de una inserción por elemento, o por
+    páginas con `append_entries` (una inserción por página).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[dict] = []
+        self._names: List[str] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._entries)):
+            return None
+        if role == Qt.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.UserRole:
+            return self._entries[index.row()]['url']
+        return None
+
+    def set_entries(self, entries: List[dict]):
+        """Reemplaza todas las entradas con una única actualización del modelo."""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._names = [entry['name'].title() for entry in self._entries]
+        self.endResetModel()
+
+    def append_entries(self, entries: List[dict]):
+        """Añade un bloque de entradas al final con una única inserción."""
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self._names.extend(entry['name'].title() for entry in entries)
+        self.endInsertRows()
+
+    def entry(self, row: int) -> Optional[dict]:
+        """Devuelve la entrada original (nombre y URL) de una fila."""
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Registro de la aplicación sin bloquear el hilo de la GUI.
+
+Los loggers solo dejan cada registro en una cola (`QueueHandler`); un hilo de
+fondo (`QueueListener`) los formatea y los escribe en `logs/app.log`, que rota
+al llegar a `logging.max_bytes`, y en la consola. El formato puede ser texto o
+JSON (una línea por registro) y los niveles se ajustan por módulo desde la
+sección `logging` de `config/settings.yaml`.
+"""
+
+import sys
+import json
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from settings import Settings, get_settings
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class JsonFormatter(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una sola línea."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+class _QueueHandler(QueueHandler):
+    """`QueueHandler` que conserva la traza de las excepciones por separado.
+
+    El `QueueHandler` estándar mezcla la traza con el mensaje; aquí se guarda en
+    `exc_text` para que el formateador JSON la ponga en su propio campo.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+class LogPipeline:
+    """Configura el logging raíz con una cola y un hilo escritor.
+
+    `start` sustituye los handlers del logger raíz; `apply_settings` aplica en
+    caliente los niveles (el archivo, la rotación y el formato se fijan al
+    arrancar) y `stop` vacía la cola antes de salir.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handlers: List[logging.Handler] = []
+        self._listener: Optional[QueueListener] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._module_levels: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _make_handlers(self) -> List[logging.Handler]:
+        options = self.settings.logging
+        formatter = JsonFormatter() if options.format == "json" else logging.Formatter(TEXT_FORMAT)
+        log_path = Path(self.settings.files.log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handlers: List[logging.Handler] = [RotatingFileHandler(
+            log_path, maxBytes=max(0, options.max_bytes),
+            backupCount=max(0, options.backup_count), encoding="utf-8")]
+        if options.console:
+            handlers.append(logging.StreamHandler(sys.stderr))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        return handlers
+
+    def start(self) -> 'LogPipeline':
+        """Instala la cola en el logger raíz y arranca el hilo escritor."""
+        with self._lock:
+            if self._listener is not None:
+                return self
+            self.handlers = self._make_handlers()
+            self._listener = QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+            self._queue_handler = _QueueHandler(self.queue)
+            root = logging.getLogger()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            root.addHandler(self._queue_handler)
+            self._listener.start()
+        atexit.register(self.stop)
+        self.apply_settings(self.settings)
+        return self
+
+    def apply_settings(self, settings: Settings):
+        """Aplica el nivel general y los niveles por módulo."""
+        self.settings = settings
+        options = settings.logging
+        logging.getLogger().setLevel(_parse_level("logging.level", options.level, logging.INFO))
+        levels = {}
+        for name, level in options.levels.items():
+            parsed = _parse_level(f"logging.levels.{name}", level, None)
+            if parsed is not None:
+                levels[str(name)] = parsed
+        # Los módulos que ya no aparecen vuelven a heredar el nivel general
+        for name in set(self._module_levels) - set(levels):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+        self._module_levels = levels
+
+    def stop(self):
+        """Escribe los registros pendientes y cierra los archivos."""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()  # Procesa lo que queda en la cola
+            self._listener = None
+            logging.getLogger().removeHandler(self._queue_handler)
+            for handler in self.handlers:
+                handler.close()
+        atexit.unregister(self.stop)
+
+def _parse_level(key: str, value, default: Optional[int]) -> Optional[int]:
+    """Convierte un nivel ("DEBUG", "warning", 20) al número de `logging`."""
+    level = logging.getLevelName(str(value).upper()) if not isinstance(value, int) else value
+    if isinstance(level, int):
+        return level
+    logging.getLogger(__name__).warning(f"Nivel de logging no válido para {key}: {value!r}")
+    return default
@@ -1,67 +1,116 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
+_STARTUP = time.perf_counter()  # Antes de cualquier otra importación para medir también las importaciones
+
 import sys
 import logging
 from pathlib import Path
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
-
-from gui import MainWindow
-from models import Team
-from pokeapi import PokeAPIClient
-from assets import AssetManager
-
-def setup_logging():
-    """Configura el sistema de logging."""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("logs/app.log"),
-            logging.StreamHandler()
-        ]
-    )
+from typing import Optional
+
+from profiling import StartupProfiler
+from settings import DEFAULT_PATH, Settings, get_settings
+from log_pipeline import LogPipeline
+
+def setup_logging(settings: Optional[Settings] = None) -> LogPipeline:
+    """Configura el sistema de logging.
+
+    Los registros se escriben desde un hilo de fondo (ver `log_pipeline`), así
+    que registrar desde la GUI no hace E/S en el hilo principal.
+    """
+    return LogPipeline(settings).start()
 
 def main():
-    """Función principal de la aplicación."""
+    """Función principal de la aplicación.
+
+    Solo se prepara lo necesario para mostrar la ventana; el cliente de la API
+    (y con él `requests`) y la lista de especies se cargan tras el primer pintado.
+    """
+    profiler = StartupProfiler.from_environment(sys.argv, start=_STARTUP)
+
     # Configurar logging
-    setup_logging()
-    logger = logging.getLogger(__name__)
-    logger.info("Iniciando Pokemon Team GUI")
+    with profiler.phase("configuración"):
+        settings = get_settings()
+        log_pipeline = setup_logging(settings)
+        logger = logging.getLogger(__name__)
+        logger.info("Iniciando Pokemon Team GUI")
 
-    # Crear directorios necesarios
-    base_dir = Path(__file__).resolve().parent.parent  # Subir un nivel desde src
-    assets_dir = base_dir / "assets" / "cache"
-    saves_dir = base_dir / "saves"
-    assets_dir.mkdir(parents=True, exist_ok=True)
-    saves_dir.mkdir(exist_ok=True)
+        # Crear directorios necesarios
+        base_dir = Path(__file__).resolve().parent.parent  # Subir un nivel desde src
+        assets_dir = base_dir / "assets" / "cache"
+        team_file = base_dir / settings.files.team_save
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        team_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with profiler.phase("importaciones (Qt y GUI)"):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtGui import QIcon
+        from gui import MainWindow
+        from models import Team
+        from autosave import AutoSaver
+        from assets import AssetManager
+        from settings_watcher import SettingsWatcher
 
     # Inicializar la aplicación Qt
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")  # Estilo moderno y consistente
-    
-    # Establecer el ícono de la aplicación
-    app_icon = QIcon(str(base_dir / "assets" / "icon.ico"))
-    app.setWindowIcon(app_icon)
-
-    # Inicializar componentes principales
-    api_client = PokeAPIClient()
-    asset_manager = AssetManager()
-    team_file = saves_dir / "team.yaml"
-    team = Team.load_from_file(str(team_file))
-
-    # Crear y mostrar la ventana principal
-    window = MainWindow(team, api_client, asset_manager)
-    window.setWindowIcon(app_icon)  # Establecer el ícono en la ventana principal
-    window.show()
-
-    # Ejecutar la aplicación
-    sys.exit(app.exec_())
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion")  # Estilo moderno y consistente
+        
+        # Establecer el ícono de la aplicación
+        app_icon = QIcon(str(base_dir / "assets" / "icon.ico"))
+        app.setWindowIcon(app_icon)
+
+    # Inicializar componentes necesarios para la primera pantalla
+    with profiler.phase("carga del equipo"):
+        team = Team.load_from_file(str(team_file))
+        autosaver = AutoSaver(team, team_file, settings=settings)
+        app.aboutToQuit.connect(autosaver.close)
+
+    # Crear y mostrar la ventana principal (la lista se carga después)
+    with profiler.phase("ventana principal"):
+        asset_manager = AssetManager(settings)
+        window = MainWindow(team, None, asset_manager, autosaver, load_list=False, settings=settings)
+        window.setWindowIcon(app_icon)  # Establecer el ícono en la ventana principal
+        window.show()
+
+    # Aplicar en caliente los cambios de config/settings.yaml
+    settings_watcher = SettingsWatcher(DEFAULT_PATH, parent=app)
+    settings_watcher.settings_changed.connect(window.apply_settings)
+    settings_watcher.settings_changed.connect(log_pipeline.apply_settings)
+    shown_at = time.perf_counter()
+    list_requested_at = 0.0
+
+    def on_first_paint():
+        profiler.record("hasta el primer pintado", time.perf_counter() - shown_at)
+        # Dejar que termine el pintado antes del trabajo diferido
+        QTimer.singleShot(0, start_deferred)
+
+    def start_deferred():
+        nonlocal list_requested_at
+        with profiler.phase("cliente de la API"):
+            from pokeapi import PokeAPIClient
+            window.api_client = PokeAPIClient(settings)
+        list_requested_at = time.perf_counter()
+        window.load_pokemon_list()
+
+    def on_first_page(count: int):
+        window.pokemon_list_page_loaded.disconnect(on_first_page)
+        profiler.record("primera página de especies", time.perf_counter() - list_requested_at)
+
+    def on_list_loaded(count: int):
+        profiler.record("lista de especies", time.perf_counter() - list_requested_at)
+        profiler.report()
+
+    window.first_painted.connect(on_first_paint)
+    window.pokemon_list_page_loaded.connect(on_first_page)
+    window.pokemon_list_loaded.connect(on_list_loaded)
+
+    # Ejecutar la aplicación (al salir se escriben los registros pendientes)
+    exit_code = app.exec_()
+    log_pipeline.stop()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
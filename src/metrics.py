@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Límites de los histogramas de tiempos (segundos), de 0.5 ms a 10 s
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+class Counter:
+    """Contador que solo crece (peticiones, aciertos de caché, bytes descargados)."""
+    kind = "counter"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> dict:
+        return {"value": self.value}
+
+    def reset(self):
+        with self._lock:
+            self.value = 0.0
+
+class Gauge:
+    """Valor que sube y baja; con `function` se lee en el momento de exportar."""
+    kind = "gauge"
+
+    def __init__(self, function: Optional[Callable[[], float]] = None):
+        self._lock = threading.Lock()
+        self._value = 0.0
+        self.function = function
+
+    @property
+    def value(self) -> float:
+        if self.function is not None:
+            return float(self.function())
+        return self._value
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def snapshot(self) -> dict:
+        return {"value": self.value}
+
+    def reset(self):
+        with self._lock:
+            self._value = 0.0
+
+class Histogram:
+    """Distribución de valores (normalmente duraciones en segundos).
+
+    Guarda los contadores por intervalo para Prometheus y las últimas
+    `RECENT_SAMPLES` observaciones para calcular percentiles en el diálogo de
+    métricas sin conservar todo el historial.
+    """
+    kind = "histogram"
+    RECENT_SAMPLES = 1024
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(buckets))
+        self.reset()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.max = max(self.max, value)
+            self._recent.append(value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Mide la duración del bloque en segundos."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def percentile(self, fraction: float) -> float:
+        """Percentil de las observaciones recientes (0 si no hay ninguna)."""
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, max(0, math.ceil(fraction * len(samples)) - 1))]
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """Pares (límite, observaciones <= límite), terminando en +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+        total, result = 0, []
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            total += bucket_count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "buckets": {("+Inf" if math.isinf(bound) else repr(bound)): total
+                        for bound, total in self.cumulative_counts()},
+        }
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+            self._recent = deque(maxlen=self.RECENT_SAMPLES)
+
+class MetricsRegistry:
+    """Registro de métricas de la aplicación (contadores, medidores e histogramas).
+
+    Cada métrica se identifica por su nombre y sus etiquetas; pedir dos veces la
+    misma devuelve el mismo objeto, así que los módulos pueden obtenerlas al
+    importarse. Registrar y actualizar son operaciones de memoria protegidas por
+    un lock: se pueden usar desde los hilos del pool y en el camino caliente.
+    Se exporta como JSON (`to_json`) o en el formato de texto de Prometheus
+    (`to_prometheus`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[LabelSet, object]] = {}
+        self._help: Dict[str, str] = {}
+        self._kinds: Dict[str, str] = {}
+
+    def _get(self, factory, kind: str, name: str, help: str, labels: Dict[str, str]):
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            if self._kinds.setdefault(name, kind) != kind:
+                raise ValueError(f"La métrica {name} ya está registrada como {self._kinds[name]}")
+            if help:
+                self._help.setdefault(name, help)
+            series = self._metrics.setdefault(name, {})
+            metric = series.get(key)
+            if metric is None:
+                metric = series[key] = factory()
+            return metric
+
+    def counter(self, name: str, help: str = "", **labels) -> Counter:
+        return self._get(Counter, Counter.kind, name, help, labels)
+
+    def gauge(self, name: str, help: str = "", function: Optional[Callable[[], float]] = None,
+              **labels) -> Gauge:
+        gauge = self._get(Gauge, Gauge.kind, name, help, labels)
+        if function is not None:
+            gauge.function = function
+        return gauge
+
+    def histogram(self, name: str, help: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+                  **labels) -> Histogram:
+        return self._get(lambda: Histogram(buckets), Histogram.kind, name, help, labels)
+
+    def reset(self):
+        """Pone a cero todas las métricas (conservándolas registradas)."""
+        with self._lock:
+            metrics = [metric for series in self._metrics.values() for metric in series.values()]
+        for metric in metrics:
+            metric.reset()
+
+    def _series(self) -> List[Tuple[str, LabelSet, object]]:
+        with self._lock:
+            return [(name, labels, metric)
+                    for name in sorted(self._metrics)
+                    for labels, metric in sorted(self._metrics[name].items())]
+
+    def snapshot(self) -> List[dict]:
+        """Estado actual de todas las series."""
+        return [
+            {"name": name, "type": metric.kind, "help": self._help.get(name, ""),
+             "labels": dict(labels), **metric.snapshot()}
+            for name, labels, metric in self._series()
+        ]
+
+    def to_json(self) -> str:
+        """Exporta en JSON; los valores no finitos se escriben como en Prometheus ("+Inf", "NaN")."""
+        metrics = [{key: _format_value(value) if isinstance(value, float) and not math.isfinite(value)
+                    else value for key, value in metric.items()}
+                   for metric in self.snapshot()]
+        return json.dumps({"timestamp": time.time(), "metrics": metrics},
+                          indent=2, ensure_ascii=False, allow_nan=False)
+
+    def to_prometheus(self) -> str:
+        """Exporta en el formato de texto de Prometheus (versión 0.0.4)."""
+        lines: List[str] = []
+        current = None
+        for name, labels, metric in self._series():
+            if name != current:
+                current = name
+                if self._help.get(name):
+                    lines.append(f"# HELP {name} {_escape_help(self._help[name])}")
+                lines.append(f"# TYPE {name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                for bound, total in metric.cumulative_counts():
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {total}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(metric.sum)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(metric.value)}")
+        return "\n".join(lines) + "\n"
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels) + "}"
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+_registry = MetricsRegistry()
+
+def get_registry() -> MetricsRegistry:
+    """Registro de métricas compartido por toda la aplicación."""
+    return _registry
@@ -2,9 +2,9 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass
-from typing import List, Optional
-import yaml
-from pathlib import Path
+from typing import Any, Callable, List, Optional
+import storage
+from settings import get_settings
 
 @dataclass
 class Pokemon:
@@ -32,60 +32,177 @@ class Pokemon:
         """Crea un Pokemon desde un diccionario."""
         return cls(**data)
 
+@dataclass
+class TeamEvent:
+    """Cambio en un equipo notificado a sus suscriptores.
+
+    `index` es la posición afectada y `to_index` la de destino en los
+    movimientos e intercambios. `old_value` guarda el valor anterior en los
+    cambios de apodo, sprite y corazones.
+    """
+    INSERTED = "inserted"
+    REMOVED = "removed"
+    MOVED = "moved"
+    SWAPPED = "swapped"
+    NICKNAME = "nickname"
+    SPRITE = "sprite"
+    HEARTS = "hearts"
+    RESET = "reset"
+
+    kind: str
+    index: int = -1
+    to_index: int = -1
+    pokemon: Optional[Pokemon] = None
+    old_value: Any = None
+
 class Team:
-    """Clase que representa un equipo de Pokemon."""
-    def __init__(self):
+    """Clase que representa un equipo de Pokemon.
+
+    Todos los cambios del equipo deben hacerse con sus métodos, que notifican
+    un `TeamEvent` a los suscriptores registrados con `subscribe`.
+    """
+    def __init__(self, max_size: Optional[int] = None):
         self.pokemon: List[Pokemon] = []
-        self.max_size = 6
+        self.max_size = max_size if max_size is not None else get_settings().team.max_pokemon
         self.total_hearts = 20  # Número total de corazones
         self.current_hearts = 20  # Corazones actuales
+        self._subscribers: List[Callable[[TeamEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[TeamEvent], None]):
+        """Registra una función que recibirá los cambios del equipo."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[TeamEvent], None]):
+        """Deja de notificar los cambios a una función registrada."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify(self, event: TeamEvent):
+        """Envía un evento a todos los suscriptores."""
+        for callback in list(self._subscribers):
+            callback(event)
 
     def add_pokemon(self, pokemon: Pokemon) -> bool:
         """Añade un Pokemon al equipo si hay espacio."""
-        if len(self.pokemon) < self.max_size:
-            self.pokemon.append(pokemon)
-            return True
-        return False
+        return self.insert_pokemon(len(self.pokemon), pokemon)
+
+    def insert_pokemon(self, index: int, pokemon: Pokemon) -> bool:
+        """Inserta un Pokemon en una posición si hay espacio."""
+        if len(self.pokemon) >= self.max_size:
+            return False
+        index = max(0, min(index, len(self.pokemon)))
+        self.pokemon.insert(index, pokemon)
+        self._notify(TeamEvent(TeamEvent.INSERTED, index, pokemon=pokemon))
+        return True
 
     def remove_pokemon(self, index: int) -> Optional[Pokemon]:
         """Elimina un Pokemon del equipo por su índice."""
         if 0 <= index < len(self.pokemon):
-            return self.pokemon.pop(index)
+            pokemon = self.pokemon.pop(index)
+            self._notify(TeamEvent(TeamEvent.REMOVED, index, pokemon=pokemon))
+            return pokemon
         return None
 
+    def move_pokemon(self, from_index: int, to_index: int) -> bool:
+        """Mueve un Pokemon a otra posición desplazando a los intermedios."""
+        if not (0 <= from_index < len(self.pokemon) and 0 <= to_index < len(self.pokemon)):
+            return False
+        if from_index == to_index:
+            return False
+        pokemon = self.pokemon.pop(from_index)
+        self.pokemon.insert(to_index, pokemon)
+        self._notify(TeamEvent(TeamEvent.MOVED, from_index, to_index, pokemon))
+        return True
+
+    def swap_pokemon(self, index_a: int, index_b: int) -> bool:
+        """Intercambia las posiciones de dos Pokemon."""
+        if not (0 <= index_a < len(self.pokemon) and 0 <= index_b < len(self.pokemon)):
+            return False
+        if index_a == index_b:
+            return False
+        self.pokemon[index_a], self.pokemon[index_b] = self.pokemon[index_b], self.pokemon[index_a]
+        self._notify(TeamEvent(TeamEvent.SWAPPED, index_a, index_b))
+        return True
+
+    def set_nickname(self, index: int, nickname: str) -> bool:
+        """Cambia el apodo del Pokemon de una posición."""
+        if not 0 <= index < len(self.pokemon):
+            return False
+        pokemon = self.pokemon[index]
+        if pokemon.nickname == nickname:
+            return False
+        old_nickname = pokemon.nickname
+        pokemon.nickname = nickname
+        self._notify(TeamEvent(TeamEvent.NICKNAME, index, pokemon=pokemon, old_value=old_nickname))
+        return True
+
+    def set_sprite_url(self, index: int, sprite_url: str) -> bool:
+        """Cambia la URL del sprite del Pokemon de una posición."""
+        if not 0 <= index < len(self.pokemon):
+            return False
+        pokemon = self.pokemon[index]
+        if pokemon.sprite_url == sprite_url:
+            return False
+        old_url = pokemon.sprite_url
+        pokemon.sprite_url = sprite_url
+        self._notify(TeamEvent(TeamEvent.SPRITE, index, pokemon=pokemon, old_value=old_url))
+        return True
+
+    def clear(self):
+        """Elimina todos los Pokemon del equipo."""
+        if self.pokemon:
+            self.set_pokemon([])
+
+    def set_pokemon(self, pokemon: List[Pokemon]):
+        """Sustituye todos los Pokemon del equipo."""
+        old_pokemon = self.pokemon
+        self.pokemon = list(pokemon[:self.max_size])
+        self._notify(TeamEvent(TeamEvent.RESET, old_value=old_pokemon))
+
     def set_hearts(self, count: int):
         """Establece el número de corazones actual."""
-        self.current_hearts = max(0, min(count, self.total_hearts))
+        self._set_hearts(self.total_hearts, count)
 
     def set_total_hearts(self, total: int):
         """Establece el número total de corazones."""
+        self._set_hearts(total, self.current_hearts)
+
+    def _set_hearts(self, total: int, current: int):
+        """Aplica los corazones totales y actuales y notifica si cambian."""
+        old_value = (self.current_hearts, self.total_hearts)
         self.total_hearts = max(1, total)
-        self.current_hearts = min(self.current_hearts, self.total_hearts)
+        self.current_hearts = max(0, min(current, self.total_hearts))
+        if (self.current_hearts, self.total_hearts) != old_value:
+            self._notify(TeamEvent(TeamEvent.HEARTS, old_value=old_value))
 
-    def save_to_file(self, filename: str):
-        """Guarda el equipo en un archivo YAML."""
-        data = {
+    def to_dict(self) -> dict:
+        """Convierte el equipo a un diccionario para serialización."""
+        return {
             "pokemon": [p.to_dict() for p in self.pokemon],
             "hearts": {
                 "total": self.total_hearts,
                 "current": self.current_hearts
             }
         }
-        with open(filename, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True)
 
     @classmethod
-    def load_from_file(cls, filename: str) -> 'Team':
-        """Carga un equipo desde un archivo YAML."""
+    def from_dict(cls, data: Optional[dict]) -> 'Team':
+        """Crea un equipo desde un diccionario."""
         team = cls()
-        if Path(filename).exists():
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data:
-                    if "pokemon" in data:
-                        for p_data in data["pokemon"]:
-                            team.add_pokemon(Pokemon.from_dict(p_data))
-                    if "hearts" in data:
-                        team.set_total_hearts(data["hearts"]["total"])
-                        team.set_hearts(data["hearts"]["current"])
+        if data:
+            if "pokemon" in data:
+                team.pokemon = [Pokemon.from_dict(p_data) for p_data in data["pokemon"][:team.max_size]]
+            if "hearts" in data:
+                team.set_total_hearts(data["hearts"]["total"])
+                team.set_hearts(data["hearts"]["current"])
         return team
+
+    def save_to_file(self, filename: str, fmt: Optional[str] = None):
+        """Guarda el equipo de forma atómica (YAML, o JSON si la extensión es .json)."""
+        storage.save(filename, self.to_dict(), fmt)
+
+    @classmethod
+    def load_from_file(cls, filename: str) -> 'Team':
+        """Carga un equipo desde un archivo YAML o JSON."""
+        return cls.from_dict(storage.load(filename))
@@ -1,79 +1,300 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
 import requests
 import logging
-from typing import Dict, List, Optional
-import yaml
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from api_cache import ResponseCache
+from http_client import HttpClient
+from metrics import get_registry
+from settings import Settings, get_settings
+from species import SpeciesIndex, SpeciesRecord
+
+_metrics = get_registry()
+API_REQUESTS = _metrics.counter("api_requests_total", "Peticiones de red a la PokeAPI")
+API_ERRORS = _metrics.counter("api_errors_total", "Peticiones a la PokeAPI fallidas")
+API_LATENCY = _metrics.histogram("api_request_seconds", "Latencia de las peticiones a la PokeAPI")
+API_MEMORY_HITS = _metrics.counter("api_cache_hits_total", "Respuestas servidas sin descargarlas", layer="memory")
+API_DISK_HITS = _metrics.counter("api_cache_hits_total", layer="disk")
+API_REVALIDATED = _metrics.counter("api_cache_hits_total", layer="revalidated")
+API_STALE = _metrics.counter("api_cache_hits_total", layer="stale")
+API_MISSES = _metrics.counter("api_cache_misses_total", "Respuestas que hubo que descargar")
 
 class PokeAPIClient:
     """Cliente singleton para la PokeAPI."""
     _instance = None
     _initialized = False
 
-    def __new__(cls):
+    DEFAULT_SPRITE_URL_TEMPLATE = (
+        "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{id}.png"
+    )
+
+    def __new__(cls, settings: Optional[Settings] = None):
         if cls._instance is None:
             cls._instance = super(PokeAPIClient, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         if not self._initialized:
             self.logger = logging.getLogger(__name__)
-            self._load_config()
-            self._cache: Dict[str, dict] = {}
+            self.settings = settings or get_settings()
+            self.apply_settings(self.settings)
+            self.cache_file = self.settings.api.cache_file
+            self.http = HttpClient(self.settings)
+            # Caché en memoria: clave -> (momento de validación, datos)
+            self._cache: Dict[str, Tuple[float, Any]] = {}
+            self.response_cache = ResponseCache(self.cache_file, self.cache_max_size)
+            self.species = SpeciesIndex()
             self._initialized = True
 
-    def _load_config(self):
-        """Carga la configuración desde el archivo YAML."""
-        config_path = Path("config/settings.yaml")
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                self.base_url = config['api']['base_url']
-                self.cache_timeout = config['api']['cache_timeout']
-                self.max_retries = config['api']['max_retries']
-        else:
-            self.logger.warning("Archivo de configuración no encontrado, usando valores por defecto")
-            self.base_url = "https://pokeapi.co/api/v2"
-            self.cache_timeout = 3600
-            self.max_retries = 3
+    def apply_settings(self, settings: Settings):
+        """Aplica la configuración de la API (la ruta de la caché persistente solo al crearla)."""
+        self.settings = settings
+        self.base_url = settings.api.base_url
+        self.cache_timeout = settings.api.cache_timeout
+        self.max_retries = settings.api.max_retries
+        self.cache_max_size = settings.api.cache_max_size
+        self.sprite_url_template = settings.api.sprite_url_template or self.DEFAULT_SPRITE_URL_TEMPLATE
+        self.list_page_size = max(1, settings.api.list_page_size)
+        self.list_workers = max(1, settings.api.list_workers)
+        if self._initialized:
+            self.response_cache.max_size = self.cache_max_size
+            self.http.apply_settings(settings)
 
-    def get_pokemon_list(self) -> List[dict]:
-        """Obtiene la lista de todos los Pokemon disponibles."""
-        cache_key = "pokemon_list"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+    def _get_json(self, endpoint: str, cache_key: Optional[str] = None,
+                  transform: Optional[Callable[[Any], Any]] = None,
+                  keep_in_memory: bool = True) -> Any:
+        """Obtiene un endpoint pasando por la caché en memoria y la persistente.
+
+        Las entradas vigentes (según `cache_timeout`) se sirven sin tocar la red.
+        Las caducadas se revalidan con If-None-Match / If-Modified-Since y, si la
+        red falla, se sirve la copia caducada antes que nada.
+
+        `transform` permite guardar solo una parte de la respuesta bajo
+        `cache_key` (por defecto, la URL del endpoint).
+        """
+        url = f"{self.base_url}/{endpoint}"
+        key = cache_key or url
+
+        cached = self._cache.get(key)
+        if cached and (time.time() - cached[0]) < self.cache_timeout:
+            API_MEMORY_HITS.inc()
+            return cached[1]
+
+        entry = self.response_cache.get(key)
+        if entry and entry.is_fresh(self.cache_timeout):
+            API_DISK_HITS.inc()
+            if keep_in_memory:
+                self._cache[key] = (entry.fetched_at, entry.data)
+            return entry.data
+
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
 
         try:
-            response = requests.get(f"{self.base_url}/pokemon?limit=1000")
+            response = self._request(url, headers)
+            if response.status_code == 304 and entry:
+                API_REVALIDATED.inc()
+                self.logger.debug(f"Respuesta revalidada sin cambios: {url}")
+                self.response_cache.touch(key)
+                if keep_in_memory:
+                    self._cache[key] = (time.time(), entry.data)
+                return entry.data
             response.raise_for_status()
             data = response.json()
-            self._cache[cache_key] = data['results']
-            return data['results']
         except requests.RequestException as e:
-            self.logger.error(f"Error al obtener la lista de Pokemon: {e}")
-            return []
+            API_ERRORS.inc()
+            if entry:
+                API_STALE.inc()
+                self.logger.warning(f"No se pudo revalidar {url}, usando copia en caché: {e}")
+                return entry.data
+            raise
+
+        API_MISSES.inc()
+        if transform is not None:
+            data = transform(data)
+        self.response_cache.put(
+            key, data,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        if keep_in_memory:
+            self._cache[key] = (time.time(), data)
+        return data
+
+    def _request(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET a la API registrando la petición y su latencia en las métricas."""
+        API_REQUESTS.inc()
+        with API_LATENCY.time():
+            return self.http.get(url, headers=headers)
+
+    def get_pokemon_list(self) -> List[dict]:
+        """Obtiene la lista de todos los Pokemon disponibles."""
+        entries: List[dict] = []
+        for page in self.iter_pokemon_list():
+            entries.extend(page)
+        return entries
+
+    def _list_key(self) -> str:
+        """Clave de la caché para la lista completa de especies."""
+        return f"{self.base_url}/pokemon#list"
+
+    def _get_list_page(self, offset: int, limit: int) -> dict:
+        """Descarga una página de la lista sin pasar por la caché."""
+        response = self._request(f"{self.base_url}/pokemon?offset={offset}&limit={limit}")
+        response.raise_for_status()
+        return response.json()
+
+    def iter_pokemon_list(self) -> Iterator[List[dict]]:
+        """Devuelve la lista de especies por páginas, en orden, a medida que llegan.
+
+        Con la lista en caché y vigente se devuelve de una vez sin tocar la red.
+        Si no, se pide la primera página y, con el total (`count`) que informa,
+        el resto se piden a la vez (`list_workers`); si al terminar aún hay
+        `next` (la lista ha crecido mientras tanto) se sigue el enlace. La lista
+        completa se guarda en la caché junto con `count`: una copia caducada
+        con el mismo total se da por buena sin descargar el resto de páginas.
+
+        Si la red falla se usa la copia caducada; sin ella se registra el
+        error y la lista queda con las páginas recibidas (sin guardarse).
+        """
+        key = self._list_key()
+        cached = self._cache.get(key)
+        if cached and (time.time() - cached[0]) < self.cache_timeout:
+            API_MEMORY_HITS.inc()
+            yield cached[1]['results']
+            return
+
+        entry = self.response_cache.get(key)
+        if entry and entry.is_fresh(self.cache_timeout):
+            API_DISK_HITS.inc()
+            self._cache[key] = (entry.fetched_at, entry.data)
+            yield entry.data['results']
+            return
+
+        page_size = self.list_page_size
+        try:
+            first = self._get_list_page(0, page_size)
+        except (requests.RequestException, ValueError) as e:
+            API_ERRORS.inc()
+            if entry:
+                API_STALE.inc()
+                self.logger.warning(f"No se pudo revalidar la lista de Pokemon, usando copia en caché: {e}")
+                yield entry.data['results']
+            else:
+                self.logger.error(f"Error al obtener la lista de Pokemon: {e}")
+            return
+
+        count = first.get('count', 0)
+        if entry and entry.data.get('count') == count:
+            API_REVALIDATED.inc()
+            self.logger.debug(f"Lista de Pokemon sin cambios ({count} especies)")
+            self.response_cache.touch(key)
+            self._cache[key] = (time.time(), entry.data)
+            yield entry.data['results']
+            return
+
+        results = list(first['results'])
+        yield first['results']
+        next_url = first.get('next')
+        offsets = range(page_size, count, page_size) if next_url else range(0)
+        try:
+            with ThreadPoolExecutor(max_workers=self.list_workers) as executor:
+                pages = executor.map(lambda offset: self._get_list_page(offset, page_size), offsets)
+                for page in pages:  # `map` conserva el orden de las páginas
+                    results.extend(page['results'])
+                    next_url = page.get('next')
+                    yield page['results']
+            while next_url:
+                response = self._request(next_url)
+                response.raise_for_status()
+                page = response.json()
+                results.extend(page['results'])
+                next_url = page.get('next')
+                yield page['results']
+        except (requests.RequestException, ValueError) as e:
+            API_ERRORS.inc()
+            self.logger.error(f"Error al obtener la lista de Pokemon ({len(results)} de {count}): {e}")
+            return
+
+        API_MISSES.inc()
+        data = {'count': max(count, len(results)), 'results': results}
+        self.response_cache.put(key, data)
+        self._cache[key] = (time.time(), data)
 
     def get_pokemon_details(self, pokemon_id: int) -> Optional[dict]:
-        """Obtiene los detalles de un Pokemon específico."""
-        cache_key = f"pokemon_{pokemon_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        """Obtiene el documento completo de un Pokemon específico.
 
+        El documento puede ocupar cientos de KB; para nombre, sprite y tipos
+        usar `get_species`, que solo conserva el registro compacto.
+        """
         try:
-            response = requests.get(f"{self.base_url}/pokemon/{pokemon_id}")
-            response.raise_for_status()
-            data = response.json()
-            self._cache[cache_key] = data
-            return data
+            return self._get_json(f"pokemon/{pokemon_id}")
         except requests.RequestException as e:
             self.logger.error(f"Error al obtener detalles del Pokemon {pokemon_id}: {e}")
             return None
 
+    def _species_key(self, pokemon_id: int) -> str:
+        """Clave de la caché persistente para el registro compacto de una especie."""
+        return f"{self.base_url}/pokemon/{pokemon_id}#species"
+
+    def get_species(self, pokemon_id: int) -> Optional[SpeciesRecord]:
+        """Obtiene el registro compacto (id, nombre, sprite, tipos) de una especie.
+
+        El documento completo se descarta en cuanto se extrae el registro.
+        """
+        record = self.species.get(pokemon_id)
+        if record is not None:
+            return record
+        try:
+            data = self._get_json(
+                f"pokemon/{pokemon_id}",
+                cache_key=self._species_key(pokemon_id),
+                transform=lambda details: SpeciesRecord.from_details(details).to_dict(),
+                keep_in_memory=False
+            )
+        except requests.RequestException as e:
+            self.logger.error(f"Error al obtener la especie {pokemon_id}: {e}")
+            return None
+        record = SpeciesRecord.from_dict(data)
+        self.species.add(record)
+        return record
+
+    def has_species(self, pokemon_id: int) -> bool:
+        """Indica si el registro de una especie está disponible sin tocar la red."""
+        if pokemon_id in self.species:
+            return True
+        entry = self.response_cache.get(self._species_key(pokemon_id))
+        return entry is not None and entry.is_fresh(self.cache_timeout)
+
+    def resolve_sprite_url(self, pokemon_id: int) -> str:
+        """Obtiene la URL del sprite sin tocar la red.
+
+        Usa el índice de especies si la especie ya se consultó y, si no, la
+        deriva de `sprite_url_template`. Si la URL derivada no existe, el
+        llamador puede recurrir a `get_sprite_url`, que consulta el detalle.
+        """
+        sprite_url = self.species.sprite_url(pokemon_id)
+        if sprite_url:
+            return sprite_url
+        return self.sprite_url_template.format(id=pokemon_id)
+
     def get_sprite_url(self, pokemon_id: int) -> Optional[str]:
-        """Obtiene la URL del sprite de un Pokemon."""
-        details = self.get_pokemon_details(pokemon_id)
-        if details and 'sprites' in details:
-            return details['sprites']['front_default']
+        """Obtiene la URL del sprite de un Pokemon consultando su detalle."""
+        record = self.get_species(pokemon_id)
+        if record and record.sprite_url:
+            return record.sprite_url
         return None
+
+    def clear_cache(self):
+        """Limpia la caché en memoria y la persistente."""
+        self._cache.clear()
+        self.species.clear()
+        self.response_cache.clear()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Precarga de la Pokédex completa para poder usar la aplicación sin conexión.
+
+Descarga el registro compacto de todas las especies y sus sprites en las mismas
+cachés que usa la GUI (la caché persistente de la API y `assets/cache`).
+Lo que ya está en caché se omite, por lo que una ejecución interrumpida
+continúa donde se quedó.
+
+Con `--atlas` se empaquetan además los sprites en un atlas que la GUI carga al
+arrancar sin decodificar cada PNG.
+
+Uso: python src/prefetch.py [--workers N] [--no-sprites] [--limit N] [--atlas]
+"""
+
+import sys
+import time
+import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Optional
+
+from pokeapi import PokeAPIClient
+from assets import AssetManager
+from settings import get_settings
+
+@dataclass
+class PrefetchReport:
+    """Resumen de una ejecución de la precarga."""
+    species: int = 0
+    details_fetched: int = 0
+    details_cached: int = 0
+    sprites_downloaded: int = 0
+    sprites_cached: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Especies procesadas por segundo."""
+        return self.species / self.elapsed if self.elapsed > 0 else 0.0
+
+def prefetch(api_client: PokeAPIClient, asset_manager: Optional[AssetManager],
+             workers: int = 8, limit: Optional[int] = None) -> PrefetchReport:
+    """Precarga detalles y sprites de todas las especies con concurrencia limitada.
+
+    Si `asset_manager` es None solo se precargan los detalles.
+    """
+    logger = logging.getLogger(__name__)
+    report = PrefetchReport()
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    pokemon_list = api_client.get_pokemon_list()
+    if limit is not None:
+        pokemon_list = pokemon_list[:limit]
+    total = len(pokemon_list)
+    logger.info(f"Precargando {total} especies con {workers} descargas simultáneas")
+
+    def process(entry: dict):
+        pokemon_id = int(entry['url'].rstrip('/').split('/')[-1])
+        cached = api_client.has_species(pokemon_id)
+        record = api_client.get_species(pokemon_id)
+        if record is None:
+            raise ValueError(f"No se pudieron obtener los detalles de {entry['name']}")
+        sprite_url = record.sprite_url
+        downloaded = None
+        if asset_manager is not None and sprite_url:
+            downloaded = asset_manager.prefetch_sprite(sprite_url)
+        with lock:
+            report.species += 1
+            if cached:
+                report.details_cached += 1
+            else:
+                report.details_fetched += 1
+            if downloaded is True:
+                report.sprites_downloaded += 1
+            elif downloaded is False:
+                report.sprites_cached += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(process, entry): entry for entry in pokemon_list}
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                future.result()
+            except Exception as e:
+                with lock:
+                    report.errors += 1
+                logger.error(f"Error al precargar {futures[future]['name']}: {e}")
+            if done % 50 == 0 or done == total:
+                elapsed = time.perf_counter() - start
+                logger.info(f"{done}/{total} especies ({done / elapsed:.1f} especies/s)")
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def main(argv=None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    from main import setup_logging
+
+    parser = argparse.ArgumentParser(description="Precarga la Pokédex para usarla sin conexión.")
+    parser.add_argument("--workers", type=int, default=8, help="descargas simultáneas (por defecto 8)")
+    parser.add_argument("--no-sprites", action="store_true", help="no descargar los sprites")
+    parser.add_argument("--limit", type=int, default=None, help="precargar solo las N primeras especies")
+    parser.add_argument("--atlas", action="store_true", help="empaquetar los sprites en un atlas al terminar")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    setup_logging(settings)
+    logger = logging.getLogger(__name__)
+
+    api_client = PokeAPIClient(settings)
+    asset_manager = None if args.no_sprites else AssetManager(settings)
+    report = prefetch(api_client, asset_manager, workers=max(1, args.workers), limit=args.limit)
+
+    logger.info(
+        f"Precarga completada en {report.elapsed:.1f} s: {report.species} especies "
+        f"({report.throughput:.1f}/s), detalles {report.details_fetched} descargados / "
+        f"{report.details_cached} en caché, sprites {report.sprites_downloaded} descargados / "
+        f"{report.sprites_cached} en caché, {report.errors} errores"
+    )
+    if args.atlas and asset_manager is not None:
+        asset_manager.build_atlas()
+    return 1 if report.errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
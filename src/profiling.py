@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import logging
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+class StartupProfiler:
+    """Traza opcional del tiempo de arranque por fases.
+
+    Se activa con la variable de entorno `POKEMON_PROFILE_STARTUP=1` o con la
+    opción `--profile-startup`. Cada fase registra su duración y `report`
+    escribe el resumen en el log; desactivado, solo cuesta una comprobación.
+    """
+
+    ENV_VAR = "POKEMON_PROFILE_STARTUP"
+    FLAG = "--profile-startup"
+
+    def __init__(self, enabled: bool = False, start: Optional[float] = None):
+        self.enabled = enabled
+        self.start = start if start is not None else time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.logger = logging.getLogger(__name__)
+        self._reported = False
+
+    @classmethod
+    def from_environment(cls, argv: List[str], start: Optional[float] = None) -> 'StartupProfiler':
+        """Crea el perfilador según el entorno; quita la opción de `argv` si está."""
+        enabled = os.environ.get(cls.ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+        if cls.FLAG in argv:
+            argv.remove(cls.FLAG)
+            enabled = True
+        return cls(enabled, start)
+
+    def record(self, name: str, seconds: float):
+        """Registra la duración de una fase."""
+        if self.enabled:
+            self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Mide el bloque como una fase del arranque."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def since_start(self) -> float:
+        """Segundos transcurridos desde el inicio del arranque."""
+        return time.perf_counter() - self.start
+
+    def report(self):
+        """Escribe en el log el resumen de fases (una sola vez)."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        lines = [f"  {name:<28} {seconds * 1000:8.1f} ms" for name, seconds in self.phases]
+        self.logger.info("Perfil de arranque:\n" + "\n".join(lines) +
+                         f"\n  {'total':<28} {self.since_start() * 1000:8.1f} ms")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import bisect
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Set
+from PyQt5.QtCore import QAbstractProxyModel, QModelIndex, Qt
+
+def normalize(text: str) -> str:
+    """Normaliza un nombre: minúsculas, sin acentos y solo caracteres alfanuméricos."""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in decomposed if c.isalnum())
+
+def trigrams(text: str) -> Set[str]:
+    """Trigramas de un texto normalizado con marcas de inicio y fin."""
+    padded = f"^{text}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameSearchIndex:
+    """Índice de búsqueda de nombres por prefijo, subcadena y aproximada.
+
+    Se construye una vez sobre la lista de nombres. Los prefijos se resuelven
+    con búsqueda binaria sobre los nombres ordenados y las subcadenas y la
+    búsqueda aproximada con un índice invertido de trigramas. Las búsquedas
+    que amplían la anterior (al seguir escribiendo) parten de sus resultados.
+    """
+
+    FUZZY_THRESHOLD = 0.35
+
+    def __init__(self, names: Sequence[str] = ()):
+        self.build(names)
+
+    def build(self, names: Sequence[str]):
+        """Reconstruye el índice para una nueva lista de nombres."""
+        self._names = [normalize(name) for name in names]
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_keys = [self._names[row] for row in order]
+        self._sorted_rows = order
+        self._postings: Dict[str, List[int]] = {}
+        self._trigram_counts: List[int] = []
+        for row, name in enumerate(self._names):
+            self._add_trigrams(row, name)
+        self._last_query = ""
+        self._last_matches: Optional[List[int]] = None
+
+    def extend(self, names: Sequence[str]):
+        """Añade nombres al final sin reconstruir el índice (lista cargada por páginas)."""
+        for name in names:
+            row = len(self._names)
+            key = normalize(name)
+            self._names.append(key)
+            position = bisect.bisect_right(self._sorted_keys, key)
+            self._sorted_keys.insert(position, key)
+            self._sorted_rows.insert(position, row)
+            self._add_trigrams(row, key)
+        self._last_query = ""
+        self._last_matches = None
+
+    def _add_trigrams(self, row: int, name: str):
+        grams = trigrams(name)
+        self._trigram_counts.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(row)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def prefix(self, query: str) -> List[int]:
+        """Filas cuyo nombre empieza por la consulta, en orden alfabético."""
+        query = normalize(query)
+        start = bisect.bisect_left(self._sorted_keys, query)
+        end = bisect.bisect_left(self._sorted_keys, query + '\uffff', lo=start)
+        return self._sorted_rows[start:end]
+
+    def substring(self, query: str) -> List[int]:
+        """Filas cuyo nombre contiene la consulta, en orden de la lista."""
+        query = normalize(query)
+        if not query:
+            return list(range(len(self._names)))
+
+        if self._last_matches is not None and self._last_query and query.startswith(self._last_query):
+            # Búsqueda incremental: solo pueden coincidir los resultados anteriores
+            candidates = self._last_matches
+        elif len(query) >= 3:
+            grams = [query[i:i + 3] for i in range(len(query) - 2)]
+            postings = sorted((self._postings.get(g, []) for g in grams), key=len)
+            if not postings[0]:
+                candidates = []
+            else:
+                common = set(postings[0])
+                for posting in postings[1:]:
+                    common.intersection_update(posting)
+                candidates = sorted(common)
+        else:
+            candidates = range(len(self._names))
+
+        matches = [row for row in candidates if query in self._names[row]]
+        self._last_query = query
+        self._last_matches = matches
+        return matches
+
+    def fuzzy(self, query: str, limit: int = 20) -> List[int]:
+        """Filas con nombres parecidos a la consulta (similitud de trigramas)."""
+        query = normalize(query)
+        if not query:
+            return []
+        grams = trigrams(query)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for row in self._postings.get(gram, ()):
+                shared[row] = shared.get(row, 0) + 1
+        scored = []
+        for row, count in shared.items():
+            score = count / (len(grams) + self._trigram_counts[row] - count)
+            if score >= self.FUZZY_THRESHOLD:
+                scored.append((-score, row))
+        scored.sort()
+        return [row for _, row in scored[:limit]]
+
+    def search(self, query: str) -> List[int]:
+        """Búsqueda combinada ordenada por relevancia.
+
+        Primero los nombres que empiezan por la consulta, después los que la
+        contienen y, si no hay ninguno, los parecidos (para erratas).
+        """
+        if not normalize(query):
+            return list(range(len(self._names)))
+        prefix_rows = self.prefix(query)
+        seen = set(prefix_rows)
+        results = list(prefix_rows)
+        results.extend(row for row in self.substring(query) if row not in seen)
+        if not results:
+            results = self.fuzzy(query)
+        return results
+
+class SearchFilterProxyModel(QAbstractProxyModel):
+    """Modelo proxy que filtra y ordena la lista de especies con un NameSearchIndex.
+
+    Funciona como un QSortFilterProxyModel, pero el filtrado y el orden salen
+    directamente del índice: cada consulta sustituye la tabla de filas visibles
+    sin llamar a filterAcceptsRow/lessThan por cada fila. El índice se
+    reconstruye cuando el modelo de origen se reinicia y se amplía cuando se
+    añaden filas al final (la lista llega por páginas).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_index = NameSearchIndex()
+        self._query = ""
+        self._rows: List[int] = []  # fila del proxy -> fila de origen
+        self._positions: Optional[Dict[int, int]] = None  # fila de origen -> fila del proxy
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelReset.disconnect(self._rebuild_index)
+            previous.rowsInserted.disconnect(self._on_rows_inserted)
+        super().setSourceModel(model)
+        model.modelReset.connect(self._rebuild_index)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Reconstruye el índice a partir de los nombres del modelo de origen."""
+        model = self.sourceModel()
+        names = [model.index(row, 0).data(Qt.DisplayRole) for row in range(model.rowCount())]
+        self.search_index.build(names)
+        self.set_query(self._query)
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """Amplía el índice con las filas nuevas.
+
+        Si las filas visibles solo crecen por el final (sin consulta, o con
+        coincidencias nuevas al final) se insertan sin reiniciar el proxy, de
+        modo que las vistas conservan la selección y el desplazamiento.
+        """
+        if first != len(self.search_index):
+            self._rebuild_index()
+            return
+        model = self.sourceModel()
+        self.search_index.extend([model.index(row, 0).data(Qt.DisplayRole)
+                                  for row in range(first, last + 1)])
+        rows = self.search_index.search(self._query)
+        if rows[:len(self._rows)] != self._rows:
+            self.set_query(self._query)
+            return
+        if len(rows) > len(self._rows):
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(rows) - 1)
+            self._rows = rows
+            self._positions = None
+            self.endInsertRows()
+
+    def set_query(self, query: str):
+        """Aplica una nueva consulta de búsqueda."""
+        self._query = query
+        self.beginResetModel()
+        self._rows = self.search_index.search(query)
+        self._positions = None
+        self.endResetModel()
+
+    def query(self) -> str:
+        return self._query
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows)) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._positions is None:
+            self._positions = {source: proxy for proxy, source in enumerate(self._rows)}
+        row = self._positions.get(source_index.row())
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, source_index.column())
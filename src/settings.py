@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Configuración tipada de la aplicación.
+
+`config/settings.yaml` se lee una sola vez y se convierte en un objeto
+`Settings` con una dataclass por sección. Los componentes reciben ese objeto
+(o usan `get_settings()`) y copian los valores que necesitan en atributos, de
+modo que leer la configuración en las rutas críticas no cuesta nada. Si el
+archivo cambia, `settings_watcher.SettingsWatcher` lo vuelve a leer y emite
+la nueva configuración para que cada componente la aplique con
+`apply_settings`.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import yaml
+
+DEFAULT_PATH = Path("config/settings.yaml")
+
+@dataclass
+class WindowSettings:
+    """Sección `app.window`."""
+    width: int = 800
+    height: int = 600
+    transparency: float = 0.9
+    always_on_top: bool = True
+
+@dataclass
+class AppSettings:
+    """Sección `app`."""
+    name: str = "Pokemon Team GUI"
+    version: str = "1.0.0"
+    window: WindowSettings = field(default_factory=WindowSettings)
+
+@dataclass
+class ApiSettings:
+    """Sección `api`."""
+    base_url: str = "https://pokeapi.co/api/v2"
+    cache_timeout: int = 3600
+    max_retries: int = 3
+    timeout: float = 10
+    pool_size: int = 8
+    backoff_factor: float = 0.5
+    max_backoff: float = 30
+    sprite_url_template: str = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{id}.png"
+    cache_file: str = "assets/cache/api_cache.sqlite"
+    cache_max_size: int = 50 * 1024 * 1024
+    list_page_size: int = 200
+    list_workers: int = 4
+
+@dataclass
+class SpriteSettings:
+    """Sección `sprites`."""
+    size: int = 96
+    format: str = "png"
+    cache_dir: str = "assets/cache"
+    download_workers: int = 4
+    memory_budget: int = 32 * 1024 * 1024
+    disk_cache_size: int = 200 * 1024 * 1024
+
+@dataclass
+class TeamSettings:
+    """Sección `team`."""
+    max_pokemon: int = 6
+    default_nickname: str = ""
+    history_limit: int = 200
+
+@dataclass
+class FileSettings:
+    """Sección `files`."""
+    team_save: str = "saves/team.yaml"
+    log_file: str = "logs/app.log"
+    save_library: str = "saves/teams"
+    autosave_delay: int = 1000
+
+@dataclass
+class LoggingSettings:
+    """Sección `logging`."""
+    level: str = "INFO"
+    format: str = "text"  # "text" o "json"
+    max_bytes: int = 5 * 1024 * 1024
+    backup_count: int = 5
+    console: bool = True
+    levels: dict = field(default_factory=dict)  # nivel por módulo, p. ej. {"pokeapi": "DEBUG"}
+
+@dataclass
+class Settings:
+    """Configuración completa de la aplicación."""
+    app: AppSettings = field(default_factory=AppSettings)
+    api: ApiSettings = field(default_factory=ApiSettings)
+    sprites: SpriteSettings = field(default_factory=SpriteSettings)
+    team: TeamSettings = field(default_factory=TeamSettings)
+    files: FileSettings = field(default_factory=FileSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> 'Settings':
+        """Crea la configuración desde el contenido del YAML.
+
+        Las claves desconocidas se ignoran y los valores que no se pueden
+        convertir al tipo esperado conservan el valor por defecto.
+        """
+        return _build(cls, data or {}, "")
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_PATH) -> 'Settings':
+        """Lee la configuración de un archivo YAML (valores por defecto si no existe)."""
+        path = Path(path)
+        if not path.exists():
+            logging.getLogger(__name__).warning(
+                f"Archivo de configuración {path} no encontrado, usando valores por defecto")
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(yaml.safe_load(f))
+
+def _build(section_cls, data: Any, prefix: str):
+    """Construye una sección convirtiendo cada valor al tipo anotado en su campo."""
+    section = section_cls()
+    if not isinstance(data, dict):
+        if data is not None:
+            logging.getLogger(__name__).warning(f"Sección de configuración '{prefix}' no válida")
+        return section
+    for f in fields(section_cls):
+        if f.name not in data:
+            continue
+        raw = data[f.name]
+        key = f"{prefix}{f.name}"
+        if is_dataclass(f.type):
+            setattr(section, f.name, _build(f.type, raw, f"{key}."))
+            continue
+        try:
+            if f.type is bool:
+                value = raw if isinstance(raw, bool) else str(raw).lower() in ("1", "true", "yes", "on")
+            elif f.type in (int, float) and isinstance(raw, bool):
+                raise TypeError("se esperaba un número")
+            else:
+                value = f.type(raw)
+        except (TypeError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"Valor de configuración no válido para {key}: {raw!r} ({e})")
+            continue
+        setattr(section, f.name, value)
+    return section
+
+_current: Optional[Settings] = None
+_lock = threading.Lock()
+
+def get_settings() -> Settings:
+    """Configuración actual; se lee del archivo la primera vez que se pide."""
+    global _current
+    if _current is None:
+        with _lock:
+            if _current is None:
+                _current = Settings.load(DEFAULT_PATH)
+    return _current
+
+def set_settings(settings: Settings):
+    """Sustituye la configuración actual (al recargar el archivo o en pruebas)."""
+    global _current
+    with _lock:
+        _current = settings
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from settings import DEFAULT_PATH, Settings, get_settings, set_settings
+
+class SettingsWatcher(QObject):
+    """Vigila el archivo de configuración y lo recarga cuando cambia.
+
+    Los editores suelen guardar varias veces o sustituir el archivo, así que
+    los avisos se agrupan durante `delay_ms` y la ruta se vuelve a vigilar en
+    cada cambio. Una configuración que no se puede leer se ignora.
+    """
+    settings_changed = pyqtSignal(object)  # Settings
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH, delay_ms: int = 200, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.addPath(str(self.path))
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.reload)
+
+    def _on_file_changed(self, path: str):
+        """Programa la recarga y vuelve a vigilar el archivo si se sustituyó."""
+        if str(self.path) not in self._watcher.files() and self.path.exists():
+            self._watcher.addPath(str(self.path))
+        self._timer.start()
+
+    def reload(self) -> Optional[Settings]:
+        """Vuelve a leer el archivo y emite la configuración si ha cambiado."""
+        try:
+            settings = Settings.load(self.path)
+        except Exception as e:
+            self.logger.error(f"No se pudo recargar la configuración {self.path}: {e}")
+            return None
+        if settings == get_settings():
+            return None
+        set_settings(settings)
+        self.logger.info(f"Configuración recargada desde {self.path}")
+        self.settings_changed.emit(settings)
+        return settings
+
+    def close(self):
+        """Deja de vigilar el archivo."""
+        self._timer.stop()
+        self._watcher.removePaths(self._watcher.files())
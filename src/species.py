@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+class SpeciesRecord:
+    """Datos mínimos de una especie extraídos del documento `pokemon/{id}`."""
+    __slots__ = ("id", "name", "sprite_url", "types")
+
+    def __init__(self, id: int, name: str, sprite_url: str = "", types: Tuple[str, ...] = ()):
+        self.id = id
+        self.name = name
+        self.sprite_url = sprite_url
+        self.types = types
+
+    @classmethod
+    def from_details(cls, details: dict) -> 'SpeciesRecord':
+        """Extrae el registro compacto de un documento completo de la PokeAPI."""
+        sprites = details.get('sprites') or {}
+        types = tuple(t['type']['name'] for t in sorted(details.get('types', []),
+                                                         key=lambda t: t.get('slot', 0)))
+        return cls(details['id'], details['name'], sprites.get('front_default') or "", types)
+
+    def to_dict(self) -> dict:
+        """Convierte el registro a un diccionario para serialización."""
+        return {"id": self.id, "name": self.name, "sprite_url": self.sprite_url,
+                "types": list(self.types)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SpeciesRecord':
+        """Crea un registro desde un diccionario."""
+        return cls(data['id'], data['name'], data.get('sprite_url', ""), tuple(data.get('types', ())))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SpeciesRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"SpeciesRecord(id={self.id}, name={self.name!r}, types={self.types})"
+
+class SpeciesIndex:
+    """Índice compacto de especies almacenado por columnas.
+
+    Los ids se guardan en un `array` y el resto de campos en listas paralelas;
+    los nombres de tipo se internan para compartir una sola cadena por tipo.
+    """
+
+    def __init__(self):
+        self._ids = array('l')
+        self._names: List[str] = []
+        self._sprite_urls: List[str] = []
+        self._types: List[Tuple[str, ...]] = []
+        self._rows: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: SpeciesRecord):
+        """Añade o actualiza una especie (las columnas se mantienen alineadas entre hilos)."""
+        types = tuple(sys.intern(t) for t in record.types)
+        with self._lock:
+            row = self._rows.get(record.id)
+            if row is None:
+                self._ids.append(record.id)
+                self._names.append(record.name)
+                self._sprite_urls.append(record.sprite_url)
+                self._types.append(types)
+                self._rows[record.id] = len(self._ids) - 1
+            else:
+                self._names[row] = record.name
+                self._sprite_urls[row] = record.sprite_url
+                self._types[row] = types
+
+    def get(self, pokemon_id: int) -> Optional[SpeciesRecord]:
+        """Obtiene el registro de una especie por su id."""
+        row = self._rows.get(pokemon_id)
+        if row is None:
+            return None
+        return SpeciesRecord(self._ids[row], self._names[row], self._sprite_urls[row], self._types[row])
+
+    def sprite_url(self, pokemon_id: int) -> Optional[str]:
+        """Obtiene la URL del sprite sin construir el registro completo."""
+        row = self._rows.get(pokemon_id)
+        return self._sprite_urls[row] if row is not None else None
+
+    def clear(self):
+        """Vacía el índice."""
+        with self._lock:
+            del self._ids[:]
+            self._names.clear()
+            self._sprite_urls.clear()
+            self._types.clear()
+            self._rows.clear()
+
+    def __contains__(self, pokemon_id: int) -> bool:
+        return pokemon_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._ids)
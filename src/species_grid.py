@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from PyQt5.QtWidgets import QListView, QAbstractItemView, QStyledItemDelegate
+from PyQt5.QtCore import (
+    Qt, QIdentityProxyModel, QMimeData, QModelIndex, QPersistentModelIndex, QSize, QTimer
+)
+from PyQt5.QtGui import QPixmap
+
+from assets import AssetManager
+
+SPECIES_MIME_TYPE = "application/x-pokemon-species"
+
+def species_id_from_url(url: str) -> int:
+    """Número de especie a partir de su URL de la API (`.../pokemon/25/`)."""
+    return int(url.rstrip('/').split('/')[-1])
+
+def decode_species_mime(mime_data: QMimeData) -> Optional[Tuple[int, str]]:
+    """Devuelve (número, nombre) de una especie arrastrada desde la cuadrícula."""
+    if not mime_data.hasFormat(SPECIES_MIME_TYPE):
+        return None
+    try:
+        data = json.loads(bytes(mime_data.data(SPECIES_MIME_TYPE)).decode('utf-8'))
+        return int(data["id"]), str(data["name"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+class SpeciesThumbnailModel(QIdentityProxyModel):
+    """Añade miniaturas y arrastre a la lista de especies.
+
+    La vista solo pide `DecorationRole` de las celdas que pinta, así que los
+    sprites se piden al `AssetManager` a medida que aparecen en pantalla. Las
+    miniaturas escaladas se guardan en una caché LRU pequeña; con
+    `set_visible_rows` se cancelan las cargas de las celdas que ya no se ven y
+    se adelantan, con menos prioridad, las de las filas cercanas. Un sprite
+    que falla no se vuelve a pedir hasta pasados `FAILURE_RETRY_SECONDS` o
+    hasta que se recarga la lista.
+    """
+
+    VISIBLE_PRIORITY = 10
+    PREFETCH_PRIORITY = 0
+    THUMBNAIL_CACHE_SIZE = 512
+    FAILURE_RETRY_SECONDS = 30.0
+
+    def __init__(self, asset_manager: AssetManager, sprite_url_for: Callable[[int], Optional[str]],
+                 icon_size: int = 64, parent=None):
+        super().__init__(parent)
+        self.asset_manager = asset_manager
+        self.sprite_url_for = sprite_url_for
+        self.icon_size = icon_size
+        self.cancelled = 0  # Cargas canceladas al salir de pantalla (para diagnóstico)
+        self._thumbnails: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._requested: Dict[str, QPersistentModelIndex] = {}
+        self._failed: Dict[str, float] = {}  # URL -> instante del fallo
+        self._placeholder: Optional[QPixmap] = None
+        self.asset_manager.sprite_loaded.connect(self._on_sprite_loaded)
+        self.asset_manager.sprite_failed.connect(self._on_sprite_failed)
+        self.modelReset.connect(self._failed.clear)
+
+    def species_id(self, index: QModelIndex) -> Optional[int]:
+        """Número de la especie de una fila."""
+        url = index.data(Qt.UserRole)
+        return species_id_from_url(url) if url else None
+
+    def sprite_url(self, index: QModelIndex) -> Optional[str]:
+        """URL del sprite de la especie de una fila."""
+        species_id = self.species_id(index)
+        return self.sprite_url_for(species_id) if species_id is not None else None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role == Qt.DecorationRole and index.isValid():
+            return self._thumbnail(index)
+        return super().data(index, role)
+
+    def _thumbnail(self, index: QModelIndex) -> Optional[QPixmap]:
+        """Miniatura de la fila; si el sprite no está, lo pide y devuelve el marcador."""
+        url = self.sprite_url(index)
+        if not url:
+            return None
+        thumbnail = self._thumbnails.get(url)
+        if thumbnail is not None:
+            self._thumbnails.move_to_end(url)
+            return thumbnail
+        if self._recently_failed(url):
+            return self._scaled_placeholder()
+        sprite = self.asset_manager.get_sprite_async(url, self.VISIBLE_PRIORITY)
+        if self.asset_manager.is_loading(url):
+            self._requested[url] = QPersistentModelIndex(index)
+            return self._scaled_placeholder()
+        return self._store_thumbnail(url, sprite)
+
+    def _store_thumbnail(self, url: str, sprite: QPixmap) -> QPixmap:
+        """Escala el sprite al tamaño de icono y lo guarda en la caché de miniaturas."""
+        thumbnail = sprite.scaled(self.icon_size, self.icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._thumbnails[url] = thumbnail
+        if len(self._thumbnails) > self.THUMBNAIL_CACHE_SIZE:
+            self._thumbnails.popitem(last=False)
+        return thumbnail
+
+    def _scaled_placeholder(self) -> QPixmap:
+        if self._placeholder is None:
+            self._placeholder = self.asset_manager.get_placeholder().scaled(
+                self.icon_size, self.icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._placeholder
+
+    def _on_sprite_loaded(self, url: str, sprite: QPixmap):
+        """Actualiza solo la celda cuyo sprite ha llegado."""
+        index = self._requested.pop(url, None)
+        if index is None or not index.isValid():
+            return
+        self._store_thumbnail(url, sprite)
+        model_index = QModelIndex(index)
+        self.dataChanged.emit(model_index, model_index, [Qt.DecorationRole])
+
+    def _on_sprite_failed(self, url: str):
+        """Deja el marcador en la celda sin volver a pedir el sprite en cada pintado."""
+        if self._requested.pop(url, None) is not None:
+            self._failed[url] = time.monotonic()
+
+    def _recently_failed(self, url: str) -> bool:
+        """True si el sprite falló hace menos de `FAILURE_RETRY_SECONDS`."""
+        failed_at = self._failed.get(url)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < self.FAILURE_RETRY_SECONDS:
+            return True
+        del self._failed[url]
+        return False
+
+    def set_visible_rows(self, first: int, last: int, margin: int = 0):
+        """Cancela las cargas fuera de [first - margin, last + margin] y adelanta las cercanas."""
+        if first > last:
+            return
+        start, end = max(0, first - margin), min(self.rowCount() - 1, last + margin)
+        keep = {}
+        for row in range(start, end + 1):
+            url = self.sprite_url(self.index(row, 0))
+            if url:
+                keep[url] = row
+        for url in list(self._requested):
+            if url not in keep and self.asset_manager.cancel(url):
+                del self._requested[url]
+                self.cancelled += 1
+        for url, row in keep.items():
+            if (first <= row <= last or url in self._thumbnails or url in self._requested
+                    or self._recently_failed(url)):
+                continue
+            self.asset_manager.get_sprite_async(url, self.PREFETCH_PRIORITY)
+            if self.asset_manager.is_loading(url):
+                self._requested[url] = QPersistentModelIndex(self.index(row, 0))
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemIsDragEnabled
+        return flags
+
+    def mimeTypes(self):
+        return [SPECIES_MIME_TYPE]
+
+    def mimeData(self, indexes) -> QMimeData:
+        """Codifica la especie arrastrada (número y nombre) con su propio tipo MIME."""
+        mime_data = QMimeData()
+        for index in indexes:
+            species_id = self.species_id(index)
+            if species_id is not None:
+                payload = {"id": species_id, "name": index.data(Qt.DisplayRole)}
+                mime_data.setData(SPECIES_MIME_TYPE, json.dumps(payload).encode('utf-8'))
+                break
+        return mime_data
+
+    def supportedDragActions(self) -> Qt.DropActions:
+        return Qt.CopyAction
+
+class FixedSizeDelegate(QStyledItemDelegate):
+    """Delegado con tamaño fijo: la disposición no consulta los datos de ninguna celda.
+
+    `QStyledItemDelegate.sizeHint` lee la miniatura para medir la celda, lo que
+    pediría sprites de filas que no se van a pintar.
+    """
+
+    def __init__(self, size: QSize, parent=None):
+        super().__init__(parent)
+        self.size = size
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.size
+
+class SpeciesGridView(QListView):
+    """Cuadrícula de todas las especies con miniaturas.
+
+    Todas las celdas miden lo mismo, así que la vista solo calcula y pinta las
+    visibles. Al desplazarse (agrupando los cambios en `VISIBLE_DELAY_MS`) se
+    informa al modelo de las filas en pantalla para que cancele y adelante
+    cargas.
+    """
+
+    VISIBLE_DELAY_MS = 30
+    PREFETCH_ROWS = 2  # Filas de la cuadrícula que se adelantan por encima y por debajo
+
+    def __init__(self, icon_size: int = 64, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSpacing(0)
+        self.setIconSize(QSize(icon_size, icon_size))
+        self.setGridSize(QSize(icon_size + 24, icon_size + 24))
+        self.setItemDelegate(FixedSizeDelegate(self.gridSize(), self))
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setDragEnabled(True)
+        self.setDragDropMode(QAbstractItemView.DragOnly)
+        self.setDefaultDropAction(Qt.CopyAction)
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(self.VISIBLE_DELAY_MS)
+        self._visible_timer.timeout.connect(self.update_visible_rows)
+        self.verticalScrollBar().valueChanged.connect(self._visible_timer.start)
+
+    def setModel(self, model):
+        super().setModel(model)
+        if model is not None:
+            model.modelReset.connect(self._visible_timer.start)
+            model.layoutChanged.connect(self._visible_timer.start)
+            model.rowsInserted.connect(lambda *args: self._visible_timer.start())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._visible_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._visible_timer.start()
+
+    def columns(self) -> int:
+        """Celdas por fila de la cuadrícula."""
+        return max(1, self.viewport().width() // self.gridSize().width())
+
+    def visible_rows(self) -> Tuple[int, int]:
+        """Primera y última fila del modelo en pantalla (a partir del tamaño uniforme de celda)."""
+        model = self.model()
+        if model is None or model.rowCount() == 0:
+            return 0, -1
+        columns = self.columns()
+        cell_height = self.gridSize().height()
+        top = self.verticalScrollBar().value()
+        first = (top // cell_height) * columns
+        last = ((top + self.viewport().height()) // cell_height + 1) * columns - 1
+        return first, min(last, model.rowCount() - 1)
+
+    def update_visible_rows(self):
+        """Comunica al modelo las filas visibles para cancelar y adelantar cargas."""
+        model = self.model()
+        if not isinstance(model, SpeciesThumbnailModel) or not self.isVisible():
+            return
+        first, last = self.visible_rows()
+        model.set_visible_rows(first, last, self.PREFETCH_ROWS * self.columns())
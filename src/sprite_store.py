@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import storage
+
+class SpriteStore:
+    """Caché de sprites en disco direccionada por contenido.
+
+    Cada sprite se guarda una sola vez como `<sha256>.png` aunque lo
+    referencien varias URL. Un manifiesto SQLite (`sprites.sqlite`) relaciona
+    cada URL con el hash de su contenido y guarda el tamaño y el último acceso
+    de cada archivo, que se usa para desalojar por LRU al superar `max_size`.
+    Los archivos se escriben de forma atómica y se comprueba su hash al
+    leerlos, así que uno truncado o dañado se descarta y se vuelve a descargar.
+    """
+
+    MANIFEST_NAME = "sprites.sqlite"
+    SUFFIX = ".png"
+
+    def __init__(self, directory: Union[str, Path], max_size: int = 200 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.directory / self.MANIFEST_NAME), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs (accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_urls_hash ON urls (hash);
+            """
+        )
+        self._conn.commit()
+
+    def path_for(self, digest: str) -> Path:
+        """Ruta del archivo con el contenido indicado."""
+        return self.directory / f"{digest}{self.SUFFIX}"
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Devuelve el contenido guardado para la URL si existe y está íntegro."""
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM urls WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        digest = row[0]
+        try:
+            data = self.path_for(digest).read_bytes()
+        except OSError:
+            data = None
+        if data is None or hashlib.sha256(data).hexdigest() != digest:
+            self.logger.warning(f"Sprite en caché ausente o dañado para {url}, se descartará")
+            with self._lock:
+                self._drop_blob(digest)
+                self._conn.commit()
+            return None
+        with self._lock:
+            self._conn.execute("UPDATE blobs SET accessed_at = ? WHERE hash = ?", (time.time(), digest))
+            self._conn.commit()
+        return data
+
+    def put(self, url: str, data: bytes) -> str:
+        """Guarda el contenido de una URL (una sola copia por contenido) y devuelve su hash."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if known is None or not path.exists():
+            # Fuera del candado: las descargas simultáneas escriben en paralelo
+            storage.atomic_write(path, data, durable=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (hash, size, accessed_at) VALUES (?, ?, ?)",
+                (digest, len(data), time.time())
+            )
+            previous = self._conn.execute("SELECT hash FROM urls WHERE url = ?", (url,)).fetchone()
+            self._conn.execute("INSERT OR REPLACE INTO urls (url, hash) VALUES (?, ?)", (url, digest))
+            if previous is not None and previous[0] != digest:
+                self._drop_if_orphan(previous[0])
+            self._evict()
+            self._conn.commit()
+        return digest
+
+    def delete(self, url: str):
+        """Olvida una URL; el archivo se borra si ninguna otra URL lo usa."""
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM urls WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM urls WHERE url = ?", (url,))
+            self._drop_if_orphan(row[0])
+            self._conn.commit()
+
+    def clear(self):
+        """Vacía la caché por completo."""
+        with self._lock:
+            for (digest,) in self._conn.execute("SELECT hash FROM blobs").fetchall():
+                self._unlink(digest)
+            self._conn.execute("DELETE FROM urls")
+            self._conn.execute("DELETE FROM blobs")
+            self._conn.commit()
+
+    def set_max_size(self, max_size: int):
+        """Cambia el tamaño máximo desalojando lo que sobre."""
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+            self._conn.commit()
+
+    def total_size(self) -> int:
+        """Tamaño total en bytes de los archivos guardados."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Estadísticas de la caché: URLs, archivos distintos y bytes."""
+        with self._lock:
+            urls = self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+            blobs, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return {"urls": urls, "files": blobs, "bytes": size, "max_bytes": self.max_size}
+
+    def entries(self) -> List[Tuple[str, str]]:
+        """Pares (URL, hash) guardados, de los más a los menos usados."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT urls.url, urls.hash FROM urls JOIN blobs ON blobs.hash = urls.hash "
+                "ORDER BY blobs.accessed_at DESC, urls.url"
+            ).fetchall()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM urls WHERE url = ?", (url,)).fetchone()
+        return row is not None and self.path_for(row[0]).exists()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def _drop_if_orphan(self, digest: str):
+        """Borra un archivo que ya no referencia ninguna URL."""
+        if self._conn.execute("SELECT 1 FROM urls WHERE hash = ? LIMIT 1", (digest,)).fetchone() is None:
+            self._drop_blob(digest)
+
+    def _drop_blob(self, digest: str):
+        """Borra un archivo y todas las URL que lo referencian."""
+        self._conn.execute("DELETE FROM urls WHERE hash = ?", (digest,))
+        self._conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        self._unlink(digest)
+
+    def _unlink(self, digest: str):
+        try:
+            self.path_for(digest).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"Error al eliminar sprite en caché {digest}: {e}")
+
+    def _evict(self):
+        """Desaloja los archivos menos usados hasta respetar el tamaño máximo."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self._conn.execute(
+            "SELECT hash, size FROM blobs ORDER BY accessed_at ASC, rowid ASC"
+        ).fetchall()
+        # Siempre se conserva el archivo más reciente aunque supere el límite por sí solo
+        for digest, size in rows[:-1]:
+            if total <= self.max_size:
+                break
+            self._drop_blob(digest)
+            total -= size
+            self.logger.debug(f"Sprite desalojado de la caché en disco: {digest}")
+
+    def close(self):
+        """Cierra el manifiesto."""
+        with self._lock:
+            self._conn.close()
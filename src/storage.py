@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Persistencia de archivos de guardado.
+
+Las escrituras son atómicas: el contenido se escribe en un archivo temporal
+del mismo directorio, se sincroniza con disco y se renombra sobre el destino,
+de modo que un cierre inesperado deja el guardado anterior intacto.
+
+El formato se elige por la extensión al guardar (`.json` para JSON compacto,
+cualquier otra para YAML) y se detecta por el contenido al cargar. Para YAML
+se usan el cargador y el volcador en C de libyaml cuando están disponibles.
+"""
+
+import os
+import json
+import stat
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+FORMAT_YAML = "yaml"
+FORMAT_JSON = "json"
+
+# La umask solo se puede leer cambiándola; se lee una vez al importar (antes
+# de que haya hilos escribiendo) para no cambiarla mientras otro crea archivos.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+PathLike = Union[str, Path]
+
+def format_for_path(path: PathLike) -> str:
+    """Formato de guardado que corresponde a la extensión del archivo."""
+    return FORMAT_JSON if Path(path).suffix.lower() == ".json" else FORMAT_YAML
+
+def dumps(data: Any, fmt: str = FORMAT_YAML) -> bytes:
+    """Serializa los datos en el formato indicado."""
+    if fmt == FORMAT_JSON:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if fmt == FORMAT_YAML:
+        return yaml.dump(data, Dumper=SafeDumper, allow_unicode=True).encode("utf-8")
+    raise ValueError(f"Formato de guardado desconocido: {fmt}")
+
+def detect_format(raw: bytes) -> str:
+    """Detecta el formato de un guardado por su contenido."""
+    head = raw.lstrip()[:1]
+    return FORMAT_JSON if head in (b"{", b"[") else FORMAT_YAML
+
+def loads(raw: bytes) -> Any:
+    """Deserializa un guardado detectando su formato."""
+    if detect_format(raw) == FORMAT_JSON:
+        return json.loads(raw.decode("utf-8"))
+    return yaml.load(raw.decode("utf-8"), Loader=SafeLoader)
+
+def atomic_write(path: PathLike, data: bytes, durable: bool = True):
+    """Escribe un archivo de forma atómica (temporal + fsync + rename).
+
+    Con `durable=False` se omiten los fsync: el archivo nunca queda a medias,
+    pero puede perderse en un corte de luz (suficiente para cachés). El archivo
+    conserva los permisos del destino (o los de la umask si es nuevo), no los
+    0600 con los que `mkstemp` crea el temporal.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_name, _target_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_dir(path.parent)
+
+def _target_mode(path: Path) -> int:
+    """Permisos que debe tener el archivo escrito en `path`."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+def _fsync_dir(directory: Path):
+    """Sincroniza el directorio para que el renombrado sobreviva a un corte."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows no permite abrir directorios
+    try:
+        fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def save(path: PathLike, data: Any, fmt: Optional[str] = None):
+    """Guarda los datos de forma atómica; el formato sale de la extensión si no se indica."""
+    atomic_write(path, dumps(data, fmt or format_for_path(path)))
+    logging.getLogger(__name__).debug(f"Guardado escrito en {path}")
+
+def load(path: PathLike) -> Optional[Any]:
+    """Carga un guardado o devuelve None si no existe."""
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    return loads(raw)
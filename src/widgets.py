@@ -1,14 +1,94 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QScrollArea, QPushButton
+import math
+import time
+import logging
+from typing import List, Optional
+from PyQt5.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QScrollArea, QPushButton,
+    QDialog, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem,
+    QHeaderView, QFileDialog, QAbstractItemView
+)
 from PyQt5.QtGui import QPixmap, QPainter
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QRect, QPoint, QTimer, pyqtSignal
 import os
 from pathlib import Path
 
+class HeartStrip(QWidget):
+    """Tira de corazones pintada por un único widget.
+
+    Cada corazón ocupa una celda (corazón + separación). Las celdas llenas y
+    vacías se dibujan como dos mosaicos de un pixmap cacheado, así que el
+    pintado no depende del número de corazones y al cambiar el contador solo
+    se repinta el rectángulo entre el valor anterior y el nuevo.
+    """
+    def __init__(self, heart_full: QPixmap, heart_empty: QPixmap, spacing: int = 1, parent=None):
+        super().__init__(parent)
+        self.heart_full = heart_full
+        self.heart_empty = heart_empty
+        self.count = 0
+        self.total = 0
+        self.cell_size = QSize(max(heart_full.width(), heart_empty.width()) + spacing,
+                               max(heart_full.height(), heart_empty.height(), 1))
+        self._full_tile = self._make_tile(heart_full)
+        self._empty_tile = self._make_tile(heart_empty)
+        self.setFixedSize(0, self.cell_size.height())
+
+    def _make_tile(self, heart: QPixmap) -> QPixmap:
+        """Crea la celda de mosaico con el corazón y su separación."""
+        tile = QPixmap(self.cell_size)
+        tile.fill(Qt.transparent)
+        if not heart.isNull():
+            painter = QPainter(tile)
+            painter.drawPixmap(0, (self.cell_size.height() - heart.height()) // 2, heart)
+            painter.end()
+        return tile
+
+    def cells_rect(self, start: int, end: int) -> QRect:
+        """Rectángulo que ocupan las celdas [start, end)."""
+        width = self.cell_size.width()
+        return QRect(start * width, 0, max(0, end - start) * width, self.cell_size.height())
+
+    def set_total(self, total: int):
+        """Establece el número total de corazones."""
+        self.total = max(0, total)
+        self.count = min(self.count, self.total)
+        self.setFixedWidth(self.total * self.cell_size.width())
+        self.update()
+
+    def set_count(self, count: int):
+        """Establece los corazones llenos repintando solo las celdas que cambian."""
+        count = max(0, min(count, self.total))
+        if count == self.count:
+            return
+        dirty = self.cells_rect(min(count, self.count), max(count, self.count))
+        self.count = count
+        self.update(dirty)
+
+    def heart_pixmap_at(self, index: int) -> QPixmap:
+        """Devuelve el pixmap con el que se dibuja el corazón `index`."""
+        return self.heart_full if index < self.count else self.heart_empty
+
+    def sizeHint(self) -> QSize:
+        return QSize(self.total * self.cell_size.width(), self.cell_size.height())
+
+    def paintEvent(self, event):
+        """Dibuja solo la parte visible y sucia de la tira."""
+        painter = QPainter(self)
+        clip = event.rect()
+        width = self.cell_size.width()
+        for tile, start, end in ((self._full_tile, 0, self.count),
+                                 (self._empty_tile, self.count, self.total)):
+            area = self.cells_rect(start, end).intersected(clip)
+            if not area.isEmpty():
+                painter.drawTiledPixmap(area, tile, QPoint(area.x() % width, 0))
+        painter.end()
+
 class HeartCounter(QWidget):
     """Widget personalizado para mostrar un contador con corazones."""
+    count_changed = pyqtSignal(int)  # Nuevo valor del contador
+
     def __init__(self, total_hearts: int = 20, parent=None):
         super().__init__(parent)
         self.layout = QHBoxLayout(self)
@@ -19,11 +99,12 @@ class HeartCounter(QWidget):
         base_dir = Path(__file__).resolve().parent.parent  # Subir un nivel desde src
         heart_full_path = base_dir / "assets" / "sprites" / "vida.png"
         heart_empty_path = base_dir / "assets" / "sprites" / "vidant.png"
-        print(f"Heart full path: {heart_full_path}, Heart empty path: {heart_empty_path}")
 
         self.heart_full = QPixmap(str(heart_full_path))
         self.heart_empty = QPixmap(str(heart_empty_path))
-        print(f"Heart full loaded: {not self.heart_full.isNull()}, Heart empty loaded: {not self.heart_empty.isNull()}")
+        for path, pixmap in ((heart_full_path, self.heart_full), (heart_empty_path, self.heart_empty)):
+            if pixmap.isNull():
+                logging.getLogger(__name__).warning(f"No se pudo cargar la imagen de corazón {path}")
 
         # Escalar imágenes si es necesario (más pequeñas que los sprites)
         self.heart_size = QSize(16, 16)  # Tamaño reducido
@@ -71,12 +152,11 @@ class HeartCounter(QWidget):
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll_area.setFixedHeight(20)  # Altura fija más pequeña
         
-        # Contenedor para los corazones
-        self.hearts_widget = QWidget(self.scroll_area)
-        self.hearts_layout = QHBoxLayout(self.hearts_widget)
-        self.hearts_layout.setSpacing(1)  # Menos espacio entre corazones
-        self.hearts_layout.setContentsMargins(0, 0, 0, 0)
-        self.scroll_area.setWidget(self.hearts_widget)
+        # Tira de corazones (un único widget pintado a mano)
+        self.heart_strip = HeartStrip(self.heart_full, self.heart_empty, spacing=1)
+        self.heart_strip.set_total(self.max_hearts)
+        self.heart_strip.set_count(self.count)
+        self.scroll_area.setWidget(self.heart_strip)
         
         # Añadir widgets al layout principal
         main_layout.addWidget(self.number_label)
@@ -85,29 +165,22 @@ class HeartCounter(QWidget):
         main_layout.addWidget(plus_button)
         self.layout.addWidget(main_widget)
         
-        # Inicializar corazones
-        self.heart_labels = []
-        for _ in range(self.max_hearts):
-            label = QLabel(self)
-            label.setFixedSize(self.heart_size)  # Fijar tamaño del label
-            label.setPixmap(self.heart_full)
-            self.hearts_layout.addWidget(label)
-            self.heart_labels.append(label)
-            
         # Establecer tamaño máximo del widget
         total_width = (self.heart_size.width() + 1) * total_hearts + 44 + 70  # +44 para los botones, +70 para el número
         self.setMaximumWidth(total_width)
 
     def set_count(self, count: int):
         """Actualiza el contador y los corazones."""
+        old_count = self.count
         self.count = max(0, min(count, self.max_hearts))
         
-        # Actualizar corazones
-        for i, label in enumerate(self.heart_labels):
-            label.setPixmap(self.heart_full if i < self.count else self.heart_empty)
+        # Actualizar corazones (solo se repintan los que cambian)
+        self.heart_strip.set_count(self.count)
         
         # Actualizar contador numérico
         self.number_label.setText(str(self.count))
+        if self.count != old_count:
+            self.count_changed.emit(self.count)
 
     def get_count(self) -> int:
         """Obtiene el valor actual del contador."""
@@ -115,28 +188,12 @@ class HeartCounter(QWidget):
 
     def set_max_hearts(self, total_hearts: int):
         """Establece un nuevo número máximo de corazones."""
-        old_max = self.max_hearts
         self.max_hearts = max(1, total_hearts)
         
-        # Ajustar el contador actual si es necesario
-        self.count = min(self.count, self.max_hearts)
+        # Ajustar la tira de corazones
+        self.heart_strip.set_total(self.max_hearts)
         
-        # Añadir o quitar corazones según sea necesario
-        if total_hearts > old_max:
-            # Añadir corazones
-            for _ in range(total_hearts - old_max):
-                label = QLabel(self)
-                label.setFixedSize(self.heart_size)  # Fijar tamaño del label
-                label.setPixmap(self.heart_empty)
-                self.hearts_layout.addWidget(label)
-                self.heart_labels.append(label)
-        elif total_hearts < old_max:
-            # Quitar corazones
-            for _ in range(old_max - total_hearts):
-                label = self.heart_labels.pop()
-                label.deleteLater()
-        
-        # Actualizar visualización
+        # Actualizar visualización (ajusta el contador al nuevo máximo si es necesario)
         self.set_count(self.count)
 
     def decrease_hearts(self):
@@ -147,4 +204,140 @@ class HeartCounter(QWidget):
     def increase_hearts(self):
         """Aumenta el contador de corazones en uno."""
         if self.count < self.max_hearts:
-            self.set_count(self.count + 1)
\ No newline at end of file
+            self.set_count(self.count + 1)
+
+class TeamPickerDialog(QDialog):
+    """Diálogo para elegir un equipo guardado de la biblioteca.
+
+    Recibe los resúmenes del índice (`SaveInfo`), por lo que abrirlo no lee
+    ningún archivo de equipo.
+    """
+    def __init__(self, entries: List, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Cargar Equipo")
+        self.resize(420, 360)
+        layout = QVBoxLayout(self)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setUniformItemSizes(True)
+        for info in entries:
+            saved_at = time.strftime("%d/%m/%Y %H:%M", time.localtime(info.saved_at))
+            text = (f"{info.name} — {saved_at} — {len(info.members)} Pokemon — "
+                    f"{info.hearts_current}/{info.hearts_total} ♥")
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, info.name)
+            self.list_widget.addItem(item)
+        if entries:
+            self.list_widget.setCurrentRow(0)
+        self.list_widget.itemDoubleClicked.connect(self.accept)
+        layout.addWidget(self.list_widget)
+
+        # Botones
+        buttons = QHBoxLayout()
+        self.open_button = QPushButton("Abrir")
+        self.open_button.setEnabled(bool(entries))
+        cancel_button = QPushButton("Cancelar")
+        buttons.addWidget(self.open_button)
+        buttons.addWidget(cancel_button)
+        layout.addLayout(buttons)
+        self.open_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+
+    def selected_name(self) -> Optional[str]:
+        """Nombre del equipo seleccionado."""
+        item = self.list_widget.currentItem()
+        return item.data(Qt.UserRole) if item else None
+
+class MetricsDialog(QDialog):
+    """Diálogo de depuración con las métricas de la sesión.
+
+    Muestra todas las series del registro (los histogramas con número de
+    muestras, media, p95 y máximo), se refresca cada `REFRESH_MS` mientras está
+    abierto y permite exportarlas en JSON o en formato Prometheus.
+    """
+    REFRESH_MS = 1000
+
+    def __init__(self, registry, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.setWindowTitle("Métricas")
+        self.resize(640, 480)
+        layout = QVBoxLayout(self)
+
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Métrica", "Etiquetas", "Valor"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        # Botones
+        buttons = QHBoxLayout()
+        json_button = QPushButton("Exportar JSON")
+        prometheus_button = QPushButton("Exportar Prometheus")
+        reset_button = QPushButton("Reiniciar")
+        close_button = QPushButton("Cerrar")
+        for button in (json_button, prometheus_button, reset_button, close_button):
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+        json_button.clicked.connect(lambda: self.export("json"))
+        prometheus_button.clicked.connect(lambda: self.export("prometheus"))
+        reset_button.clicked.connect(self.reset)
+        close_button.clicked.connect(self.accept)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._timer.stop()
+
+    @staticmethod
+    def format_value(metric: dict) -> str:
+        """Texto de la columna Valor (tiempos de los histogramas en ms)."""
+        if metric["type"] == "histogram":
+            if not metric["count"]:
+                return "sin muestras"
+            return (f"n={metric['count']}  media {metric['mean'] * 1000:.2f} ms  "
+                    f"p95 {metric['p95'] * 1000:.2f} ms  máx {metric['max'] * 1000:.2f} ms")
+        value = metric["value"]
+        if not math.isfinite(value):
+            return str(value)
+        return str(int(value)) if value == int(value) else f"{value:.3f}"
+
+    def refresh(self):
+        """Vuelve a leer el registro y actualiza la tabla."""
+        metrics = self.registry.snapshot()
+        self.table.setRowCount(len(metrics))
+        for row, metric in enumerate(metrics):
+            labels = ", ".join(f"{key}={value}" for key, value in metric["labels"].items())
+            for column, text in enumerate((metric["name"], labels, self.format_value(metric))):
+                item = QTableWidgetItem(text)
+                if column == 0 and metric["help"]:
+                    item.setToolTip(metric["help"])
+                self.table.setItem(row, column, item)
+
+    def reset(self):
+        """Pone a cero las métricas de la sesión."""
+        self.registry.reset()
+        self.refresh()
+
+    def export(self, fmt: str, path: Optional[str] = None) -> Optional[Path]:
+        """Exporta las métricas (pide el archivo si no se indica)."""
+        if path is None:
+            suffix = "json" if fmt == "json" else "prom"
+            path, _ = QFileDialog.getSaveFileName(self, "Exportar métricas", f"metricas.{suffix}")
+            if not path:
+                return None
+        text = self.registry.to_json() if fmt == "json" else self.registry.to_prometheus()
+        path = Path(path)
+        path.write_text(text, encoding="utf-8")
+        logging.getLogger(__name__).info(f"Métricas exportadas a {path}")
+        return path
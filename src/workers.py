@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Optional
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+_pool: Optional[QThreadPool] = None
+
+def get_thread_pool() -> QThreadPool:
+    """Pool para los Worker de la aplicación.
+
+    No se usa `QThreadPool.globalInstance()`: Qt lo usa por dentro (por ejemplo,
+    para convertir por partes imágenes grandes en `QPixmap.scaled`) y espera a
+    esas tareas sin soltar el GIL. Si un Worker ocupa un hilo del pool global
+    esperando el GIL, la aplicación se queda bloqueada.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+    return _pool
+
+class WorkerSignals(QObject):
+    """Señales emitidas por un Worker; se entregan en el hilo de la GUI."""
+    result = pyqtSignal(object)  # Valor devuelto por la función
+    item = pyqtSignal(object)  # Cada elemento producido por una función generadora
+    error = pyqtSignal(object)  # Excepción lanzada por la función
+    finished = pyqtSignal()
+
+class Worker(QRunnable):
+    """Ejecuta una función en un QThreadPool y notifica el resultado mediante señales."""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Ejecuta la función en el hilo del pool."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error en tarea en segundo plano: {e}")
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+class StreamWorker(Worker):
+    """Ejecuta una función generadora y emite cada elemento con `item` según se produce.
+
+    Al terminar, `result` lleva el número de elementos emitidos.
+    """
+
+    def run(self):
+        """Recorre el generador en el hilo del pool."""
+        count = 0
+        try:
+            for item in self.fn(*self.args, **self.kwargs):
+                self.signals.item.emit(item)
+                count += 1
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error en tarea en segundo plano: {e}")
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(count)
+        finally:
+            self.signals.finished.emit()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+
+# Los módulos de src se importan entre sí de forma plana (como al ejecutar
+# src/main.py), así que tanto la raíz del repositorio como src deben estar en el path.
+ROOT_DIR = Path(__file__).resolve().parent.parent
+for path in (ROOT_DIR, ROOT_DIR / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Gestor de assets falso que registra las peticiones sin descargar nada."""
+
+from typing import Dict, List, Optional, Tuple
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QPixmap, QColor
+
+class FakeAssetManager(QObject):
+    """Imita la interfaz asíncrona de `AssetManager`.
+
+    Las cargas quedan pendientes hasta llamar a `finish`; con `instant=True`
+    todos los sprites están ya en memoria (como con el atlas cargado).
+    """
+    sprite_loaded = pyqtSignal(str, QPixmap)
+    sprite_failed = pyqtSignal(str)
+
+    def __init__(self, instant: bool = False, size: int = 96):
+        super().__init__()
+        self.instant = instant
+        self.sprite = QPixmap(size, size)
+        self.sprite.fill(QColor(200, 40, 40))
+        self.placeholder = QPixmap(size, size)
+        self.placeholder.fill(QColor(0, 0, 0, 0))
+        self.requests: List[Tuple[str, int]] = []
+        self.pending: Dict[str, int] = {}
+        self.cancelled: List[str] = []
+        self.loaded: Dict[str, QPixmap] = {}
+
+    def get_sprite_async(self, url: str, priority: int = 0) -> Optional[QPixmap]:
+        if not url:
+            return None
+        if self.instant or url in self.loaded:
+            return self.loaded.get(url, self.sprite)
+        self.requests.append((url, priority))
+        self.pending[url] = max(priority, self.pending.get(url, priority))
+        return self.placeholder
+
+    def is_loading(self, url: str) -> bool:
+        return url in self.pending
+
+    def cancel(self, url: str) -> bool:
+        if self.pending.pop(url, None) is None:
+            return False
+        self.cancelled.append(url)
+        return True
+
+    def get_placeholder(self) -> QPixmap:
+        return self.placeholder
+
+    def finish(self, url: str):
+        """Completa una carga pendiente y emite `sprite_loaded`."""
+        self.pending.pop(url, None)
+        self.loaded[url] = self.sprite
+        self.sprite_loaded.emit(url, self.sprite)
+
+    def fail(self, url: str):
+        """Hace fallar una carga pendiente y emite `sprite_failed`."""
+        self.pending.pop(url, None)
+        self.sprite_failed.emit(url)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Servidor HTTP local que imita la PokeAPI para las pruebas."""
+
+import json
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+def make_png(width: int = 4, height: int = 4, color: Tuple[int, int, int, int] = (255, 0, 0, 255)) -> bytes:
+    """Genera un PNG RGBA sólido sin depender de Qt."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(color) * width
+    raw = row * height
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw))
+            + chunk(b"IEND", b""))
+
+class FakePokeAPI:
+    """PokeAPI falsa con ETags, paginación, sprites y fallos programables."""
+
+    def __init__(self, species_count: int = 30):
+        self.species_count = species_count
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.not_modified = 0
+        self._failures: List[Tuple[int, Dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def root_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.root_url}/api/v2"
+
+    def sprite_url(self, pokemon_id: int) -> str:
+        return f"{self.root_url}/sprites/pokemon/{pokemon_id}.png"
+
+    def start(self) -> "FakePokeAPI":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def fail_next(self, status: int, count: int = 1, headers: Optional[Dict[str, str]] = None):
+        """Hace que las próximas `count` peticiones respondan con `status`."""
+        with self._lock:
+            self._failures.extend([(status, headers or {})] * count)
+
+    def request_count(self, prefix: str = "") -> int:
+        with self._lock:
+            return sum(1 for path, _ in self.requests if path.startswith(prefix))
+
+    def species_name(self, pokemon_id: int) -> str:
+        return f"species-{pokemon_id}"
+
+    def detail(self, pokemon_id: int) -> dict:
+        return {
+            "id": pokemon_id,
+            "name": self.species_name(pokemon_id),
+            "types": [{"slot": 1, "type": {"name": "normal", "url": ""}}],
+            "moves": [{"move": {"name": f"move-{i}", "url": ""}} for i in range(50)],
+            "sprites": {"front_default": self.sprite_url(pokemon_id)},
+        }
+
+    def _list_page(self, query: Dict[str, List[str]]) -> dict:
+        limit = int(query.get("limit", ["20"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        ids = range(offset + 1, min(offset + limit, self.species_count) + 1)
+        next_url = None
+        if offset + limit < self.species_count:
+            next_url = f"{self.base_url}/pokemon?offset={offset + limit}&limit={limit}"
+        return {
+            "count": self.species_count,
+            "next": next_url,
+            "previous": None,
+            "results": [
+                {"name": self.species_name(i), "url": f"{self.base_url}/pokemon/{i}/"}
+                for i in ids
+            ],
+        }
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Cabeceras y cuerpo van en escrituras separadas: sin esto, Nagle y el ACK
+            # retardado añaden ~40 ms a cada respuesta en conexiones persistentes
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", content_type: str = "application/json",
+                      headers: Optional[Dict[str, str]] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                with fake._lock:
+                    fake.requests.append((self.path, dict(self.headers)))
+                    failure = fake._failures.pop(0) if fake._failures else None
+                if failure:
+                    self._send(failure[0], b"{}", headers=failure[1])
+                    return
+
+                parts = parsed.path.strip("/").split("/")
+                if parsed.path.startswith("/sprites/pokemon/"):
+                    pokemon_id = int(parts[-1].split(".")[0])
+                    if pokemon_id > fake.species_count:
+                        self._send(404, b"")
+                        return
+                    self._send(200, make_png(color=(pokemon_id % 256, 0, 0, 255)), "image/png")
+                    return
+
+                if parts[:3] == ["api", "v2", "pokemon"] and len(parts) == 3:
+                    payload = fake._list_page(parse_qs(parsed.query))
+                elif parts[:3] == ["api", "v2", "pokemon"] and len(parts) == 4:
+                    pokemon_id = int(parts[3])
+                    if pokemon_id > fake.species_count:
+                        self._send(404, b"{}")
+                        return
+                    payload = fake.detail(pokemon_id)
+                else:
+                    self._send(404, b"{}")
+                    return
+
+                body = json.dumps(payload).encode("utf-8")
+                etag = f'"{zlib.crc32(body):08x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    with fake._lock:
+                        fake.not_modified += 1
+                    self._send(304, headers={"ETag": etag})
+                    return
+                self._send(200, body, headers={"ETag": etag})
+
+        return Handler
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import gc
+import weakref
+import unittest
+import tempfile
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QPixmap
+from src.assets import AssetManager, SpriteCache
+from metrics import get_registry
+from settings import Settings
+from fake_pokeapi import FakePokeAPI, make_png
+
+class TestSpriteCache(unittest.TestCase):
+    """Pruebas para la caché LRU de sprites en memoria."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.pixmap = QPixmap(10, 10)
+        self.size = SpriteCache.pixmap_bytes(self.pixmap)
+        self.cache = SpriteCache(max_bytes=self.size * 2)
+
+    def test_pixmap_bytes(self):
+        """Prueba el cálculo de memoria a partir de ancho, alto y profundidad."""
+        self.assertEqual(self.size, 10 * 10 * self.pixmap.depth() // 8)
+
+    def test_lru_eviction(self):
+        """Prueba que se desaloja el sprite menos usado al superar el presupuesto."""
+        self.cache.put("a", self.pixmap)
+        self.cache.put("b", self.pixmap)
+        self.cache.get("a")
+        self.cache.put("c", self.pixmap)
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.cache.current_bytes, self.size * 2)
+
+    def test_pinned_not_evicted(self):
+        """Prueba que los sprites fijados no se desalojan."""
+        self.cache.put("a", self.pixmap)
+        self.cache.put("b", self.pixmap)
+        self.cache.set_pinned(["a"])
+        self.cache.put("c", self.pixmap)
+        self.cache.put("d", self.pixmap)
+        self.assertIn("a", self.cache)
+        self.assertIn("d", self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_stats(self):
+        """Prueba las estadísticas de aciertos, fallos y desalojos."""
+        self.cache.put("a", self.pixmap)
+        self.cache.get("a")
+        self.cache.get("missing")
+        for key in ("b", "c"):
+            self.cache.put(key, self.pixmap)
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["bytes"], self.size * 2)
+
+class TestAssetManager(unittest.TestCase):
+    """Pruebas para el gestor de sprites."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication y el servidor local para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+        cls.server = FakePokeAPI(species_count=30).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.settings = Settings()
+        self.settings.sprites.cache_dir = self.tmp_dir.name
+        self.manager = AssetManager(self.settings)
+        self.server.requests.clear()
+        self.loaded = []
+        self.failed = []
+        self.manager.sprite_loaded.connect(lambda url, pixmap: self.loaded.append((url, pixmap)))
+        self.manager.sprite_failed.connect(self.failed.append)
+
+    def tearDown(self):
+        self.manager.wait_for_downloads()
+        self.tmp_dir.cleanup()
+
+    def wait(self):
+        """Espera a las descargas y entrega las señales pendientes."""
+        self.manager.wait_for_downloads()
+        QApplication.processEvents()
+
+    def test_async_returns_placeholder_and_coalesces(self):
+        """Prueba que peticiones simultáneas comparten una única descarga."""
+        url = self.server.sprite_url(1)
+        first = self.manager.get_sprite_async(url)
+        second = self.manager.get_sprite_async(url)
+        self.assertIs(first, self.manager.get_placeholder())
+        self.assertIs(second, self.manager.get_placeholder())
+
+        self.wait()
+        self.assertEqual(self.server.request_count("/sprites/"), 1)
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(self.loaded[0][0], url)
+        self.assertFalse(self.manager.is_loading(url))
+
+        sprite = self.manager.get_sprite_async(url)
+        self.assertEqual(sprite.cacheKey(), self.loaded[0][1].cacheKey())
+        self.assertIn(url, self.manager.disk_cache)
+
+    def test_finished_loader_not_taken_before_signal(self):
+        """Prueba que repriorizar o cancelar una carga ya terminada no toca el loader borrado."""
+        url = self.server.sprite_url(4)
+        self.manager.get_sprite_async(url, 0)
+        self.manager._pool.waitForDone()  # Terminada, pero sin entregar aún sus señales
+
+        self.assertIs(self.manager.get_sprite_async(url, 10), self.manager.get_placeholder())
+        self.assertFalse(self.manager.cancel(url))
+        self.assertTrue(self.manager.is_loading(url))
+        self.wait()
+        self.assertEqual([loaded_url for loaded_url, _ in self.loaded], [url])
+        self.assertFalse(self.manager.is_loading(url))
+
+    def test_async_failure_emits_signal(self):
+        """Prueba que un sprite inexistente emite sprite_failed."""
+        url = self.server.sprite_url(999)
+        self.manager.get_sprite_async(url)
+        self.wait()
+        self.assertEqual(self.failed, [url])
+        self.assertEqual(self.loaded, [])
+
+    def test_sync_get_sprite_uses_disk_cache(self):
+        """Prueba que get_sprite reutiliza el archivo en disco."""
+        url = self.server.sprite_url(2)
+        self.assertIsNotNone(self.manager.get_sprite(url))
+        other = AssetManager(self.settings)
+        self.assertIsNotNone(other.get_sprite(url))
+        self.assertEqual(self.server.request_count("/sprites/"), 1)
+
+    def test_downloads_and_hits_counted(self):
+        """Prueba que las descargas, los bytes y los aciertos de caché quedan en las métricas."""
+        registry = get_registry()
+        downloads = registry.counter("sprite_downloads_total")
+        download_bytes = registry.counter("sprite_download_bytes_total")
+        memory_hits = registry.counter("sprite_cache_hits_total", layer="memory")
+        errors = registry.counter("sprite_errors_total")
+        before = (downloads.value, download_bytes.value, memory_hits.value, errors.value)
+
+        url = self.server.sprite_url(3)
+        self.manager.get_sprite(url)
+        self.manager.get_sprite(url)
+        self.manager.get_sprite(self.server.sprite_url(999))
+
+        self.assertEqual(downloads.value, before[0] + 1)
+        self.assertEqual(download_bytes.value - before[1], len(self.manager.disk_cache.get(url)))
+        self.assertEqual(memory_hits.value, before[2] + 1)
+        self.assertEqual(errors.value, before[3] + 1)
+        memory_bytes = registry.gauge("sprite_memory_bytes")
+        self.assertEqual(memory_bytes.value, self.manager._cache.current_bytes)
+
+    def test_gauges_do_not_keep_manager_alive(self):
+        """Prueba que los medidores de sprites no impiden liberar un gestor descartado."""
+        other = AssetManager(self.settings)
+        other.get_sprite(self.server.sprite_url(4))
+        ref = weakref.ref(other)
+        del other
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(get_registry().gauge("sprite_memory_bytes").value, 0)
+
+    def test_legacy_cache_file_migrated(self):
+        """Prueba que un sprite de la caché antigua (md5) se adopta sin volver a descargarlo."""
+        url = self.server.sprite_url(3)
+        legacy = self.manager._legacy_cache_filename(url)
+        legacy.write_bytes(make_png(color=(3, 0, 0, 255)))
+        self.assertFalse(self.manager.prefetch_sprite(url))
+        self.assertIsNotNone(self.manager.get_sprite(url))
+        self.assertEqual(self.server.request_count("/sprites/"), 0)
+        self.assertFalse(legacy.exists())
+        self.assertIn(url, self.manager.disk_cache)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+from atlas import ATLAS_NAME, SpriteAtlas, build_atlas, pack
+from sprite_store import SpriteStore
+from assets import AssetManager
+from settings import Settings
+from fake_pokeapi import make_png
+
+class TestSpriteAtlas(unittest.TestCase):
+    """Pruebas para el atlas de sprites."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+        self.store = SpriteStore(self.directory)
+        for i in range(10):
+            self.store.put(f"https://example.com/{i}.png", make_png(96, 96, (i, 0, 0, 255)))
+        self.path = self.directory / ATLAS_NAME
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def test_pack_without_overlaps(self):
+        """Prueba que el empaquetado no solapa rectángulos ni se sale de la página."""
+        sizes = {f"s{i}": (20 + i * 7 % 50, 10 + i * 13 % 60) for i in range(60)}
+        sizes["grande"] = (300, 10)
+        placements, pages = pack(sizes, 128)
+        self.assertNotIn("grande", placements)
+        self.assertEqual(len(placements), 60)
+        self.assertEqual(pages, max(page for page, _ in placements.values()) + 1)
+        rects = list(placements.values())
+        for key, (page, (x, y, w, h)) in placements.items():
+            self.assertEqual((w, h), sizes[key])
+            self.assertTrue(x + w <= 128 and y + h <= 128)
+            for other_page, (ox, oy, ow, oh) in rects:
+                if other_page == page and (ox, oy) != (x, y):
+                    self.assertTrue(x + w <= ox or ox + ow <= x or y + h <= oy or oy + oh <= y)
+
+    def test_build_and_open(self):
+        """Prueba que el atlas devuelve los mismos píxeles y comparte los sprites repetidos."""
+        self.store.put("https://mirror.example.com/3.png", make_png(96, 96, (3, 0, 0, 255)))
+        self.assertEqual(build_atlas(self.store, self.path, page_size=256), 11)
+        atlas = SpriteAtlas.open(self.path)
+        self.assertEqual(len(atlas), 11)
+        self.assertEqual(atlas.page_count, 3)  # 10 sprites distintos, 4 por página
+        image = atlas.image("https://example.com/7.png")
+        self.assertEqual((image.width(), image.height()), (96, 96))
+        self.assertEqual(image.pixel(50, 50), 0xff070000)
+        self.assertEqual(atlas.image("https://mirror.example.com/3.png"),
+                         atlas.image("https://example.com/3.png"))
+        self.assertIsNone(atlas.image("https://example.com/99.png"))
+        atlas.close()
+
+    def test_invalid_atlas_ignored(self):
+        """Prueba que un atlas dañado o truncado se ignora."""
+        self.assertIsNone(SpriteAtlas.open(self.path))
+        build_atlas(self.store, self.path, page_size=256)
+        self.path.write_bytes(self.path.read_bytes()[:-100])
+        with self.assertLogs("atlas", level="WARNING"):
+            self.assertIsNone(SpriteAtlas.open(self.path))
+        self.path.write_bytes(b"no es un atlas")
+        with self.assertLogs("atlas", level="WARNING"):
+            self.assertIsNone(SpriteAtlas.open(self.path))
+
+    def test_asset_manager_serves_from_atlas(self):
+        """Prueba que el gestor de assets sirve los sprites del atlas sin leer los PNG."""
+        settings = Settings()
+        settings.sprites.cache_dir = str(self.directory)
+        manager = AssetManager(settings)
+        self.assertEqual(manager.build_atlas(page_size=256), 10)
+        for path in self.directory.glob("*.png"):
+            path.unlink()  # Solo queda el atlas
+        sprite = manager.get_sprite_async("https://example.com/4.png")
+        self.assertIsNot(sprite, manager.get_placeholder())
+        self.assertEqual(sprite.toImage().pixel(10, 10), 0xff040000)
+        self.assertFalse(manager.is_loading("https://example.com/4.png"))
+        self.assertIsNotNone(manager.get_sprite("https://example.com/5.png"))
+
+        manager.clear_cache()
+        self.assertIsNone(manager.atlas)
+        self.assertFalse(self.path.exists())
+
+if __name__ == '__main__':
+    unittest.main()
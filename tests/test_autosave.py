@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+import tempfile
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+from src.autosave import AutoSaver
+from src.models import Team, Pokemon
+import storage
+
+class TestAutoSaver(unittest.TestCase):
+    """Pruebas para el guardado automático diferido."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "team.yaml"
+        self.team = Team()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def wait_until_saved(self, saver: AutoSaver, timeout: float = 5.0):
+        """Procesa eventos hasta que no queden escrituras pendientes."""
+        deadline = time.monotonic() + timeout
+        while saver.pending and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+    def test_burst_coalesced_into_one_write(self):
+        """Prueba que una ráfaga de cambios produce una sola escritura."""
+        saver = AutoSaver(self.team, self.path, delay_ms=50)
+        for count in range(20, 10, -1):
+            self.team.set_hearts(count)
+        self.team.add_pokemon(Pokemon(id=1, name="Bulbasaur"))
+        self.assertFalse(self.path.exists())
+
+        self.wait_until_saved(saver)
+        self.assertEqual(saver.saves_written, 1)
+        self.assertEqual(storage.load(self.path), self.team.to_dict())
+        saver.close()
+
+    def test_close_flushes_pending_changes(self):
+        """Prueba que al cerrar se escriben los cambios pendientes sin esperar."""
+        saver = AutoSaver(self.team, self.path, delay_ms=60000)
+        self.team.set_hearts(5)
+        saver.close()
+        self.assertEqual(storage.load(self.path)["hearts"]["current"], 5)
+
+        # Tras cerrar, los cambios ya no se guardan
+        self.team.set_hearts(7)
+        self.assertFalse(saver.pending)
+
+    def test_set_team_follows_new_team(self):
+        """Prueba que al cambiar de equipo se vigila el nuevo."""
+        saver = AutoSaver(self.team, self.path, delay_ms=60000)
+        new_team = Team()
+        saver.set_team(new_team)
+        self.team.set_hearts(1)
+        self.assertFalse(saver.pending)
+        new_team.set_hearts(2)
+        self.assertTrue(saver.pending)
+        saver.close()
+        self.assertEqual(storage.load(self.path)["hearts"]["current"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import threading
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QThreadPool, QPoint, Qt
+from PyQt5.QtGui import QPixmap, QDropEvent
+from src.gui import MainWindow, PokemonWidget
+from src.models import Team, Pokemon
+from src.assets import AssetManager
+from src.autosave import AutoSaver
+from settings import Settings
+from library import SaveLibrary
+from metrics import get_registry
+import storage
+from fake_pokeapi import FakePokeAPI
+
+class FakeAPIClient:
+    """Cliente de API falso que devuelve una lista fija de especies."""
+    def __init__(self, count: int = 1000, server: FakePokeAPI = None):
+        self.pokemon_list = [
+            {"name": f"species-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+            for i in range(1, count + 1)
+        ]
+        self.server = server
+        self.list_thread = None
+        self.detail_requests = []
+
+    def iter_pokemon_list(self):
+        self.list_thread = threading.current_thread()
+        for offset in range(0, len(self.pokemon_list), 200):
+            yield self.pokemon_list[offset:offset + 200]
+
+    def resolve_sprite_url(self, pokemon_id: int):
+        return f"{self.server.root_url}/sprites/pokemon/broken-{pokemon_id}.png"
+
+    def get_sprite_url(self, pokemon_id: int):
+        self.detail_requests.append(pokemon_id)
+        return self.server.sprite_url(pokemon_id)
+
+class TestPokemonWidget(unittest.TestCase):
+    """Pruebas para el widget de slot del equipo."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.widget = PokemonWidget()
+        self.widget.resize(200, 200)
+        self.sprite = QPixmap(96, 96)
+        self.widget.set_pokemon(Pokemon(id=1, name="Bulbasaur", sprite_url="bulbasaur.png"),
+                                self.sprite)
+
+    def test_scaled_sprite_reused_between_paints(self):
+        """Prueba que el sprite escalado se reutiliza en pintados sucesivos."""
+        self.widget.grab()
+        scaled = self.widget._scaled_sprite
+        self.assertIsNotNone(scaled)
+        self.widget.is_drop_target = True
+        self.widget.grab()
+        self.assertIs(self.widget._scaled_sprite, scaled)
+        self.assertEqual(scaled.width(), 160 * self.widget.devicePixelRatioF())
+
+    def test_resize_invalidates_scaled_sprite(self):
+        """Prueba que cambiar el tamaño del slot vuelve a escalar el sprite."""
+        self.widget.grab()
+        old_key = self.widget._scaled_key
+        self.widget.resize(300, 300)
+        self.widget.grab()
+        self.assertNotEqual(self.widget._scaled_key, old_key)
+        self.assertEqual(self.widget._scaled_sprite.height(), 260 * self.widget.devicePixelRatioF())
+
+class TestMainWindow(unittest.TestCase):
+    """Pruebas para la ventana principal."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication y el servidor local para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+        cls.server = FakePokeAPI(species_count=30).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.api_client = FakeAPIClient(server=self.server)
+        settings = Settings()
+        settings.sprites.cache_dir = self.tmp_dir.name
+        self.asset_manager = AssetManager(settings)
+        self.window = MainWindow(Team(), self.api_client, self.asset_manager)
+
+    def tearDown(self):
+        self.asset_manager.wait_for_downloads()
+        self.window.close()
+        self.window.deleteLater()
+        self.tmp_dir.cleanup()
+
+    def wait_for_list(self):
+        """Espera a que termine la carga en segundo plano y procesa las señales."""
+        self.window.thread_pool.waitForDone()
+        QApplication.processEvents()
+
+    def wait_for_sprites(self):
+        """Espera a las descargas de sprites y a las consultas de respaldo."""
+        for _ in range(3):
+            self.asset_manager.wait_for_downloads()
+            self.window.thread_pool.waitForDone()
+            QApplication.processEvents()
+
+    def test_pokemon_list_loaded_in_background(self):
+        """Prueba que la lista se carga fuera del hilo de la GUI."""
+        self.wait_for_list()
+        self.assertIsNot(self.api_client.list_thread, threading.main_thread())
+        # Los Worker no ocupan el pool global, que Qt usa por dentro sin soltar el GIL
+        self.assertIsNot(self.window.thread_pool, QThreadPool.globalInstance())
+        self.assertEqual(self.window.pokemon_combo.count(), 1000)
+        self.assertEqual(self.window.pokemon_combo.itemText(0), "Species-1")
+        self.assertEqual(self.window.pokemon_combo.itemData(1),
+                         "https://pokeapi.co/api/v2/pokemon/2/")
+        self.assertTrue(self.window.pokemon_combo.isEnabled())
+        self.assertTrue(self.window.add_button.isEnabled())
+
+    def test_list_streamed_in_pages(self):
+        """Prueba que la lista se muestra por páginas sin perder la selección."""
+        pages = []
+        self.window.pokemon_list_page_loaded.connect(pages.append)
+        self.wait_for_list()
+        self.assertEqual(pages, [200, 400, 600, 800, 1000])
+        self.assertEqual(self.window.pokemon_filter_model.rowCount(), 1000)
+
+        self.window.pokemon_combo.setCurrentIndex(150)
+        self.window.pokemon_list_model.append_entries(
+            [{"name": "species-1001", "url": "https://pokeapi.co/api/v2/pokemon/1001/"}])
+        self.assertEqual(self.window.pokemon_combo.count(), 1001)
+        self.assertEqual(self.window.pokemon_combo.currentIndex(), 150)
+
+    def test_add_pokemon_falls_back_to_details(self):
+        """Prueba que añadir no consulta el detalle salvo si falla el sprite deducido."""
+        self.wait_for_list()
+        self.window.pokemon_combo.setCurrentIndex(2)
+        self.window.add_pokemon()
+        self.assertEqual(self.api_client.detail_requests, [])
+        self.assertEqual(self.window.team.pokemon[0].id, 3)
+
+        # El sprite deducido no existe (404): se consulta el detalle en segundo plano
+        self.wait_for_sprites()
+        self.assertEqual(self.api_client.detail_requests, [3])
+        self.assertEqual(self.window.team.pokemon[0].sprite_url, self.server.sprite_url(3))
+        slot = self.window.team_slots[0]
+        self.assertIsNot(slot.sprite, self.asset_manager.get_placeholder())
+        self.assertEqual(slot.sprite.cacheKey(),
+                         self.asset_manager.get_sprite_async(self.server.sprite_url(3)).cacheKey())
+
+    def test_changes_update_only_affected_slots(self):
+        """Prueba que cada cambio del equipo solo actualiza los slots afectados."""
+        team = self.window.team
+
+        def updates(action):
+            before = self.window.slot_updates
+            action()
+            return self.window.slot_updates - before
+
+        for i in range(1, 4):
+            pokemon = Pokemon(id=i, name=f"Pokemon{i}", sprite_url=self.server.sprite_url(i))
+            self.assertEqual(updates(lambda: team.add_pokemon(pokemon)), 1)
+        self.assertEqual(updates(lambda: team.set_nickname(1, "Apodo")), 1)
+        self.assertEqual(updates(lambda: team.swap_pokemon(0, 2)), 2)
+        self.assertEqual(updates(lambda: self.window.handle_pokemon_drop(self.window.team_slots[4], 3)), 3)
+        self.assertEqual(updates(lambda: team.remove_pokemon(2)), 1)
+        self.assertEqual([slot.pokemon.id if slot.pokemon else None for slot in self.window.team_slots],
+                         [2, 1, None, None, None, None])
+        self.assertEqual(self.window.team_slots[0].pokemon.nickname, "Apodo")
+        self.assertEqual(updates(team.clear), 6)
+        self.assertTrue(all(slot.pokemon is None for slot in self.window.team_slots))
+
+    def test_species_dropped_on_slot_added(self):
+        """Prueba que soltar una especie de la cuadrícula en un slot la añade en esa posición."""
+        self.wait_for_list()
+        team = self.window.team
+        team.add_pokemon(Pokemon(id=1, name="Bulbasaur"))
+        team.add_pokemon(Pokemon(id=2, name="Ivysaur"))
+        model = self.window.species_model
+        mime_data = model.mimeData([model.index(24, 0)])
+        event = QDropEvent(QPoint(10, 10), Qt.CopyAction, mime_data, Qt.LeftButton, Qt.NoModifier)
+        self.window.team_slots[1].dropEvent(event)
+        self.assertTrue(event.isAccepted())
+        self.assertEqual([p.id for p in team.pokemon], [1, 25, 2])
+        self.assertEqual(team.pokemon[1].name, "Species-25")
+        self.assertEqual(team.pokemon[1].sprite_url, self.api_client.resolve_sprite_url(25))
+
+        # Soltar en un slot vacío añade al final
+        self.window.team_slots[5].dropEvent(
+            QDropEvent(QPoint(10, 10), Qt.CopyAction, mime_data, Qt.LeftButton, Qt.NoModifier))
+        self.assertEqual([p.id for p in team.pokemon], [1, 25, 2, 25])
+
+    def test_heart_changes_autosaved_on_close(self):
+        """Prueba que los cambios del contador de corazones se guardan al cerrar."""
+        path = Path(self.tmp_dir.name) / "team.yaml"
+        self.window.autosaver = AutoSaver(self.window.team, path, delay_ms=60000)
+        for _ in range(3):
+            self.window.heart_counter.decrease_hearts()
+        self.assertEqual(self.window.team.current_hearts, 17)
+        self.window.close()
+        self.assertEqual(storage.load(path)["hearts"]["current"], 17)
+
+    def test_save_and_load_named_teams(self):
+        """Prueba guardar el equipo con nombre y volver a cargarlo desde la biblioteca."""
+        self.window.library = SaveLibrary(Path(self.tmp_dir.name) / "teams")
+        self.window.team.add_pokemon(Pokemon(id=1, name="Bulbasaur"))
+        self.window.heart_counter.set_count(12)
+        self.window.save_team_as("Ruta 1")
+        self.assertEqual(self.window.library.info("Ruta 1").hearts_current, 12)
+
+        self.window.team.clear()
+        self.window.heart_counter.set_count(3)
+        self.assertTrue(self.window.load_team_named("Ruta 1"))
+        self.assertEqual(self.window.team_slots[0].pokemon.id, 1)
+        self.assertEqual(self.window.heart_counter.get_count(), 12)
+        self.assertEqual(self.window.team_name, "Ruta 1")
+        self.assertFalse(self.window.load_team_named("No existe"))
+
+    def test_undo_redo_updates_slots_and_hearts(self):
+        """Prueba que deshacer y rehacer actualizan los slots y el contador."""
+        self.window.team.add_pokemon(Pokemon(id=1, name="Bulbasaur"))
+        self.window.team.add_pokemon(Pokemon(id=2, name="Ivysaur"))
+        self.window.team.remove_pokemon(0)
+        self.window.heart_counter.decrease_hearts()
+        self.assertTrue(self.window.undo_button.isEnabled())
+        self.assertFalse(self.window.redo_button.isEnabled())
+
+        self.window.undo_action.trigger()
+        self.assertEqual(self.window.heart_counter.get_count(), 20)
+        self.window.undo_action.trigger()
+        self.assertEqual([slot.pokemon.id for slot in self.window.team_slots[:2]], [1, 2])
+        self.assertTrue(self.window.redo_button.isEnabled())
+
+        self.window.redo()
+        self.assertEqual(self.window.team_slots[0].pokemon.id, 2)
+        self.assertIsNone(self.window.team_slots[1].pokemon)
+
+    def test_actions_counted_and_metrics_dialog(self):
+        """Prueba que las acciones se cuentan y que Ctrl+Shift+M abre el diálogo de métricas."""
+        undos = get_registry().counter("ui_actions_total", action="undo")
+        slot_paints = get_registry().histogram("ui_paint_seconds", widget="pokemon_slot")
+        before = (undos.value, slot_paints.count)
+        self.window.team.add_pokemon(Pokemon(id=1, name="Bulbasaur"))
+        self.window.undo()
+        self.window.team_slots[0].grab()
+        self.assertEqual(undos.value, before[0] + 1)
+        self.assertGreater(slot_paints.count, before[1])
+
+        self.assertEqual(self.window.metrics_action.shortcut().toString(), "Ctrl+Shift+M")
+        self.window.metrics_action.trigger()
+        dialog = self.window._metrics_dialog
+        self.assertTrue(dialog.isVisible())
+        names = {dialog.table.item(row, 0).text() for row in range(dialog.table.rowCount())}
+        self.assertTrue({"ui_actions_total", "ui_paint_seconds", "api_requests_total"} <= names)
+        dialog.close()
+
+    def test_deferred_list_load(self):
+        """Prueba que con `load_list=False` la lista se pide solo al llamar a load_pokemon_list."""
+        api_client = FakeAPIClient(server=self.server)
+        window = MainWindow(Team(), None, self.asset_manager, load_list=False)
+        loaded = []
+        window.pokemon_list_loaded.connect(loaded.append)
+        self.wait_for_list()
+        self.assertIsNone(api_client.list_thread)
+        self.assertFalse(window.add_button.isEnabled())
+
+        window.api_client = api_client
+        window.load_pokemon_list()
+        self.wait_for_list()
+        self.assertEqual(loaded, [1000])
+        self.assertTrue(window.add_button.isEnabled())
+        window.deleteLater()
+
+    def test_empty_list_keeps_loading_state(self):
+        """Prueba que una lista vacía deja la selección deshabilitada."""
+        self.api_client.pokemon_list = []
+        window = MainWindow(Team(), self.api_client, AssetManager(self.asset_manager.settings))
+        self.wait_for_list()
+        self.assertEqual(window.pokemon_combo.count(), 0)
+        self.assertFalse(window.pokemon_combo.isEnabled())
+        self.assertFalse(window.add_button.isEnabled())
+        window.deleteLater()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from src.models import Pokemon, Team
+from history import TeamHistory
+
+class TestTeamHistory(unittest.TestCase):
+    """Pruebas para el historial de deshacer/rehacer del equipo."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.team = Team()
+        self.history = TeamHistory(self.team, limit=50)
+
+    def fill(self, size: int = 4):
+        for i in range(1, size + 1):
+            self.team.add_pokemon(Pokemon(id=i, name=f"Pokemon{i}"))
+
+    def test_undo_redo_every_change(self):
+        """Prueba que cada tipo de cambio se deshace y se rehace."""
+        self.fill()
+        snapshots = [self.team.to_dict()]
+        actions = [
+            lambda: self.team.move_pokemon(0, 3),
+            lambda: self.team.swap_pokemon(1, 2),
+            lambda: self.team.set_nickname(0, "Apodo"),
+            lambda: self.team.set_sprite_url(1, "sprite.png"),
+            lambda: self.team.remove_pokemon(2),
+            lambda: self.team.set_hearts(5),
+            lambda: self.team.clear(),
+        ]
+        for action in actions:
+            action()
+            snapshots.append(self.team.to_dict())
+
+        for expected in reversed(snapshots[:-1]):
+            self.assertTrue(self.history.undo())
+            self.assertEqual(self.team.to_dict(), expected)
+        for _ in range(4):  # Deshacer también las inserciones
+            self.history.undo()
+        self.assertEqual(self.team.pokemon, [])
+        self.assertFalse(self.history.undo())
+
+        for _ in range(4):
+            self.history.redo()
+        for expected in snapshots[1:]:
+            self.assertTrue(self.history.redo())
+            self.assertEqual(self.team.to_dict(), expected)
+        self.assertFalse(self.history.redo())
+
+    def test_records_share_pokemon(self):
+        """Prueba que deshacer un borrado recupera el mismo objeto sin copiarlo."""
+        self.fill(2)
+        removed = self.team.remove_pokemon(0)
+        self.history.undo()
+        self.assertIs(self.team.pokemon[0], removed)
+
+    def test_heart_clicks_merged_and_bounded(self):
+        """Prueba que los clics de corazones seguidos ocupan un solo registro y el historial está acotado."""
+        self.fill(1)
+        for _ in range(3):
+            for count in range(19, 0, -1):
+                self.team.set_hearts(count)
+            self.team.set_hearts(20)
+        self.assertEqual(len(self.history), 2)
+        self.history.undo()
+        self.assertEqual(self.team.current_hearts, 20)
+
+        for i in range(200):
+            self.team.set_nickname(0, f"Apodo{i}")
+        self.assertEqual(len(self.history), 50)
+
+    def test_new_change_clears_redo(self):
+        """Prueba que un cambio nuevo descarta lo que se podía rehacer."""
+        self.fill(2)
+        self.history.undo()
+        self.assertTrue(self.history.can_redo())
+        self.team.set_nickname(0, "Apodo")
+        self.assertFalse(self.history.can_redo())
+
+    def test_set_team_resets_history(self):
+        """Prueba que al cambiar de equipo se vacía el historial y se sigue el nuevo."""
+        self.fill(2)
+        new_team = Team()
+        self.history.set_team(new_team)
+        self.assertFalse(self.history.can_undo())
+        self.team.remove_pokemon(0)
+        self.assertFalse(self.history.can_undo())
+        new_team.add_pokemon(Pokemon(id=9, name="Pokemon9"))
+        self.history.undo()
+        self.assertEqual(new_team.pokemon, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import requests
+from src.http_client import HttpClient
+from fake_pokeapi import FakePokeAPI
+
+class TestHttpClient(unittest.TestCase):
+    """Pruebas para el cliente HTTP compartido."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakePokeAPI(species_count=10).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        HttpClient._instance = None
+        self.client = HttpClient()
+        self.client.max_retries = 3
+        self.delays = []
+        self.client._sleep = self.delays.append
+        self.server.requests.clear()
+
+    def tearDown(self):
+        self.client.close()
+        HttpClient._instance = None
+
+    def test_singleton(self):
+        """Prueba que la API y los assets comparten la misma instancia."""
+        self.assertIs(HttpClient(), self.client)
+
+    def test_connection_reuse(self):
+        """Prueba que las peticiones al mismo host reutilizan la conexión."""
+        for pokemon_id in range(1, 4):
+            response = self.client.get(f"{self.server.base_url}/pokemon/{pokemon_id}")
+            self.assertEqual(response.status_code, 200)
+        stats = self.client.stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+
+    def test_retry_with_backoff(self):
+        """Prueba que los errores transitorios se reintentan con backoff creciente."""
+        self.server.fail_next(503, count=2)
+        response = self.client.get(f"{self.server.base_url}/pokemon/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.stats()["retries"], 2)
+        self.assertEqual(len(self.delays), 2)
+        self.assertLessEqual(self.delays[0], self.client.backoff_factor)
+        self.assertLessEqual(self.delays[1], self.client.backoff_factor * 2)
+
+    def test_retry_after_header(self):
+        """Prueba que se respeta la cabecera Retry-After."""
+        self.server.fail_next(429, headers={"Retry-After": "2"})
+        response = self.client.get(f"{self.server.base_url}/pokemon/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.delays, [2.0])
+
+    def test_gives_up_after_max_retries(self):
+        """Prueba que se devuelve la última respuesta al agotar los reintentos."""
+        self.server.fail_next(500, count=4)
+        response = self.client.get(f"{self.server.base_url}/pokemon/1")
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.server.request_count("/api/"), 4)
+        with self.assertRaises(requests.HTTPError):
+            response.raise_for_status()
+
+    def test_not_found_is_not_retried(self):
+        """Prueba que los errores permanentes no se reintentan."""
+        response = self.client.get(f"{self.server.base_url}/pokemon/99")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.delays, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+from pathlib import Path
+from unittest import mock
+from src.models import Pokemon, Team
+import library
+import storage
+from library import SaveLibrary
+
+class TestSaveLibrary(unittest.TestCase):
+    """Pruebas para la biblioteca de equipos guardados."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+        self.library = SaveLibrary(self.dir)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_team(self, size: int, hearts: int = 20) -> Team:
+        team = Team()
+        for i in range(1, size + 1):
+            team.add_pokemon(Pokemon(id=i, name=f"Pokemon{i}"))
+        team.set_hearts(hearts)
+        return team
+
+    def test_save_and_load(self):
+        """Prueba guardar varios equipos con nombre y cargarlos."""
+        self.library.save("Ruta 1", self.make_team(2, hearts=15))
+        self.library.save("Liga", self.make_team(6))
+        self.assertEqual(len(self.library), 2)
+        self.assertEqual(self.library.entries()[0].name, "Liga")
+
+        team = self.library.load("Ruta 1")
+        self.assertEqual([p.id for p in team.pokemon], [1, 2])
+        self.assertEqual(team.current_hearts, 15)
+        self.assertIsNone(self.library.load("No existe"))
+
+        # Guardar con el mismo nombre sustituye el guardado
+        self.library.save("Ruta 1", self.make_team(3))
+        self.assertEqual(len(self.library), 2)
+        self.assertEqual(self.library.info("Ruta 1").members, [1, 2, 3])
+
+    def test_corrupt_or_missing_file_not_loaded(self):
+        """Prueba que un guardado dañado o sin archivo no se carga y se avisa en el log."""
+        corrupt = self.library.save("Dañado", self.make_team(2))
+        (self.dir / corrupt.filename).write_text("pokemon: [\n  - {id: 1", encoding="utf-8")
+        missing = self.library.save("Perdido", self.make_team(1))
+        (self.dir / missing.filename).unlink()
+
+        with self.assertLogs("library", level="WARNING") as logs:
+            self.assertIsNone(self.library.load("Dañado"))
+            self.assertIsNone(self.library.load("Perdido"))
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("Dañado", logs.output[0])
+        self.assertIn("Perdido", logs.output[1])
+
+    def test_listing_reads_only_index(self):
+        """Prueba que listar los guardados solo lee el índice."""
+        for i in range(50):
+            self.library.save(f"Equipo {i}", self.make_team(i % 6 + 1, hearts=i % 20))
+        reopened = SaveLibrary(self.dir)
+        with mock.patch.object(library.storage, "load", wraps=storage.load) as load:
+            entries = reopened.entries()
+        self.assertEqual(len(entries), 50)
+        self.assertEqual(load.call_count, 1)
+        info = reopened.info("Equipo 7")
+        self.assertEqual((info.members, info.hearts_current, info.hearts_total), ([1, 2], 7, 20))
+
+    def test_index_rebuilt_when_missing(self):
+        """Prueba que el índice se reconstruye si falta, incluidos guardados antiguos."""
+        self.library.save("Ruta 1", self.make_team(2))
+        self.make_team(1).save_to_file(str(self.dir / "team.yaml"))
+        (self.dir / SaveLibrary.INDEX_NAME).unlink()
+
+        reopened = SaveLibrary(self.dir)
+        self.assertEqual(sorted(info.name for info in reopened.entries()), ["Ruta 1", "team"])
+        self.assertEqual(reopened.info("Ruta 1").members, [1, 2])
+        self.assertTrue((self.dir / SaveLibrary.INDEX_NAME).exists())
+
+    def test_delete_and_unique_filenames(self):
+        """Prueba que nombres parecidos usan archivos distintos y se pueden borrar."""
+        first = self.library.save("Equipo Ñ", self.make_team(1))
+        second = self.library.save("equipo n", self.make_team(2))
+        self.assertNotEqual(first.filename, second.filename)
+        self.assertTrue(self.library.delete("Equipo Ñ"))
+        self.assertFalse((self.dir / first.filename).exists())
+        self.assertEqual([info.name for info in SaveLibrary(self.dir).entries()], ["equipo n"])
+
+if __name__ == '__main__':
+    unittest.main()
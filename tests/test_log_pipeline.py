@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from logging.handlers import QueueHandler
+from settings import Settings
+from log_pipeline import LogPipeline
+
+class TestLogPipeline(unittest.TestCase):
+    """Pruebas para el registro en segundo plano con rotación."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.tmp_dir.name) / "logs" / "app.log"
+        root = logging.getLogger()
+        self.previous = (root.handlers[:], root.level)
+        self.pipeline = None
+
+    def tearDown(self):
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        for name in ("pokeapi", "assets"):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        root = logging.getLogger()
+        root.handlers[:] = self.previous[0]
+        root.setLevel(self.previous[1])
+        self.tmp_dir.cleanup()
+
+    def start(self, **options) -> LogPipeline:
+        """Arranca el registro con la sección `logging` indicada, sin consola."""
+        settings = Settings.from_dict({
+            "files": {"log_file": str(self.log_path)},
+            "logging": {"console": False, **options},
+        })
+        self.pipeline = LogPipeline(settings).start()
+        return self.pipeline
+
+    def read_lines(self):
+        return self.log_path.read_text(encoding="utf-8").splitlines()
+
+    def test_records_written_from_background_thread(self):
+        """Prueba que el hilo que registra solo encola y el archivo se escribe en otro hilo."""
+        pipeline = self.start()
+        writers = []
+        file_handler = pipeline.handlers[0]
+        emit = file_handler.emit
+        file_handler.emit = lambda record: (writers.append(threading.current_thread()), emit(record))
+
+        root = logging.getLogger()
+        self.assertEqual(len(root.handlers), 1)
+        self.assertIsInstance(root.handlers[0], QueueHandler)
+        logging.getLogger("gui").info("Pokemon añadido al equipo")
+        logging.getLogger("gui").debug("No se escribe con el nivel INFO")
+        pipeline.stop()
+
+        lines = self.read_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("gui - INFO - Pokemon añadido al equipo"))
+        self.assertEqual(len(writers), 1)
+        self.assertIsNot(writers[0], threading.current_thread())
+
+    def test_json_format_with_exception(self):
+        """Prueba el formato JSON, con la traza de la excepción en su propio campo."""
+        pipeline = self.start(format="json")
+        try:
+            raise ValueError("sprite no válido")
+        except ValueError:
+            logging.getLogger("assets").exception("Error al cargar sprite")
+        pipeline.stop()
+
+        entry = json.loads(self.read_lines()[0])
+        self.assertEqual(entry["level"], "ERROR")
+        self.assertEqual(entry["logger"], "assets")
+        self.assertEqual(entry["message"], "Error al cargar sprite")
+        self.assertIn("ValueError: sprite no válido", entry["exception"])
+        self.assertEqual(entry["thread"], threading.current_thread().name)
+
+    def test_log_rotated_at_max_bytes(self):
+        """Prueba que el archivo rota al llegar al tamaño máximo y se conservan N copias."""
+        pipeline = self.start(max_bytes=500, backup_count=2)
+        for i in range(100):
+            logging.getLogger("autosave").info(f"Guardado número {i}")
+        pipeline.stop()
+
+        names = sorted(path.name for path in self.log_path.parent.iterdir())
+        self.assertEqual(names, ["app.log", "app.log.1", "app.log.2"])
+        for path in self.log_path.parent.iterdir():
+            self.assertLessEqual(path.stat().st_size, 500)
+        self.assertTrue(self.read_lines()[-1].endswith("Guardado número 99"))
+
+    def test_module_levels_applied_and_reloaded(self):
+        """Prueba los niveles por módulo y que al recargar se aplican los nuevos."""
+        pipeline = self.start(level="WARNING", levels={"pokeapi": "debug", "assets": "ERROR"})
+        self.assertEqual(logging.getLogger().level, logging.WARNING)
+        self.assertTrue(logging.getLogger("pokeapi").isEnabledFor(logging.DEBUG))
+        self.assertFalse(logging.getLogger("assets").isEnabledFor(logging.WARNING))
+
+        with self.assertLogs("log_pipeline", level="WARNING"):
+            pipeline.apply_settings(Settings.from_dict({
+                "logging": {"level": "INFO", "levels": {"assets": "DEBUG", "gui": "MUCHO"}}}))
+        self.assertEqual(logging.getLogger("pokeapi").level, logging.NOTSET)
+        self.assertFalse(logging.getLogger("pokeapi").isEnabledFor(logging.DEBUG))
+        self.assertTrue(logging.getLogger("assets").isEnabledFor(logging.DEBUG))
+        self.assertEqual(logging.getLogger("gui").level, logging.NOTSET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+from src.metrics import MetricsRegistry
+from src.widgets import MetricsDialog
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Pruebas para el registro de métricas."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.registry = MetricsRegistry()
+
+    def test_same_name_and_labels_return_same_metric(self):
+        """Prueba que pedir la misma métrica dos veces devuelve el mismo objeto."""
+        hits = self.registry.counter("hits_total", "Aciertos", layer="memory")
+        self.assertIs(self.registry.counter("hits_total", layer="memory"), hits)
+        self.assertIsNot(self.registry.counter("hits_total", layer="disk"), hits)
+        hits.inc()
+        hits.inc(2)
+        self.assertEqual(hits.value, 3)
+
+    def test_kind_mismatch_raises(self):
+        """Prueba que no se puede registrar un nombre con dos tipos distintos."""
+        self.registry.counter("requests_total")
+        with self.assertRaises(ValueError):
+            self.registry.histogram("requests_total")
+
+    def test_histogram_buckets_and_percentiles(self):
+        """Prueba los contadores acumulados y los percentiles de un histograma."""
+        histogram = self.registry.histogram("latency_seconds", buckets=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative_counts(),
+                         [(0.01, 1), (0.1, 3), (1.0, 4), (float("inf"), 5)])
+        self.assertEqual(histogram.percentile(0.5), 0.05)
+        self.assertEqual(histogram.percentile(0.95), 2.0)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 5)
+        self.assertAlmostEqual(snapshot["sum"], 2.605)
+        self.assertEqual(snapshot["max"], 2.0)
+
+    def test_gauge_function_read_at_export(self):
+        """Prueba que un medidor con función se lee en el momento de exportar."""
+        values = [10]
+        gauge = self.registry.gauge("memory_bytes", function=lambda: values[0])
+        values[0] = 42
+        self.assertEqual(gauge.value, 42)
+
+    def test_prometheus_format(self):
+        """Prueba la exportación en el formato de texto de Prometheus."""
+        self.registry.counter("hits_total", "Aciertos de caché", layer="memory").inc(3)
+        self.registry.counter("hits_total", layer="disk").inc()
+        self.registry.histogram("latency_seconds", "Latencia", buckets=(0.1, 1.0)).observe(0.5)
+        text = self.registry.to_prometheus()
+        self.assertEqual(text.splitlines(), [
+            "# HELP hits_total Aciertos de caché",
+            "# TYPE hits_total counter",
+            'hits_total{layer="disk"} 1',
+            'hits_total{layer="memory"} 3',
+            "# HELP latency_seconds Latencia",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 0',
+            'latency_seconds_bucket{le="1.0"} 1',
+            'latency_seconds_bucket{le="+Inf"} 1',
+            "latency_seconds_sum 0.5",
+            "latency_seconds_count 1",
+        ])
+
+    def test_non_finite_values_exported(self):
+        """Prueba que los valores infinitos o NaN no rompen la exportación."""
+        self.registry.gauge("ratio").set(float("nan"))
+        self.registry.gauge("limit", side="high").set(float("inf"))
+        self.registry.gauge("limit", side="low").set(float("-inf"))
+        self.registry.histogram("latency_seconds", buckets=(1.0,)).observe(float("inf"))
+        lines = self.registry.to_prometheus().splitlines()
+        self.assertIn("ratio NaN", lines)
+        self.assertIn('limit{side="high"} +Inf', lines)
+        self.assertIn('limit{side="low"} -Inf', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 1', lines)
+        self.assertIn("latency_seconds_sum +Inf", lines)
+        values = {(metric["name"], tuple(metric["labels"].values())): metric
+                  for metric in json.loads(self.registry.to_json())["metrics"]}
+        self.assertEqual(values[("ratio", ())]["value"], "NaN")
+        self.assertEqual(values[("limit", ("low",))]["value"], "-Inf")
+        self.assertEqual(values[("latency_seconds", ())]["max"], "+Inf")
+
+    def test_json_and_reset(self):
+        """Prueba la exportación JSON y que reiniciar pone las métricas a cero."""
+        counter = self.registry.counter("saves_total", action="save")
+        counter.inc()
+        data = json.loads(self.registry.to_json())
+        self.assertEqual(data["metrics"], [{
+            "name": "saves_total", "type": "counter", "help": "",
+            "labels": {"action": "save"}, "value": 1,
+        }])
+        self.registry.reset()
+        self.assertEqual(counter.value, 0)
+        self.assertIs(self.registry.counter("saves_total", action="save"), counter)
+
+class TestMetricsDialog(unittest.TestCase):
+    """Pruebas para el diálogo de métricas."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.registry = MetricsRegistry()
+        self.registry.counter("ui_actions_total", action="add").inc(2)
+        self.registry.histogram("ui_paint_seconds", widget="pokemon_slot").observe(0.004)
+        self.dialog = MetricsDialog(self.registry)
+
+    def tearDown(self):
+        self.dialog.close()
+        self.dialog.deleteLater()
+        self.tmp_dir.cleanup()
+
+    def test_table_lists_every_series(self):
+        """Prueba que la tabla muestra una fila por serie, con los tiempos en ms."""
+        self.dialog.refresh()
+        self.assertEqual(self.dialog.table.rowCount(), 2)
+        self.assertEqual(self.dialog.table.item(0, 0).text(), "ui_actions_total")
+        self.assertEqual(self.dialog.table.item(0, 1).text(), "action=add")
+        self.assertEqual(self.dialog.table.item(0, 2).text(), "2")
+        self.assertIn("4.00 ms", self.dialog.table.item(1, 2).text())
+
+    def test_export_writes_files(self):
+        """Prueba que se exporta a JSON y a Prometheus sin abrir el selector de archivos."""
+        json_path = self.dialog.export("json", Path(self.tmp_dir.name) / "metrics.json")
+        prom_path = self.dialog.export("prometheus", Path(self.tmp_dir.name) / "metrics.prom")
+        self.assertEqual(len(json.loads(json_path.read_text(encoding="utf-8"))["metrics"]), 2)
+        self.assertIn('ui_actions_total{action="add"} 2', prom_path.read_text(encoding="utf-8"))
+
+    def test_non_finite_value_shown(self):
+        """Prueba que la tabla muestra un medidor infinito sin fallar."""
+        self.registry.gauge("limit").set(float("inf"))
+        self.dialog.refresh()
+        self.assertEqual(self.dialog.table.item(0, 2).text(), "inf")
+
+    def test_reset_clears_values(self):
+        """Prueba que el botón de reiniciar pone las métricas a cero."""
+        self.dialog.reset()
+        self.assertEqual(self.dialog.table.item(0, 2).text(), "0")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import unittest
 from pathlib import Path
 import tempfile
 import yaml
-from src.models import Pokemon, Team
+from src.models import Pokemon, Team, TeamEvent
 
 class TestPokemon(unittest.TestCase):
     """Pruebas para la clase Pokemon."""
@@ -140,6 +140,33 @@ class TestTeam(unittest.TestCase):
         # Limpiar
         Path(tmp.name).unlink()
 
+    def test_change_events(self):
+        """Prueba que cada cambio del equipo notifica un evento con las posiciones afectadas."""
+        events = []
+        self.team.subscribe(events.append)
+        for i in range(1, 4):
+            self.team.add_pokemon(Pokemon(id=i, name=f"Pokemon{i}"))
+        self.team.move_pokemon(0, 2)
+        self.team.swap_pokemon(0, 1)
+        self.team.set_nickname(1, "Apodo")
+        self.team.set_nickname(1, "Apodo")  # Sin cambios: no notifica
+        self.team.remove_pokemon(0)
+        self.team.set_hearts(10)
+        self.team.clear()
+
+        self.assertEqual([(e.kind, e.index, e.to_index) for e in events], [
+            (TeamEvent.INSERTED, 0, -1), (TeamEvent.INSERTED, 1, -1), (TeamEvent.INSERTED, 2, -1),
+            (TeamEvent.MOVED, 0, 2), (TeamEvent.SWAPPED, 0, 1), (TeamEvent.NICKNAME, 1, -1),
+            (TeamEvent.REMOVED, 0, -1), (TeamEvent.HEARTS, -1, -1), (TeamEvent.RESET, -1, -1),
+        ])
+        self.assertEqual(events[5].old_value, "")
+        self.assertEqual(events[7].old_value, (20, 20))
+        self.assertEqual([p.id for p in events[8].old_value], [2, 1])
+
+        self.team.unsubscribe(events.append)
+        self.team.add_pokemon(self.pokemon)
+        self.assertEqual(len(events), 9)
+
     def test_load_nonexistent_file(self):
         """Prueba cargar desde un archivo que no existe."""
         team = Team.load_from_file("nonexistent.yaml")
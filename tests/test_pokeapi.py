@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import time
+from pathlib import Path
+
+from pokeapi import PokeAPIClient
+from api_cache import ResponseCache
+from http_client import HttpClient
+from species import SpeciesIndex, SpeciesRecord
+from settings import Settings
+from metrics import get_registry
+from fake_pokeapi import FakePokeAPI
+
+class TestResponseCache(unittest.TestCase):
+    """Pruebas para la caché persistente de respuestas."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "api_cache.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_put_get_persists(self):
+        """Prueba que las entradas sobreviven a reabrir la caché."""
+        cache = ResponseCache(str(self.path))
+        cache.put("a", {"x": 1}, etag='"abc"')
+        cache.close()
+
+        reopened = ResponseCache(str(self.path))
+        entry = reopened.get("a")
+        self.assertEqual(entry.data, {"x": 1})
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertTrue(entry.is_fresh(60))
+        self.assertFalse(entry.is_fresh(0))
+        reopened.close()
+
+    def test_lru_eviction(self):
+        """Prueba que se desaloja la entrada menos usada al superar el límite."""
+        cache = ResponseCache(str(self.path))
+        payload = {"data": "x" * 200}
+        cache.put("a", payload)
+        entry_size = cache.total_size()
+        cache.max_size = entry_size * 2
+
+        cache.put("b", payload)
+        time.sleep(0.01)
+        cache.get("a")  # "a" pasa a ser la más reciente
+        cache.put("c", payload)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertLessEqual(cache.total_size(), cache.max_size)
+        cache.close()
+
+class TestSpeciesIndex(unittest.TestCase):
+    """Pruebas para el índice compacto de especies."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.details = {
+            "id": 6, "name": "charizard",
+            "types": [{"slot": 2, "type": {"name": "flying"}}, {"slot": 1, "type": {"name": "fire"}}],
+            "moves": [{"move": {"name": f"move-{i}"}} for i in range(100)],
+            "sprites": {"front_default": "https://example.com/6.png", "back_default": "x"},
+        }
+
+    def test_record_from_details(self):
+        """Prueba la extracción del registro compacto desde el documento completo."""
+        record = SpeciesRecord.from_details(self.details)
+        self.assertEqual(record.id, 6)
+        self.assertEqual(record.name, "charizard")
+        self.assertEqual(record.sprite_url, "https://example.com/6.png")
+        self.assertEqual(record.types, ("fire", "flying"))
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(SpeciesRecord.from_dict(record.to_dict()), record)
+
+    def test_index_add_get(self):
+        """Prueba añadir, actualizar y consultar especies en el índice."""
+        index = SpeciesIndex()
+        index.add(SpeciesRecord.from_details(self.details))
+        index.add(SpeciesRecord(1, "bulbasaur", "b.png", ("grass", "poison")))
+        index.add(SpeciesRecord(6, "charizard", "new.png", ("fire",)))
+        self.assertEqual(len(index), 2)
+        self.assertIn(1, index)
+        self.assertNotIn(2, index)
+        self.assertEqual(index.get(6).sprite_url, "new.png")
+        self.assertEqual(index.sprite_url(1), "b.png")
+        self.assertIsNone(index.get(2))
+
+class TestPokeAPIClient(unittest.TestCase):
+    """Pruebas para el cliente de la PokeAPI contra un servidor local."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakePokeAPI(species_count=30).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = str(Path(self.tmp_dir.name) / "api_cache.sqlite")
+        self.server.requests.clear()
+        self.server.not_modified = 0
+
+    def tearDown(self):
+        PokeAPIClient._instance = None
+        HttpClient._instance = None
+        self.tmp_dir.cleanup()
+
+    def make_client(self) -> PokeAPIClient:
+        """Crea un cliente nuevo (simulando un nuevo arranque) contra el servidor local.
+
+        La caché persistente vive en el directorio temporal de la prueba.
+        """
+        PokeAPIClient._instance = None
+        settings = Settings()
+        settings.api.base_url = self.server.base_url
+        settings.api.cache_file = self.cache_path
+        client = PokeAPIClient(settings)
+        client.http._sleep = lambda delay: None
+        return client
+
+    def test_warm_start_makes_no_requests(self):
+        """Prueba que un arranque en caliente no hace peticiones de red."""
+        client = self.make_client()
+        self.assertEqual(len(client.get_pokemon_list()), 30)
+        self.assertEqual(client.get_pokemon_details(5)["name"], "species-5")
+        self.assertEqual(self.server.request_count(), 2)
+
+        client = self.make_client()
+        self.assertEqual(len(client.get_pokemon_list()), 30)
+        self.assertEqual(client.get_pokemon_details(5)["name"], "species-5")
+        self.assertEqual(self.server.request_count(), 2)
+
+    def test_requests_and_cache_hits_counted(self):
+        """Prueba que las peticiones y los aciertos de caché quedan en las métricas."""
+        registry = get_registry()
+        requests = registry.counter("api_requests_total")
+        memory_hits = registry.counter("api_cache_hits_total", layer="memory")
+        disk_hits = registry.counter("api_cache_hits_total", layer="disk")
+        latency = registry.histogram("api_request_seconds")
+        before = (requests.value, memory_hits.value, disk_hits.value, latency.count)
+
+        client = self.make_client()
+        client.get_pokemon_details(5)
+        client.get_pokemon_details(5)
+        self.make_client().get_pokemon_details(5)
+
+        after = (requests.value, memory_hits.value, disk_hits.value, latency.count)
+        self.assertEqual([b - a for a, b in zip(before, after)], [1, 1, 1, 1])
+
+    def test_list_fetched_in_pages(self):
+        """Prueba que la lista se descarga por páginas, en orden, y se guarda con su total."""
+        client = self.make_client()
+        client.list_page_size = 7
+        pages = list(client.iter_pokemon_list())
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 7, 2])
+        names = [entry["name"] for page in pages for entry in page]
+        self.assertEqual(names, [f"species-{i}" for i in range(1, 31)])
+        self.assertEqual(self.server.request_count("/api/v2/pokemon?"), 5)
+        self.assertEqual(client.response_cache.get(client._list_key()).data["count"], 30)
+
+        # Copia caducada con el mismo total: basta con la primera página
+        client = self.make_client()
+        client.list_page_size = 7
+        client.cache_timeout = 0
+        self.assertEqual(len(client.get_pokemon_list()), 30)
+        self.assertEqual(self.server.request_count("/api/v2/pokemon?"), 6)
+
+    def test_list_follows_next_when_it_grows(self):
+        """Prueba que si la lista crece durante la descarga se siguen los enlaces `next`."""
+        client = self.make_client()
+        client.list_page_size = 10
+        pages = client.iter_pokemon_list()
+        try:
+            self.assertEqual(len(next(pages)), 10)
+            self.server.species_count = 35
+            entries = [entry for page in pages for entry in page]
+        finally:
+            self.server.species_count = 30
+        self.assertEqual(len(entries), 25)
+        self.assertEqual(entries[-1]["name"], "species-35")
+        self.assertEqual(client.response_cache.get(client._list_key()).data["count"], 35)
+
+    def test_partial_list_not_cached(self):
+        """Prueba que una lista incompleta por un error no se guarda en la caché."""
+        client = self.make_client()
+        client.list_page_size = 10
+        client.list_workers = 1
+        pages = client.iter_pokemon_list()
+        self.assertEqual(len(next(pages)), 10)
+        self.server.fail_next(404)  # La segunda página falla
+        with self.assertLogs(client.logger.name, level="ERROR"):
+            self.assertEqual(list(pages), [])
+        self.assertNotIn(client._list_key(), client.response_cache)
+        self.assertEqual(len(client.get_pokemon_list()), 30)  # Se reintenta en la siguiente carga
+
+    def test_expired_entry_is_revalidated(self):
+        """Prueba que una entrada caducada se revalida con su ETag."""
+        client = self.make_client()
+        client.get_pokemon_details(7)
+
+        client = self.make_client()
+        client.cache_timeout = 0
+        details = client.get_pokemon_details(7)
+
+        self.assertEqual(details["id"], 7)
+        self.assertEqual(self.server.request_count(), 2)
+        self.assertEqual(self.server.not_modified, 1)
+        self.assertIn("If-None-Match", self.server.requests[-1][1])
+
+    def test_stale_entry_served_when_offline(self):
+        """Prueba que se usa la copia caducada si la red falla."""
+        client = self.make_client()
+        client.get_pokemon_details(3)
+
+        client = self.make_client()
+        client.cache_timeout = 0
+        client.base_url = "http://127.0.0.1:1/api/v2"  # Puerto sin servidor
+        client.response_cache.put(f"{client.base_url}/pokemon/3", {"id": 3})
+        self.assertEqual(client.get_pokemon_details(3), {"id": 3})
+
+    def test_sprite_url(self):
+        """Prueba la obtención de la URL del sprite."""
+        client = self.make_client()
+        self.assertEqual(client.get_sprite_url(4), self.server.sprite_url(4))
+        self.assertIsNone(client.get_sprite_url(999))
+
+    def test_resolve_sprite_url_without_network(self):
+        """Prueba que la URL del sprite se deduce sin peticiones."""
+        client = self.make_client()
+        client.sprite_url_template = self.server.root_url + "/sprites/pokemon/{id}.png"
+        self.assertEqual(client.resolve_sprite_url(25), self.server.sprite_url(25))
+        self.assertEqual(self.server.request_count(), 0)
+
+        # Si la especie ya está en el índice se usa su URL real
+        client.get_species(4)
+        client.sprite_url_template = "https://example.com/{id}.png"
+        self.assertEqual(client.resolve_sprite_url(4), self.server.sprite_url(4))
+
+    def test_species_drops_full_document(self):
+        """Prueba que get_species solo conserva el registro compacto."""
+        client = self.make_client()
+        record = client.get_species(8)
+        self.assertEqual(record.name, "species-8")
+        self.assertEqual(record.types, ("normal",))
+        self.assertEqual(client._cache, {})
+        self.assertNotIn(f"{client.base_url}/pokemon/8", client.response_cache)
+        self.assertTrue(client.has_species(8))
+
+        # Un nuevo arranque recupera el registro de la caché persistente
+        client = self.make_client()
+        self.assertEqual(client.get_species(8), record)
+        self.assertEqual(self.server.request_count(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
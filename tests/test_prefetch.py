@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+from pathlib import Path
+from prefetch import prefetch
+from pokeapi import PokeAPIClient
+from settings import Settings
+from assets import AssetManager
+from http_client import HttpClient
+from fake_pokeapi import FakePokeAPI
+
+class TestPrefetch(unittest.TestCase):
+    """Pruebas para la precarga de la Pokédex."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakePokeAPI(species_count=12).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server.requests.clear()
+
+    def tearDown(self):
+        PokeAPIClient._instance = None
+        HttpClient._instance = None
+        self.tmp_dir.cleanup()
+
+    def make_components(self):
+        """Crea cliente y gestor de assets nuevos sobre las cachés temporales."""
+        PokeAPIClient._instance = None
+        settings = Settings()
+        settings.api.base_url = self.server.base_url
+        settings.api.cache_file = str(Path(self.tmp_dir.name) / "api.sqlite")
+        api_client = PokeAPIClient(settings)
+        settings.sprites.cache_dir = self.tmp_dir.name
+        asset_manager = AssetManager(settings)
+        return api_client, asset_manager
+
+    def test_prefetch_fills_caches(self):
+        """Prueba que se descargan los detalles y sprites de todas las especies."""
+        api_client, asset_manager = self.make_components()
+        report = prefetch(api_client, asset_manager, workers=4)
+        self.assertEqual(report.species, 12)
+        self.assertEqual(report.details_fetched, 12)
+        self.assertEqual(report.sprites_downloaded, 12)
+        self.assertEqual(report.errors, 0)
+        self.assertEqual(len(list(Path(self.tmp_dir.name).glob("*.png"))), 12)
+
+    def test_prefetch_resumes(self):
+        """Prueba que una segunda ejecución no repite descargas."""
+        api_client, asset_manager = self.make_components()
+        prefetch(api_client, asset_manager, workers=4, limit=5)
+        requests_before = self.server.request_count()
+
+        api_client, asset_manager = self.make_components()
+        report = prefetch(api_client, asset_manager, workers=4)
+        self.assertEqual(report.details_cached, 5)
+        self.assertEqual(report.sprites_cached, 5)
+        self.assertEqual(report.details_fetched, 7)
+        self.assertEqual(report.sprites_downloaded, 7)
+        # Solo las 7 especies nuevas (detalle + sprite) tocan la red
+        self.assertEqual(self.server.request_count() - requests_before, 14)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from unittest import mock
+from profiling import StartupProfiler
+
+class TestStartupProfiler(unittest.TestCase):
+    """Pruebas para la traza del tiempo de arranque."""
+
+    def test_enabled_by_flag_or_env(self):
+        """Prueba que se activa con la opción o la variable de entorno."""
+        with mock.patch.dict(os.environ, {StartupProfiler.ENV_VAR: ""}):
+            argv = ["main.py", "--profile-startup"]
+            self.assertTrue(StartupProfiler.from_environment(argv).enabled)
+            self.assertEqual(argv, ["main.py"])  # La opción no llega a Qt
+            self.assertFalse(StartupProfiler.from_environment(["main.py"]).enabled)
+        with mock.patch.dict(os.environ, {StartupProfiler.ENV_VAR: "1"}):
+            self.assertTrue(StartupProfiler.from_environment(["main.py"]).enabled)
+
+    def test_report_lists_phases(self):
+        """Prueba que el informe incluye cada fase y solo se escribe una vez."""
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase("importaciones"):
+            pass
+        profiler.record("primer pintado", 0.25)
+        with self.assertLogs("profiling", level="INFO") as logs:
+            profiler.report()
+            profiler.report()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("importaciones", logs.output[0])
+        self.assertIn("250.0 ms", logs.output[0])
+
+    def test_disabled_records_nothing(self):
+        """Prueba que desactivado no registra fases ni escribe en el log."""
+        profiler = StartupProfiler(enabled=False)
+        with profiler.phase("importaciones"):
+            pass
+        self.assertEqual(profiler.phases, [])
+        with mock.patch.object(profiler.logger, "info") as info:
+            profiler.report()
+        info.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from src.search import NameSearchIndex, SearchFilterProxyModel, normalize
+from src.list_model import PokemonListModel
+
+NAMES = ["bulbasaur", "ivysaur", "venusaur", "charmander", "charmeleon", "charizard",
+         "pikachu", "raichu", "mr-mime", "farfetchd", "nidoran-f", "flabébé"]
+
+class TestNameSearchIndex(unittest.TestCase):
+    """Pruebas para el índice de búsqueda de nombres."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.index = NameSearchIndex(NAMES)
+
+    def names(self, rows):
+        return [NAMES[row] for row in rows]
+
+    def test_normalize(self):
+        """Prueba la normalización de nombres (acentos, mayúsculas y signos)."""
+        self.assertEqual(normalize("Mr. Mime"), "mrmime")
+        self.assertEqual(normalize("Flabébé"), "flabebe")
+
+    def test_prefix(self):
+        """Prueba la búsqueda por prefijo."""
+        self.assertEqual(self.names(self.index.prefix("char")),
+                         ["charizard", "charmander", "charmeleon"])
+        self.assertEqual(self.index.prefix("zzz"), [])
+
+    def test_substring(self):
+        """Prueba la búsqueda por subcadena, incluida la incremental."""
+        self.assertEqual(self.names(self.index.substring("saur")),
+                         ["bulbasaur", "ivysaur", "venusaur"])
+        self.assertEqual(self.names(self.index.substring("sa")),
+                         ["bulbasaur", "ivysaur", "venusaur"])
+        self.assertEqual(self.names(self.index.substring("saur")),
+                         ["bulbasaur", "ivysaur", "venusaur"])
+        self.assertEqual(self.names(self.index.substring("achu")), ["pikachu"])
+        self.assertEqual(self.names(self.index.substring("mr mime")), ["mr-mime"])
+
+    def test_search_ranks_prefix_first(self):
+        """Prueba que los prefijos aparecen antes que las subcadenas."""
+        index = NameSearchIndex(["pichu", "raichu", "chu"])
+        self.assertEqual(index.search("chu"), [2, 0, 1])
+
+    def test_fuzzy(self):
+        """Prueba que las erratas devuelven nombres parecidos."""
+        self.assertEqual(self.names(self.index.search("pikachuu"))[0], "pikachu")
+        self.assertEqual(self.names(self.index.search("charzard"))[0], "charizard")
+
+    def test_empty_query(self):
+        """Prueba que una consulta vacía devuelve todas las filas."""
+        self.assertEqual(self.index.search(""), list(range(len(NAMES))))
+
+    def test_extend_matches_build(self):
+        """Prueba que ampliar el índice por bloques equivale a construirlo de una vez."""
+        index = NameSearchIndex(NAMES[:5])
+        index.search("char")
+        index.extend(NAMES[5:9])
+        index.extend(NAMES[9:])
+        for query in ("", "char", "saur", "chu", "pikachi", "mime"):
+            self.assertEqual(index.search(query), self.index.search(query))
+
+class TestSearchFilterProxyModel(unittest.TestCase):
+    """Pruebas para el modelo proxy de búsqueda."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.source = PokemonListModel()
+        self.proxy = SearchFilterProxyModel()
+        self.proxy.setSourceModel(self.source)
+        self.source.set_entries([{"name": name, "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                                 for i, name in enumerate(NAMES, start=1)])
+
+    def rows(self):
+        return [self.proxy.index(row, 0).data() for row in range(self.proxy.rowCount())]
+
+    def test_filter_and_order(self):
+        """Prueba que la consulta filtra y ordena por relevancia."""
+        self.proxy.set_query("char")
+        self.assertEqual(self.rows(), ["Charizard", "Charmander", "Charmeleon"])
+        self.assertEqual(self.proxy.index(0, 0).data(Qt.UserRole),
+                         "https://pokeapi.co/api/v2/pokemon/6/")
+
+    def test_clear_query_restores_order(self):
+        """Prueba que al borrar la consulta se recupera la lista original."""
+        self.proxy.set_query("saur")
+        self.proxy.set_query("")
+        self.assertEqual(self.rows(), [name.title() for name in NAMES])
+
+    def test_index_rebuilt_on_reset(self):
+        """Prueba que el índice se reconstruye al recargar la lista."""
+        self.proxy.set_query("eevee")
+        self.assertEqual(self.rows(), [])
+        self.source.set_entries([{"name": "eevee", "url": "https://pokeapi.co/api/v2/pokemon/133/"}])
+        self.assertEqual(self.rows(), ["Eevee"])
+
+    def test_appended_rows_inserted_without_reset(self):
+        """Prueba que las páginas añadidas al final se insertan sin reiniciar el proxy."""
+        resets, inserted = [], []
+        self.proxy.modelReset.connect(lambda: resets.append(True))
+        self.proxy.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        self.source.append_entries([{"name": "eevee", "url": "https://pokeapi.co/api/v2/pokemon/133/"},
+                                    {"name": "vaporeon", "url": "https://pokeapi.co/api/v2/pokemon/134/"}])
+        self.assertEqual(inserted, [(12, 13)])
+        self.assertEqual(resets, [])
+        self.assertEqual(self.rows()[-2:], ["Eevee", "Vaporeon"])
+
+        # Con consulta, las coincidencias nuevas pueden cambiar el orden
+        self.proxy.set_query("char")
+        self.source.append_entries([{"name": "charcadet", "url": "https://pokeapi.co/api/v2/pokemon/935/"}])
+        self.assertEqual(self.rows(), ["Charcadet", "Charizard", "Charmander", "Charmeleon"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+import tempfile
+from pathlib import Path
+from PyQt5.QtWidgets import QApplication
+import settings as settings_module
+from settings import Settings, get_settings, set_settings
+from settings_watcher import SettingsWatcher
+from assets import AssetManager
+from autosave import AutoSaver
+from history import TeamHistory
+from models import Team
+
+CONFIG = """
+api:
+  max_retries: 5
+sprites:
+  size: 64
+  memory_budget: 1048576
+  cache_dir: {cache_dir}
+team:
+  history_limit: 50
+files:
+  autosave_delay: 500
+"""
+
+class TestSettings(unittest.TestCase):
+    """Pruebas para la configuración tipada y su recarga."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "settings.yaml"
+        # La caché de sprites de los gestores creados en las pruebas va al directorio temporal
+        self.config = CONFIG.format(cache_dir=self.tmp_dir.name)
+        self.path.write_text(self.config, encoding='utf-8')
+        self.previous = settings_module._current
+
+    def tearDown(self):
+        settings_module._current = self.previous
+        self.tmp_dir.cleanup()
+
+    def test_missing_file_uses_defaults(self):
+        """Prueba que sin archivo se usan los valores por defecto."""
+        with self.assertLogs("settings", level="WARNING"):
+            settings = Settings.load(Path(self.tmp_dir.name) / "no_existe.yaml")
+        self.assertEqual(settings, Settings())
+        self.assertEqual(settings.team.max_pokemon, 6)
+        self.assertEqual(settings.files.team_save, "saves/team.yaml")
+
+    def test_values_coerced_and_invalid_ignored(self):
+        """Prueba la conversión de tipos y que los valores no válidos conservan el defecto."""
+        with self.assertLogs("settings", level="WARNING") as logs:
+            settings = Settings.from_dict({
+                "api": {"timeout": "2.5", "max_retries": "x", "desconocida": 1},
+                "app": {"window": {"always_on_top": "false", "width": True}},
+                "team": "no es una sección"
+            })
+        self.assertEqual(settings.api.timeout, 2.5)
+        self.assertEqual(settings.api.max_retries, 3)
+        self.assertFalse(settings.app.window.always_on_top)
+        self.assertEqual(settings.app.window.width, 800)
+        self.assertEqual(settings.team, Settings().team)
+        self.assertEqual(len(logs.output), 3)
+
+    def test_loaded_once_and_shared(self):
+        """Prueba que la configuración se lee una vez y la comparten los componentes."""
+        settings = Settings.load(self.path)
+        set_settings(settings)
+        self.assertIs(get_settings(), settings)
+        self.assertEqual(Team().max_size, 6)
+        self.assertEqual(TeamHistory(Team()).limit, 50)
+        manager = AssetManager()
+        self.assertIs(manager.settings, settings)
+        self.assertEqual(manager.get_sprite_size(), 64)
+        self.assertEqual(manager.memory_budget, 1048576)
+
+    def test_reload_applies_to_components(self):
+        """Prueba que al cambiar el archivo se recarga y los componentes aplican los cambios."""
+        set_settings(Settings.load(self.path))
+        team = Team()
+        history = TeamHistory(team)
+        saver = AutoSaver(team, Path(self.tmp_dir.name) / "team.yaml")
+        manager = AssetManager()
+        for count in range(5):
+            team.set_hearts(count)
+            history._undo[-1].timestamp -= TeamHistory.HEARTS_MERGE_WINDOW
+        watcher = SettingsWatcher(self.path, delay_ms=10)
+        received = []
+        for component in (history, saver, manager):
+            watcher.settings_changed.connect(component.apply_settings)
+        watcher.settings_changed.connect(received.append)
+
+        # Una recarga sin cambios no emite nada
+        self.assertIsNone(watcher.reload())
+
+        self.path.write_text(self.config.replace("history_limit: 50", "history_limit: 3")
+                             .replace("autosave_delay: 500", "autosave_delay: 20")
+                             .replace("size: 64", "size: 48"), encoding='utf-8')
+        deadline = time.monotonic() + 5.0
+        while not received and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+        self.assertEqual(len(received), 1)
+        self.assertIs(get_settings(), received[0])
+        self.assertEqual(history.limit, 3)
+        self.assertEqual(len(history), 3)  # Se conservan los cambios más recientes
+        self.assertEqual(saver.delay_ms, 20)
+        self.assertEqual(manager.get_sprite_size(), 48)
+        watcher.close()
+        saver.close()
+
+if __name__ == '__main__':
+    unittest.main()
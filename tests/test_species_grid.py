@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from list_model import PokemonListModel
+from species_grid import (
+    SPECIES_MIME_TYPE, SpeciesGridView, SpeciesThumbnailModel, decode_species_mime
+)
+from fake_assets import FakeAssetManager
+
+def sprite_url_for(species_id: int) -> str:
+    return f"https://example.com/sprites/{species_id}.png"
+
+class TestSpeciesGrid(unittest.TestCase):
+    """Pruebas para la cuadrícula virtualizada de especies."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Crear instancia de QApplication para las pruebas."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.assets = FakeAssetManager()
+        self.source = PokemonListModel()
+        self.source.set_entries([
+            {"name": f"species-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+            for i in range(1, 1001)
+        ])
+        self.model = SpeciesThumbnailModel(self.assets, sprite_url_for)
+        self.model.setSourceModel(self.source)
+        self.view = SpeciesGridView()
+        self.view.setModel(self.model)
+        self.view.resize(440, 300)
+        self.view.show()
+        self.paint()
+
+    def tearDown(self):
+        self.view.close()
+        self.view.deleteLater()
+
+    def paint(self):
+        """Pinta la vista y aplica las filas visibles sin esperar al temporizador."""
+        self.view.viewport().repaint()
+        QApplication.processEvents()
+        self.view.update_visible_rows()
+
+    def visible_requests(self):
+        return {url for url, priority in self.assets.requests
+                if priority == SpeciesThumbnailModel.VISIBLE_PRIORITY}
+
+    def test_only_visible_cells_requested(self):
+        """Prueba que solo se piden los sprites en pantalla y unas filas cercanas."""
+        first, last = self.view.visible_rows()
+        self.assertEqual(first, 0)
+        visible = last - first + 1
+        self.assertLess(visible, 50)
+        self.assertTrue(self.visible_requests())
+        self.assertLessEqual(len(self.visible_requests()), visible)
+        margin = SpeciesGridView.PREFETCH_ROWS * self.view.columns()
+        self.assertLessEqual(len(self.assets.pending), visible + margin)
+        prefetched = [url for url, priority in self.assets.requests
+                      if priority == SpeciesThumbnailModel.PREFETCH_PRIORITY]
+        self.assertEqual(len(prefetched), margin)
+
+    def test_scrolled_away_cells_cancelled(self):
+        """Prueba que al desplazarse se cancelan las cargas de las celdas que ya no se ven."""
+        top_requests = set(self.assets.pending)
+        self.view.verticalScrollBar().setValue(self.view.verticalScrollBar().maximum())
+        self.paint()
+
+        self.assertTrue(top_requests)
+        self.assertTrue(top_requests <= set(self.assets.cancelled))
+        self.assertEqual(self.model.cancelled, len(top_requests))
+        first, last = self.view.visible_rows()
+        self.assertEqual(last, 999)
+        self.assertIn(sprite_url_for(1000), self.visible_requests())
+        self.assertNotIn(sprite_url_for(500), {url for url, _ in self.assets.requests})
+
+    def test_loaded_sprite_updates_only_its_cell(self):
+        """Prueba que al llegar un sprite solo se actualiza su celda."""
+        changed = []
+        self.model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row(), roles)))
+        self.assets.finish(sprite_url_for(3))
+        self.assertEqual(changed, [(2, 2, [Qt.DecorationRole])])
+        thumbnail = self.model.index(2, 0).data(Qt.DecorationRole)
+        self.assertEqual(thumbnail.width(), self.model.icon_size)
+        self.assertNotIn(sprite_url_for(3), self.assets.pending)
+
+    def test_failed_sprite_retried_later(self):
+        """Prueba que un sprite fallido se vuelve a pedir pasado un tiempo o al recargar la lista."""
+        url = sprite_url_for(2)
+        index = self.model.index(1, 0)
+        self.assets.fail(url)
+        self.assets.requests.clear()
+        index.data(Qt.DecorationRole)
+        self.assertEqual(self.assets.requests, [])
+
+        self.model._failed[url] -= SpeciesThumbnailModel.FAILURE_RETRY_SECONDS
+        index.data(Qt.DecorationRole)
+        self.assertEqual(self.assets.requests, [(url, SpeciesThumbnailModel.VISIBLE_PRIORITY)])
+
+        self.assets.fail(url)
+        self.assertIn(url, self.model._failed)
+        self.source.set_entries(list(self.source._entries))
+        self.assertEqual(self.model._failed, {})
+
+    def test_drag_encodes_species(self):
+        """Prueba que arrastrar una celda lleva la especie con su propio tipo MIME."""
+        index = self.model.index(24, 0)
+        self.assertTrue(self.model.flags(index) & Qt.ItemIsDragEnabled)
+        mime_data = self.model.mimeData([index])
+        self.assertEqual(self.model.mimeTypes(), [SPECIES_MIME_TYPE])
+        self.assertFalse(mime_data.hasText())  # No se confunde con mover un Pokemon del equipo
+        self.assertEqual(decode_species_mime(mime_data), (25, "Species-25"))
+
+if __name__ == '__main__':
+    unittest.main()
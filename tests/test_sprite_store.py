@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import threading
+from pathlib import Path
+from sprite_store import SpriteStore
+from fake_pokeapi import make_png
+
+class TestSpriteStore(unittest.TestCase):
+    """Pruebas para la caché de sprites en disco direccionada por contenido."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+        self.store = SpriteStore(self.directory)
+        self.red = make_png(color=(255, 0, 0, 255))
+        self.blue = make_png(color=(0, 0, 255, 255))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def files(self):
+        return sorted(p.name for p in self.directory.glob("*.png"))
+
+    def test_put_and_get(self):
+        """Prueba el guardado y la lectura, también desde un manifiesto reabierto."""
+        digest = self.store.put("https://example.com/1.png", self.red)
+        self.assertEqual(self.files(), [f"{digest}.png"])
+        self.assertEqual(self.store.get("https://example.com/1.png"), self.red)
+        self.assertIsNone(self.store.get("https://example.com/2.png"))
+
+        reopened = SpriteStore(self.directory)
+        self.assertIn("https://example.com/1.png", reopened)
+        self.assertEqual(reopened.get("https://example.com/1.png"), self.red)
+        reopened.close()
+
+    def test_identical_sprites_deduplicated(self):
+        """Prueba que URLs con el mismo contenido comparten un único archivo."""
+        self.store.put("https://example.com/a.png", self.red)
+        self.store.put("https://mirror.example.com/a.png", self.red)
+        self.assertEqual(len(self.files()), 1)
+        self.assertEqual(self.store.stats()["urls"], 2)
+        self.assertEqual(self.store.total_size(), len(self.red))
+
+        # El archivo se conserva mientras alguna URL lo use
+        self.store.delete("https://example.com/a.png")
+        self.assertEqual(len(self.files()), 1)
+        self.store.delete("https://mirror.example.com/a.png")
+        self.assertEqual(self.files(), [])
+
+    def test_corrupt_or_missing_file_discarded(self):
+        """Prueba que un archivo truncado o borrado se descarta en lugar de devolverse."""
+        digest = self.store.put("https://example.com/1.png", self.red)
+        self.store.put("https://example.com/2.png", self.blue)
+        path = self.store.path_for(digest)
+        path.write_bytes(self.red[:len(self.red) // 2])
+        with self.assertLogs("sprite_store", level="WARNING"):
+            self.assertIsNone(self.store.get("https://example.com/1.png"))
+        self.assertNotIn("https://example.com/1.png", self.store)
+        self.assertFalse(path.exists())
+
+        self.store.path_for(self.store.put("https://example.com/2.png", self.blue)).unlink()
+        with self.assertLogs("sprite_store", level="WARNING"):
+            self.assertIsNone(self.store.get("https://example.com/2.png"))
+        self.assertEqual(len(self.store), 0)
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """Prueba que al superar el tamaño máximo se desaloja el sprite menos usado."""
+        sprites = [make_png(color=(i, 0, 0, 255)) for i in range(3)]
+        self.store.set_max_size(sum(len(data) for data in sprites) - 1)
+        self.store.put("u0", sprites[0])
+        self.store.put("u1", sprites[1])
+        self.store.get("u0")  # u1 pasa a ser el menos usado
+        self.store.put("u2", sprites[2])
+        self.assertIn("u0", self.store)
+        self.assertNotIn("u1", self.store)
+        self.assertIn("u2", self.store)
+        self.assertEqual(len(self.files()), 2)
+
+        self.store.set_max_size(0)  # Siempre se conserva el más reciente
+        self.assertEqual(len(self.files()), 1)
+
+    def test_concurrent_writes_leave_complete_files(self):
+        """Prueba que escrituras simultáneas no dejan archivos a medias ni temporales."""
+        sprites = [make_png(width=32, height=32, color=(i, i, 0, 255)) for i in range(8)]
+        errors = []
+
+        def worker(offset: int):
+            try:
+                for i in range(len(sprites)):
+                    index = (i + offset) % len(sprites)
+                    self.store.put(f"https://example.com/{index}.png", sprites[index])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.files()), 8)
+        self.assertEqual(list(self.directory.glob("*.tmp")), [])
+        for i, data in enumerate(sprites):
+            self.assertEqual(self.store.get(f"https://example.com/{i}.png"), data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+import tempfile
+from pathlib import Path
+from unittest import mock
+import yaml
+from src import storage
+from src.models import Pokemon, Team
+
+class TestStorage(unittest.TestCase):
+    """Pruebas para la persistencia atómica de guardados."""
+
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+        self.team = Team()
+        self.team.add_pokemon(Pokemon(id=395, name="Empoleon", nickname="Pingüi"))
+        self.team.set_hearts(16)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_atomic_write_keeps_previous_on_failure(self):
+        """Prueba que un fallo al escribir deja intacto el guardado anterior."""
+        path = self.dir / "team.yaml"
+        storage.atomic_write(path, b"anterior")
+        with mock.patch.object(os, "replace", side_effect=OSError("disco lleno")):
+            with self.assertRaises(OSError):
+                storage.atomic_write(path, b"nuevo")
+        self.assertEqual(path.read_bytes(), b"anterior")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["team.yaml"])
+
+    @unittest.skipIf(os.name == "nt", "Windows no tiene permisos POSIX")
+    def test_atomic_write_keeps_permissions(self):
+        """Prueba que reescribir conserva los permisos y que un archivo nuevo sigue la umask."""
+        path = self.dir / "team.yaml"
+        storage.atomic_write(path, b"primero")
+        self.assertEqual(path.stat().st_mode & 0o777, 0o666 & ~storage._UMASK)
+
+        os.chmod(path, 0o640)
+        storage.atomic_write(path, b"segundo")
+        self.assertEqual(path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(path.read_bytes(), b"segundo")
+
+    def test_format_by_extension_and_detection(self):
+        """Prueba que el formato se elige por la extensión y se detecta al cargar."""
+        yaml_path = self.dir / "team.yaml"
+        json_path = self.dir / "team.json"
+        self.team.save_to_file(str(yaml_path))
+        self.team.save_to_file(str(json_path))
+        self.assertEqual(storage.detect_format(yaml_path.read_bytes()), storage.FORMAT_YAML)
+        self.assertEqual(storage.detect_format(json_path.read_bytes()), storage.FORMAT_JSON)
+
+        # Un JSON guardado con extensión .yaml también se carga
+        odd_path = self.dir / "team-json.yaml"
+        self.team.save_to_file(str(odd_path), fmt=storage.FORMAT_JSON)
+        for path in (yaml_path, json_path, odd_path):
+            loaded = Team.load_from_file(str(path))
+            self.assertEqual(loaded.to_dict(), self.team.to_dict())
+        self.assertEqual(Team.load_from_file(str(json_path)).pokemon[0].nickname, "Pingüi")
+
+    def test_loads_legacy_yaml(self):
+        """Prueba que se cargan los guardados escritos con yaml.dump."""
+        path = self.dir / "team.yaml"
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump(self.team.to_dict(), f, allow_unicode=True)
+        self.assertEqual(Team.load_from_file(str(path)).to_dict(), self.team.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QLabel
 from PyQt5.QtCore import Qt
 from src.widgets import HeartCounter
 
@@ -22,7 +22,7 @@ class TestHeartCounter(unittest.TestCase):
         """Prueba el estado inicial del contador."""
         self.assertEqual(self.counter.get_count(), 20)
         self.assertEqual(self.counter.max_hearts, 20)
-        self.assertEqual(len(self.counter.heart_labels), 20)
+        self.assertEqual(self.counter.heart_strip.total, 20)
         self.assertEqual(self.counter.number_label.text(), "20")
 
     def test_decrease_hearts(self):
@@ -66,13 +66,13 @@ class TestHeartCounter(unittest.TestCase):
         # Reducir máximo
         self.counter.set_max_hearts(10)
         self.assertEqual(self.counter.max_hearts, 10)
-        self.assertEqual(len(self.counter.heart_labels), 10)
+        self.assertEqual(self.counter.heart_strip.total, 10)
         self.assertEqual(self.counter.get_count(), 10)  # Se ajusta al nuevo máximo
         
         # Aumentar máximo
         self.counter.set_max_hearts(15)
         self.assertEqual(self.counter.max_hearts, 15)
-        self.assertEqual(len(self.counter.heart_labels), 15)
+        self.assertEqual(self.counter.heart_strip.total, 15)
         self.assertEqual(self.counter.get_count(), 10)  # Mantiene el valor actual
 
     def test_visual_update(self):
@@ -82,16 +82,43 @@ class TestHeartCounter(unittest.TestCase):
         # Verificar que los primeros 10 corazones están llenos
         for i in range(10):
             self.assertEqual(
-                self.counter.heart_labels[i].pixmap().cacheKey(),
+                self.counter.heart_strip.heart_pixmap_at(i).cacheKey(),
                 self.counter.heart_full.cacheKey()
             )
         
         # Verificar que los últimos 10 corazones están vacíos
         for i in range(10, 20):
             self.assertEqual(
-                self.counter.heart_labels[i].pixmap().cacheKey(),
+                self.counter.heart_strip.heart_pixmap_at(i).cacheKey(),
                 self.counter.heart_empty.cacheKey()
             )
 
+    def test_only_changed_hearts_repainted(self):
+        """Prueba que al cambiar el contador solo se invalidan las celdas afectadas."""
+        strip = self.counter.heart_strip
+        cell = strip.cell_size.width()
+        self.assertEqual(strip.width(), 20 * cell)
+        rect = strip.cells_rect(10, 12)
+        self.assertEqual((rect.x(), rect.width()), (10 * cell, 2 * cell))
+
+        # El pintado de la región sucia usa las celdas correctas
+        self.counter.set_count(11)
+        image = strip.grab().toImage()
+        full_x = 10 * cell + self.counter.heart_full.width() // 2
+        empty_x = 11 * cell + self.counter.heart_empty.width() // 2
+        y = strip.height() // 2
+        self.assertEqual(image.pixel(full_x, y), strip.grab(strip.cells_rect(0, 1)).toImage().pixel(full_x - 10 * cell, y))
+        self.assertNotEqual(image.pixel(full_x, y), image.pixel(empty_x, y))
+
+    def test_large_counter_uses_single_widget(self):
+        """Prueba que miles de corazones no crean un widget por corazón."""
+        labels = len(self.counter.findChildren(QLabel))
+        self.counter.set_max_hearts(50000)
+        self.counter.set_count(25000)
+        self.assertEqual(len(self.counter.findChildren(QLabel)), labels)
+        self.assertEqual(self.counter.heart_strip.count, 25000)
+        self.assertEqual(self.counter.heart_strip.heart_pixmap_at(24999).cacheKey(),
+                         self.counter.heart_full.cacheKey())
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file